@@ -0,0 +1,73 @@
+# core/background.py
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Uygulama süreci içinde belirli aralıklarla çalışan bakım işleri.
+# main.startup içinde start_jobs(), main.shutdown içinde stop_jobs() çağrılır.
+class PeriodicJob:
+    def __init__(self, name: str, interval_seconds: float, func):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.func = func
+        self._task = None
+        self.runs = 0
+        self.failures = 0
+        self.last_run_at = None
+        self.last_result = None
+
+    # interval_seconds <= 0 ise iş devre dışıdır (run_once ile elle çalıştırılabilir)
+    def start(self) -> None:
+        if self._task is None and self.interval_seconds > 0:
+            self._task = asyncio.create_task(self._loop(), name=self.name)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def run_once(self):
+        try:
+            self.last_result = await self.func()
+            return self.last_result
+        except Exception:
+            self.failures += 1
+            logger.exception("Background job %s failed", self.name)
+        finally:
+            self.runs += 1
+            self.last_run_at = time.time()
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.run_once()
+
+    def stats(self) -> dict:
+        return {
+            "interval_seconds": self.interval_seconds,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_run_at": self.last_run_at,
+            "last_result": self.last_result,
+        }
+
+jobs = {}
+
+def register_job(name: str, interval_seconds: float, func) -> PeriodicJob:
+    job = PeriodicJob(name, interval_seconds, func)
+    jobs[name] = job
+    return job
+
+def start_jobs() -> None:
+    for job in jobs.values():
+        job.start()
+
+async def stop_jobs() -> None:
+    for job in jobs.values():
+        await job.stop()
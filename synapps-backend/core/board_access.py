@@ -0,0 +1,139 @@
+# core/board_access.py
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+from fastapi import Depends, HTTPException
+from sqlalchemy import literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from config import settings
+from core.security import get_current_user
+from database import get_db
+from models.board_member import BoardMember, RoleType
+from models.column import Column
+from models.project_board import ProjectBoard
+from models.user import User
+
+# Board yetkilendirmesi. Kullanıcı başına erişebildiği board'lar ve rolü
+# ({board_id: "owner" | "member"}) süreç içi LRU önbellekte tutulur; önbellek dolu iken
+# yetki kontrolü veritabanına gitmez. Üyelik değiştiğinde ilgili kullanıcının kaydı
+# invalidate edilir (routers/board_member.py, routers/board.py, routers/user.py);
+# BOARD_ACCESS_CACHE_TTL_SECONDS diğer worker'lardaki değişiklikler için üst sınırdır.
+class BoardAccessCache:
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[int, tuple[Dict[int, str], float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, user_id: int) -> Optional[Dict[int, str]]:
+        entry = self._entries.get(user_id)
+        if entry is None or entry[1] <= time.monotonic():
+            self._entries.pop(user_id, None)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, user_id: int, roles: Dict[int, str]) -> None:
+        if self.max_size <= 0 or self.ttl <= 0:
+            return
+        self._entries[user_id] = (roles, time.monotonic() + self.ttl)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *user_ids: int) -> None:
+        for user_id in user_ids:
+            if self._entries.pop(user_id, None) is not None:
+                self.invalidations += 1
+
+    # Board silindiğinde: o board'u içeren tüm kayıtları düşür
+    def invalidate_board(self, board_id: int) -> None:
+        self.invalidate(*[user_id for user_id, (roles, _) in self._entries.items() if board_id in roles])
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+board_access_cache = BoardAccessCache(settings.BOARD_ACCESS_CACHE_SIZE, settings.BOARD_ACCESS_CACHE_TTL_SECONDS)
+
+# Kolonun board'u değişmediği için kolon -> board eşlemesi süresiz (LRU) tutulur
+_column_boards: "OrderedDict[int, int]" = OrderedDict()
+
+def forget_column(column_id: int) -> None:
+    _column_boards.pop(column_id, None)
+
+# Sahip olunan board'lar ve üyelikler tek sorguda
+async def load_board_roles(db: AsyncSession, user_id: int) -> Dict[int, str]:
+    result = await db.execute(union_all(
+        select(ProjectBoard.id, literal(RoleType.OWNER, BoardMember.role.type)).where(ProjectBoard.user_id == user_id),
+        select(BoardMember.board_id, BoardMember.role).where(BoardMember.user_id == user_id),
+    ))
+    roles = {}
+    for board_id, role in result.all():
+        if roles.get(board_id) != RoleType.OWNER.value:
+            roles[board_id] = role.value
+    return roles
+
+async def get_board_roles(db: AsyncSession, user_id: int) -> Dict[int, str]:
+    roles = board_access_cache.get(user_id)
+    if roles is None:
+        roles = await load_board_roles(db, user_id)
+        board_access_cache.set(user_id, roles)
+    return roles
+
+# Kullanıcı board'a erişemiyorsa 403; owner=True ise yalnızca sahibi geçer. Rolü döner.
+async def require_board_access(db: AsyncSession, user: User, board_id: int, owner: bool = False) -> str:
+    role = (await get_board_roles(db, user.id)).get(board_id)
+    if role is None or (owner and role != RoleType.OWNER.value):
+        raise HTTPException(status_code=403, detail="Bu board için yetkiniz yok")
+    return role
+
+async def board_id_for_column(db: AsyncSession, column_id: int) -> Optional[int]:
+    board_id = _column_boards.get(column_id)
+    if board_id is None:
+        result = await db.execute(select(Column.board_id).where(Column.id == column_id))
+        board_id = result.scalar_one_or_none()
+        if board_id is None:
+            return None
+        _column_boards[column_id] = board_id
+        while len(_column_boards) > settings.BOARD_ACCESS_CACHE_SIZE:
+            _column_boards.popitem(last=False)
+    else:
+        _column_boards.move_to_end(column_id)
+    return board_id
+
+# Kolonun board'una erişim kontrolü; kolon yoksa 404. Board id'yi döner.
+async def require_column_access(db: AsyncSession, user: User, column_id: int) -> int:
+    board_id = await board_id_for_column(db, column_id)
+    if board_id is None:
+        raise HTTPException(status_code=404, detail="Column not found")
+    await require_board_access(db, user, board_id)
+    return board_id
+
+# /boards/{board_id}/... uçları için bağımlılıklar; kimliği doğrulanmış kullanıcıyı döner
+async def board_member_required(
+    board_id: int, current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+) -> User:
+    await require_board_access(db, current_user, board_id)
+    return current_user
+
+async def board_owner_required(
+    board_id: int, current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+) -> User:
+    await require_board_access(db, current_user, board_id, owner=True)
+    return current_user
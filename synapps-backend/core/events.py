@@ -0,0 +1,99 @@
+# core/events.py
+import asyncio
+import json
+from typing import AsyncIterator, Dict, Hashable, Iterable, Optional, Set
+from fastapi import Request
+from config import settings
+
+# Bir kanala (örn. board id) bağlı tek bir dinleyici. Kuyruk sınırlıdır; dolarsa
+# dinleyici yavaş kabul edilip düşürülür ve bağlantısı kapatılır (istemci yeniden bağlanır).
+class Subscription:
+    def __init__(self, channel: Hashable, queue_size: int):
+        self.channel = channel
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = False
+
+# Süreç içi yayın: publish() hiçbir zaman beklemez, her dinleyicinin kuyruğuna
+# put_nowait ile yazar. Birden fazla worker çalışıyorsa her worker yalnızca kendi
+# isteklerinde üretilen olayları kendi dinleyicilerine dağıtır.
+class EventBroker:
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._channels: Dict[Hashable, Set[Subscription]] = {}
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    def subscribe(self, channel: Hashable) -> Subscription:
+        subscription = Subscription(channel, self.queue_size)
+        self._channels.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._channels.get(subscription.channel)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._channels[subscription.channel]
+
+    def has_subscribers(self, channel: Hashable) -> bool:
+        return channel in self._channels
+
+    def publish(self, channel: Hashable, event) -> int:
+        self.published += 1
+        delivered = 0
+        for subscription in list(self._channels.get(channel, ())):
+            try:
+                subscription.queue.put_nowait(event)
+                delivered += 1
+            except asyncio.QueueFull:
+                subscription.dropped = True
+                self.dropped += 1
+                self.unsubscribe(subscription)
+        self.delivered += delivered
+        return delivered
+
+    def stats(self) -> dict:
+        return {
+            "channels": len(self._channels),
+            "subscribers": sum(len(subscribers) for subscribers in self._channels.values()),
+            "queue_size": self.queue_size,
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped_subscribers": self.dropped,
+        }
+
+def format_sse(event_type: str, data, event_id: Optional[int] = None) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event_type}")
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+# Bir kanalı Server-Sent Events olarak akıtır. Olaylar {"type", "id"(opsiyonel), ...} dict'leridir.
+# `initial` bağlantı açılır açılmaz gönderilecek hazır SSE parçalarıdır.
+# Boşta kalan bağlantılara belirli aralıklarla yorum satırı (": ping") yazılır.
+async def sse_stream(
+    request: Request, broker: EventBroker, channel: Hashable, initial: Iterable[str] = ()
+) -> AsyncIterator[str]:
+    subscription = broker.subscribe(channel)
+    try:
+        for chunk in initial:
+            yield chunk
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    subscription.queue.get(), timeout=settings.EVENT_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": ping\n\n"
+                continue
+            yield format_sse(event["type"], event, event.get("id"))
+            if subscription.dropped:
+                # Kuyruk taşmıştı; kalan olaylar eksik olabilir, istemci yeniden bağlanıp tazelesin
+                break
+    finally:
+        broker.unsubscribe(subscription)
@@ -0,0 +1,22 @@
+# core/fast_json.py
+from typing import List
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from config import settings
+
+# Büyük liste yanıtları için hızlı yol. Uç, satırları ORM nesnesi yerine response_model'in
+# alanlarıyla doğrudan dict olarak okur; bu dict'ler veritabanından geldiği için Pydantic ile
+# yeniden doğrulanmaz, orjson ile yazılır. İsteğe bağlıdır: FAST_JSON_RESPONSES=true değilse
+# aynı dict'ler response_model doğrulamasından ve standart JSON kodlayıcısından geçer.
+
+# Şemadaki alanlara karşılık gelen tablo kolonları (şemada olup tabloda olmayanlar atlanır)
+def response_columns(model: type[BaseModel], table) -> List:
+    return [table.c[name] for name in model.model_fields if name in table.c]
+
+# Uç, dönüşte hazırladığı başlıkları (ETag, X-Next-Cursor) `response` üzerine yazmış olabilir;
+# doğrudan Response dönülünce FastAPI bunları eklemediği için kopyalanır
+def fast_json(content, response: Response):
+    if not settings.FAST_JSON_RESPONSES:
+        return content
+    return ORJSONResponse(content, headers=dict(response.headers))
@@ -0,0 +1,75 @@
+# core/lexorank.py
+from typing import List, Optional
+
+# Sıralama anahtarları: base-62 basamaklardan oluşan, "0.<anahtar>" kesri gibi karşılaştırılan
+# stringler. İki komşunun arasına her zaman yeni bir anahtar üretilebilir; bu yüzden bir
+# görevi/kolonu taşımak yalnızca o satırın anahtarını yazmak demektir.
+# Anahtarlar hiçbir zaman '0' ile bitmez (aksi halde "V" ile "V0" arasına anahtar sığmazdı).
+# Veritabanında bayt sırasıyla karşılaştırılmaları için kolon COLLATE "C" olmalıdır.
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+_INDEX = {digit: i for i, digit in enumerate(DIGITS)}
+
+def _midpoint(a: str, b: Optional[str]) -> str:
+    # a < b olmak üzere aralarında bir anahtar; a == "" alt sınır, b is None üst sınır
+    if b is not None:
+        n = 0
+        while n < len(b) and (a[n] if n < len(a) else "0") == b[n]:
+            n += 1
+        if n > 0:
+            return b[:n] + _midpoint(a[n:], b[n:])
+    digit_a = _INDEX[a[0]] if a else 0
+    digit_b = _INDEX[b[0]] if b is not None else BASE
+    if digit_b - digit_a > 1:
+        return DIGITS[(digit_a + digit_b + 1) // 2]
+    if b is not None and len(b) > 1:
+        return b[:1]
+    return DIGITS[digit_a] + _midpoint(a[1:], None)
+
+def _step(key: str, delta: int) -> Optional[str]:
+    # Anahtarı aynı uzunlukta bir base-62 sayı gibi delta kadar kaydır; '0' ile bitmesin diye
+    # gerekirse bir adım daha atar. Uzunluğa sığmıyorsa None döner.
+    value = 0
+    for c in key:
+        value = value * BASE + _INDEX[c]
+    value += delta
+    if value % BASE == 0:
+        value += 1 if delta > 0 else -1
+    if value <= 0 or value >= BASE ** len(key):
+        return None
+    digits = []
+    for _ in range(len(key)):
+        value, digit = divmod(value, BASE)
+        digits.append(DIGITS[digit])
+    return "".join(reversed(digits))
+
+def rank_between(before: Optional[str], after: Optional[str]) -> str:
+    """`before` ile `after` arasında sıralanan yeni bir anahtar (None: liste başı/sonu)."""
+    if before is not None and after is not None and before >= after:
+        # Eşit anahtarlar (eski veri veya eşzamanlı yazma): araya girilemez, before'un hemen arkasına yerleş
+        after = None
+    # Uç taşarsa ("zz" sonrası, "01" öncesi) anahtar boyu iki katına çıkar: art arda eklemelerde
+    # uzunluk ekleme sayısıyla doğrusal değil logaritmik büyür
+    if after is None and before is not None:
+        # Sona ekleme: uzunluğu büyütmeden bir artır
+        return _step(before, 1) or before + "0" * (len(before) - 1) + DIGITS[1]
+    if before is None and after is not None:
+        # Başa ekleme: mümkünse uzunluğu büyütmeden bir azalt
+        return _step(after, -1) or DIGITS[0] * len(after) + DIGITS[-1] * len(after)
+    return _midpoint(before or "", after)
+
+def even_ranks(count: int) -> List[str]:
+    """`count` eleman için eşit aralıklı, kısa anahtarlar (ilk yükleme ve yeniden dengeleme)."""
+    width = 1
+    while BASE ** width <= count * 4:
+        width += 1
+    step = BASE ** width // (count + 1)
+    ranks = []
+    for i in range(1, count + 1):
+        value = step * i
+        digits = []
+        for _ in range(width):
+            value, digit = divmod(value, BASE)
+            digits.append(DIGITS[digit])
+        ranks.append("".join(reversed(digits)).rstrip("0"))
+    return ranks
@@ -0,0 +1,27 @@
+# core/metrics.py
+from bisect import bisect_left
+
+# Basit, süreç içi histogram; /internal uçlarında gösterilmek üzere sabit kovalarla sayar
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = sorted(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def snapshot(self) -> dict:
+        labels = [f"le_{bound:g}" for bound in self.buckets] + ["le_inf"]
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "max": self.max,
+            "buckets": dict(zip(labels, self.counts)),
+        }
@@ -0,0 +1,59 @@
+# core/pagination.py
+import base64
+import binascii
+import json
+from typing import Optional
+from fastapi import HTTPException, Query, Response
+from config import settings
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Keyset (cursor) sayfalama: OFFSET yerine "son görülen id'den sonrası" sorgulanır,
+# böylece indeksli kolon üzerinde her sayfa aynı maliyette kalır.
+# id dışında sıralama anahtarı olan uçlar (örn. arama skoru) cursor'ın tamamını `after`'dan okur.
+class Page:
+    def __init__(self, limit: int, after_id: Optional[int], after: Optional[dict] = None):
+        self.limit = limit
+        self.after_id = after_id
+        self.after = after
+
+def encode_cursor(last_id: int, **extra) -> str:
+    raw = json.dumps({"id": last_id, **extra}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor_values(cursor: str) -> dict:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+        values["id"] = int(values["id"])
+        return values
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def decode_cursor(cursor: str) -> int:
+    return decode_cursor_values(cursor)["id"]
+
+# Liste uçları için dependency; limit sunucu tarafında MAX_PAGE_SIZE ile sınırlanır
+def page_params(
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1),
+    cursor: Optional[str] = Query(None),
+) -> Page:
+    after = decode_cursor_values(cursor) if cursor else None
+    return Page(min(limit, settings.MAX_PAGE_SIZE), after["id"] if after else None, after)
+
+# Sorguya cursor filtresini, sıralamayı ve limit+1'i uygula (fazladan satır "devamı var" demek)
+def paginate(query, id_column, page: Page, descending: bool = False):
+    if page.after_id is not None:
+        query = query.where(id_column < page.after_id if descending else id_column > page.after_id)
+    order = id_column.desc() if descending else id_column.asc()
+    return query.order_by(order).limit(page.limit + 1)
+
+# Fazla satırı at, devamı varsa bir sonraki sayfanın cursor'ını başlığa yaz.
+# cursor_extra: son satırdan cursor'a eklenecek diğer sıralama anahtarları
+def finish_page(rows, page: Page, response: Response, cursor_extra=None):
+    rows = list(rows)
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        extra = cursor_extra(rows[-1]) if cursor_extra else {}
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].id, **extra)
+    return rows
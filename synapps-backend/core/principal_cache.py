@@ -0,0 +1,98 @@
+# core/principal_cache.py
+import time
+from collections import OrderedDict
+from typing import Optional
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from config import settings
+from models.user import User
+
+# Veritabanındaki trigger'ların güncellediği kolonlar önbelleğe alınmaz; merge sonrası
+# bu alanlar yüklenmemiş kalır, eski değer sessizce okunamaz (gerekirse sorgulanmalı)
+UNCACHED_COLUMNS = ("unread_notification_count",)
+
+# get_current_user için süreç içi LRU önbellek.
+# Kayıtlar e-posta (token `sub`) ile tutulur; ömürleri tokenın `exp` değerini ve
+# PRINCIPAL_CACHE_TTL_SECONDS üst sınırını geçemez. ORM nesnesinin kendisi değil
+# kolon değerlerinin kopyası saklanır; istekteki değişiklikler/rollback önbelleği bozmaz.
+class PrincipalCache:
+
+    def __init__(self, max_size: int, max_ttl: float):
+        self.max_size = max_size
+        self.max_ttl = max_ttl
+        self._entries: "OrderedDict[str, tuple[dict, float]]" = OrderedDict()
+        self._emails_by_id: dict = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, email: str) -> Optional[dict]:
+        entry = self._entries.get(email)
+        if entry is None:
+            self.misses += 1
+            return None
+        values, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._remove(email)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(email)
+        self.hits += 1
+        return values
+
+    def set(self, email: str, user: User, token_exp: Optional[float] = None) -> None:
+        ttl = self.max_ttl
+        if token_exp is not None:
+            ttl = min(ttl, token_exp - time.time())
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        values = {
+            attr.key: getattr(user, attr.key)
+            for attr in inspect(User).column_attrs if attr.key not in UNCACHED_COLUMNS
+        }
+        self._entries[email] = (values, time.monotonic() + ttl)
+        self._entries.move_to_end(email)
+        self._emails_by_id[values["id"]] = email
+        while len(self._entries) > self.max_size:
+            _, (oldest_values, _) = self._entries.popitem(last=False)
+            self._emails_by_id.pop(oldest_values["id"], None)
+            self.evictions += 1
+
+    def invalidate(self, user_id: Optional[int] = None, email: Optional[str] = None) -> None:
+        # Kullanıcı silindiğinde/güncellendiğinde çağrılmalı
+        if email is None and user_id is not None:
+            email = self._emails_by_id.get(user_id)
+        if email is not None and email in self._entries:
+            self._remove(email)
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._emails_by_id.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _remove(self, email: str) -> None:
+        entry = self._entries.pop(email, None)
+        if entry is not None:
+            self._emails_by_id.pop(entry[0]["id"], None)
+
+principal_cache = PrincipalCache(settings.PRINCIPAL_CACHE_SIZE, settings.PRINCIPAL_CACHE_TTL_SECONDS)
+
+# Önbellekteki değerlerden, sorgu atmadan oturuma bağlı bir User üret
+async def attach_cached_user(values: dict, db: AsyncSession) -> User:
+    user = User(**values)
+    make_transient_to_detached(user)
+    return await db.merge(user, load=False)
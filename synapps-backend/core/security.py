@@ -7,6 +7,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_db
 from sqlalchemy.future import select
 from models.user import User
+from core.principal_cache import principal_cache, attach_cached_user
+from core.password_pool import password_pool
 
 # Şifre hashleme algoritması
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -27,6 +29,13 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
+# Async handler'lar için: bcrypt işini password_pool'da çalıştır
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_pool.run(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_pool.run(get_password_hash, password)
+
 # JWT token oluşturma
 def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
     to_encode = data.copy()
@@ -48,9 +57,15 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession
             raise credentials_exception
     except JWTError:
         raise credentials_exception
-    
+
+    # Önce süreç içi önbelleğe bak, yoksa veritabanından yükle
+    cached = principal_cache.get(email)
+    if cached is not None:
+        return await attach_cached_user(cached, db)
+
     result = await db.execute(select(User).where(User.email == email))
     user = result.scalars().first()
     if user is None:
         raise credentials_exception
+    principal_cache.set(email, user, payload.get("exp"))
     return user
@@ -1,10 +1,143 @@
+import time
+from fastapi import Request
+from sqlalchemy import Select, event, exc
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.selectable import CTE
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from config import settings
+from core.metrics import Histogram
 
-engine = create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG)
+# Havuzdan bağlantı alırken beklenen süre (ms)
+pool_wait_ms = Histogram([1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000])
+pool_timeouts = 0
+
+# Bağlantı alma süresini ve zaman aşımlarını ölçen havuz
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    def _do_get(self):
+        global pool_timeouts
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            pool_timeouts += 1
+            raise
+        finally:
+            pool_wait_ms.observe((time.perf_counter() - started) * 1000)
+
+def _engine_options(url: str) -> dict:
+    options = {
+        "echo": settings.DEBUG,
+        "poolclass": InstrumentedPool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    if "+asyncpg" in url:
+        options["connect_args"] = {"statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    return options
+
+engine = create_async_engine(settings.DATABASE_URL, **_engine_options(settings.DATABASE_URL))
 async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
-async def get_db():
+# Opsiyonel salt-okunur replika
+read_engine = None
+async_read_session = None
+if settings.READ_DATABASE_URL:
+    read_engine = create_async_engine(settings.READ_DATABASE_URL, **_engine_options(settings.READ_DATABASE_URL))
+    async_read_session = sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+
+# Yazma yapan istemci -> primary'e sabit kalacağı zaman (monotonic)
+_primary_pins = {}
+
+def _client_key(request: Request) -> str:
+    # Aynı token ile gelen istekler aynı istemci sayılır
+    auth = request.headers.get("authorization")
+    if auth:
+        return auth
+    return request.client.host if request.client else ""
+
+def pin_to_primary(key: str) -> None:
+    now = time.monotonic()
+    if len(_primary_pins) > 10000:
+        for expired in [k for k, until in _primary_pins.items() if until <= now]:
+            del _primary_pins[expired]
+    _primary_pins[key] = now + settings.READ_YOUR_WRITES_SECONDS
+
+def is_pinned_to_primary(key: str) -> bool:
+    until = _primary_pins.get(key)
+    if until is None:
+        return False
+    if until <= time.monotonic():
+        _primary_pins.pop(key, None)
+        return False
+    return True
+
+# Yazma yapan oturumları işaretle; commit sonrası istemciyi primary'e sabitle.
+# ORM değişiklikleri flush ile, Core UPDATE/DELETE/INSERT (ve veri değiştiren CTE'li
+# SELECT'ler) do_orm_execute ile yakalanır. Oturumdan geçmeyen yazmalar (ham bağlantıyla
+# COPY) mark_session_write'ı kendisi çağırmalı.
+def mark_session_write(session) -> None:
+    session.info["has_writes"] = True
+
+def _writes_data(statement) -> bool:
+    if not isinstance(statement, Select):
+        return True
+    ctes = list(statement._independent_ctes)
+    ctes.extend(from_ for from_ in statement.get_final_froms() if isinstance(from_, CTE))
+    return any(isinstance(cte.element, UpdateBase) for cte in ctes)
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush_write(session, flush_context):
+    mark_session_write(session)
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_write(orm_execute_state):
+    if not orm_execute_state.is_select or _writes_data(orm_execute_state.statement):
+        mark_session_write(orm_execute_state.session)
+
+@event.listens_for(Session, "after_commit")
+def _pin_writer(session):
+    if read_engine is not None and session.info.pop("has_writes", False):
+        key = session.info.get("client_key")
+        if key is not None:
+            pin_to_primary(key)
+
+async def get_db(request: Request):
     async with async_session() as session:
-        yield session
\ No newline at end of file
+        session.info["client_key"] = _client_key(request)
+        yield session
+
+# Salt-okunur uçlar için: replika varsa ve istemci yakın zamanda yazmadıysa replikadan oku
+def read_session_maker(request: Request):
+    if read_engine is None or is_pinned_to_primary(_client_key(request)):
+        return async_session
+    return async_read_session
+
+async def get_read_db(request: Request):
+    async with read_session_maker(request)() as session:
+        yield session
+
+def _describe_pool(pool) -> dict:
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+# /internal/pool için havuz durumu (bekleme histogramı primary ve replika için ortaktır)
+def pool_stats() -> dict:
+    stats = _describe_pool(engine.pool)
+    stats.update({
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "timeout_seconds": settings.DB_POOL_TIMEOUT,
+        "timeouts": pool_timeouts,
+        "wait_ms": pool_wait_ms.snapshot(),
+    })
+    if read_engine is not None:
+        stats["replica"] = _describe_pool(read_engine.pool)
+    return stats
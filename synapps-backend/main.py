@@ -1,8 +1,14 @@
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from database import engine
-from routers import task_router, board_router, column_router, board_member_router, notification_router, auth_router, user_router
-from models import Base
+from routers import task_router, board_router, column_router, board_member_router, notification_router, auth_router, user_router, internal_router
+from config import settings
+from core.password_pool import password_pool
+from core.background import start_jobs, stop_jobs
+# Arka plan işleri modül yüklenirken core.background'a kaydolur
+import services.rank_rebalance  # noqa: F401
+import services.notification_retention  # noqa: F401
+import services.flow_metrics  # noqa: F401
+from services.outbox import outbox_worker
 
 app = FastAPI()
 
@@ -13,6 +19,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
 router = APIRouter(prefix="", tags=["root"])
@@ -24,11 +31,20 @@ app.include_router(column_router)
 app.include_router(board_member_router)
 app.include_router(notification_router)
 app.include_router(user_router)
+if settings.INTERNAL_ENDPOINTS_ENABLED:
+    app.include_router(internal_router)
 
+# Şema değişiklikleri artık açılışta değil, migrations/ altındaki Alembic revizyonlarıyla yapılır
 @app.on_event("startup")
 async def startup():
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    start_jobs()
+    outbox_worker.start()
+
+@app.on_event("shutdown")
+async def shutdown():
+    await stop_jobs()
+    await outbox_worker.stop()
+    password_pool.shutdown()
         
 @app.get("/", response_model=str)
 async def read_root():
@@ -0,0 +1,108 @@
+"""initial schema
+
+Eskiden main.startup içinde create_all ile oluşturulan tablolar. Mevcut bir
+veritabanında bu revizyon çalıştırılmaz, `alembic stamp 0001` ile işaretlenir.
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-05-01 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False, unique=True),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now()),
+    )
+    op.create_table(
+        "project_boards",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("description", sa.String(), nullable=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+    )
+    op.create_table(
+        "sessions",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("session_token", sa.String(), nullable=False, unique=True),
+        sa.Column("ip_address", sa.String(45)),
+        sa.Column("user_agent", sa.Text()),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+        sa.Column("expires_at", sa.DateTime()),
+    )
+    op.create_table(
+        "notifications",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("notification_type", sa.String(), nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("is_read", sa.Boolean()),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now()),
+        sa.Column("related_item_id", sa.Integer()),
+        sa.Column("related_item_type", sa.String()),
+        sa.Column("data", sa.JSON(), nullable=True),
+    )
+    op.create_table(
+        "board_members",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("board_id", sa.Integer(), sa.ForeignKey("project_boards.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("role", sa.Enum("OWNER", "MEMBER", name="roletype"), nullable=False),
+        sa.Column("added_at", sa.DateTime(), server_default=sa.func.now()),
+        sa.UniqueConstraint("board_id", "user_id", name="unique_board_user"),
+    )
+    op.create_table(
+        "columns",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("board_id", sa.Integer(), sa.ForeignKey("project_boards.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+    )
+    op.create_table(
+        "tasks",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("column_id", sa.Integer(), sa.ForeignKey("columns.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("assigned_user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=True),
+        sa.Column(
+            "status",
+            sa.Enum("todo", "in_progress", "done", "review", "cancelled", name="task_status"),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("priority", sa.String(), nullable=False),
+        sa.Column("start_date", sa.DateTime(), nullable=True),
+        sa.Column("end_date", sa.DateTime(), nullable=True),
+        sa.Column("dependency_id", sa.Integer(), sa.ForeignKey("tasks.id", ondelete="SET NULL"), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("tasks")
+    op.drop_table("columns")
+    op.drop_table("board_members")
+    op.drop_table("notifications")
+    op.drop_table("sessions")
+    op.drop_table("project_boards")
+    op.drop_table("users")
+    sa.Enum(name="task_status").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name="roletype").drop(op.get_bind(), checkfirst=True)
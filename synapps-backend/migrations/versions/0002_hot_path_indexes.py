@@ -0,0 +1,46 @@
+"""hot path indexes
+
+Router sorgularının filtre/sıralama kolonlarına göre indeksler:
+- tasks(column_id, position): GET /columns selectinload + sıralama, GET /tasks?column_id=
+- tasks(assigned_user_id), tasks(status): GET /tasks?assigned_user_id=, GET /tasks/by-status/
+- tasks(dependency_id): görev silinirken ON DELETE SET NULL taraması
+- notifications(user_id, is_read): GET /notifications?user_id=&is_read=
+- board_members(user_id): GET /boards?user_id= alt sorgusu
+- project_boards(user_id): GET /boards?user_id=, kullanıcı silme
+- columns(board_id, position): GET /columns?board_id=
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-05-01 00:00:00
+"""
+from alembic import op
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_tasks_column_id_position", "tasks", ["column_id", "position"]),
+    ("ix_tasks_assigned_user_id", "tasks", ["assigned_user_id"]),
+    ("ix_tasks_status", "tasks", ["status"]),
+    ("ix_tasks_dependency_id", "tasks", ["dependency_id"]),
+    ("ix_notifications_user_id_is_read", "notifications", ["user_id", "is_read"]),
+    ("ix_board_members_user_id", "board_members", ["user_id"]),
+    ("ix_project_boards_user_id", "project_boards", ["user_id"]),
+    ("ix_columns_board_id_position", "columns", ["board_id", "position"]),
+]
+
+
+# Büyük tablolarda yazmaları kilitlememek için CONCURRENTLY (transaction dışında) oluşturulur
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,25 @@
+"""board version counter
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-05-01 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "project_boards",
+        sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("project_boards", "version")
@@ -0,0 +1,47 @@
+"""keyset pagination indexes
+
+Sayfalı liste uçları `WHERE <filtre> AND id > :cursor ORDER BY id LIMIT n` şeklinde
+sorgular; filtre kolonunun arkasına id eklenen indeksler bu sorguyu sıralama
+yapmadan, tablonun boyutundan bağımsız olarak karşılar.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-05-01 00:00:00
+"""
+from alembic import op
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+NEW_INDEXES = [
+    ("ix_tasks_status_id", "tasks", ["status", "id"]),
+    ("ix_tasks_assigned_user_id_id", "tasks", ["assigned_user_id", "id"]),
+    ("ix_notifications_user_id_id", "notifications", ["user_id", "id"]),
+    ("ix_notifications_user_id_is_read_id", "notifications", ["user_id", "is_read", "id"]),
+    ("ix_board_members_board_id_id", "board_members", ["board_id", "id"]),
+]
+
+REPLACED_INDEXES = [
+    ("ix_tasks_status", "tasks", ["status"]),
+    ("ix_tasks_assigned_user_id", "tasks", ["assigned_user_id"]),
+    ("ix_notifications_user_id_is_read", "notifications", ["user_id", "is_read"]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in NEW_INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+        for name, table, _ in REPLACED_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in REPLACED_INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+        for name, table, _ in reversed(NEW_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
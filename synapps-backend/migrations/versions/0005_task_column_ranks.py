@@ -0,0 +1,89 @@
+"""task and column ranks
+
+Görev ve kolon sırası tam sayı `position` yerine kesirli sıralama anahtarı `rank` ile
+tutulur (core/lexorank.py); bir taşıma yalnızca taşınan satırı yazar. Mevcut satırlara
+eski (position, id) sırasına göre, kolon/board içinde eşit aralıklı 5 haneli anahtarlar
+verilir. `position` kolonu bilgi amaçlı kalır.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-05-01 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+# 62^5; anahtarlar 5 haneli base-62 sayılar olarak bu aralığa eşit aralıkla dağıtılır
+KEY_SPACE = 62 ** 5
+
+NEW_INDEXES = [
+    ("ix_tasks_column_id_rank", "tasks", ["column_id", "rank"]),
+    ("ix_columns_board_id_rank", "columns", ["board_id", "rank"]),
+]
+
+REPLACED_INDEXES = [
+    ("ix_tasks_column_id_position", "tasks", ["column_id", "position"]),
+    ("ix_columns_board_id_position", "columns", ["board_id", "position"]),
+]
+
+
+def _backfill(table: str, scope: str) -> None:
+    digits = " || ".join(
+        f"substr('{DIGITS}', (v / {62 ** power} % 62)::int + 1, 1)" for power in range(4, -1, -1)
+    )
+    op.execute(
+        f"""
+        WITH ordered AS (
+            SELECT id,
+                   row_number() OVER (PARTITION BY {scope} ORDER BY position, id) AS rn,
+                   count(*) OVER (PARTITION BY {scope}) AS cnt
+            FROM {table}
+        ), spaced AS (
+            SELECT id, rn * ({KEY_SPACE} / (cnt + 1)) AS raw FROM ordered
+        ), keys AS (
+            -- anahtar '0' ile bitmemeli
+            SELECT id, raw + CASE WHEN raw % 62 = 0 THEN 1 ELSE 0 END AS v FROM spaced
+        )
+        UPDATE {table} SET rank = {digits}
+        FROM keys WHERE {table}.id = keys.id
+        """
+    )
+
+
+def upgrade() -> None:
+    for table, scope in (("tasks", "column_id"), ("columns", "board_id")):
+        op.add_column(table, sa.Column("rank", sa.String(collation="C"), nullable=True))
+        _backfill(table, scope)
+        op.alter_column(table, "rank", nullable=False)
+
+    with op.get_context().autocommit_block():
+        for name, table, columns in NEW_INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+        for name, table, _ in REPLACED_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in REPLACED_INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+        for name, table, _ in reversed(NEW_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    # Dönüşte mevcut rank sırası position'a yazılır
+    for table, scope in (("tasks", "column_id"), ("columns", "board_id")):
+        op.execute(
+            f"""
+            UPDATE {table} SET position = ordered.rn - 1
+            FROM (
+                SELECT id, row_number() OVER (PARTITION BY {scope} ORDER BY rank, id) AS rn FROM {table}
+            ) AS ordered
+            WHERE {table}.id = ordered.id
+            """
+        )
+        op.drop_column(table, "rank")
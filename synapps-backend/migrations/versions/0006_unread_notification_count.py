@@ -0,0 +1,90 @@
+"""unread notification counter
+
+users.unread_notification_count, notifications tablosundaki statement-level trigger'larla
+artımlı tutulur: her INSERT/UPDATE/DELETE ifadesi etkilediği satırları (transition table)
+kullanıcı başına toplayıp sayacı tek UPDATE ile düzeltir. Toplu işlemler ve kaskad
+silmeler de sayacı bozmaz.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-05-01 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+FUNCTION = """
+CREATE OR REPLACE FUNCTION notifications_unread_count() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE users SET unread_notification_count = users.unread_notification_count + delta.n
+        FROM (
+            SELECT user_id, count(*) AS n FROM new_rows WHERE is_read = false GROUP BY user_id
+        ) AS delta
+        WHERE users.id = delta.user_id;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE users SET unread_notification_count = users.unread_notification_count - delta.n
+        FROM (
+            SELECT user_id, count(*) AS n FROM old_rows WHERE is_read = false GROUP BY user_id
+        ) AS delta
+        WHERE users.id = delta.user_id;
+    ELSE
+        UPDATE users SET unread_notification_count = users.unread_notification_count + delta.n
+        FROM (
+            SELECT user_id, sum(change) AS n FROM (
+                SELECT user_id, 1 AS change FROM new_rows WHERE is_read = false
+                UNION ALL
+                SELECT user_id, -1 AS change FROM old_rows WHERE is_read = false
+            ) AS changes
+            GROUP BY user_id
+            HAVING sum(change) <> 0
+        ) AS delta
+        WHERE users.id = delta.user_id;
+    END IF;
+    RETURN NULL;
+END
+$$;
+"""
+
+TRIGGERS = [
+    ("notifications_unread_count_insert", "INSERT", "NEW TABLE AS new_rows"),
+    ("notifications_unread_count_update", "UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    ("notifications_unread_count_delete", "DELETE", "OLD TABLE AS old_rows"),
+]
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("unread_notification_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(FUNCTION)
+    # Trigger'lar oluşturulurken tabloya yazılmasın; sayaç aynı kilit altında doldurulur
+    op.execute("LOCK TABLE notifications IN SHARE ROW EXCLUSIVE MODE")
+    for name, event, referencing in TRIGGERS:
+        op.execute(
+            f"CREATE TRIGGER {name} AFTER {event} ON notifications "
+            f"REFERENCING {referencing} FOR EACH STATEMENT EXECUTE FUNCTION notifications_unread_count()"
+        )
+    op.execute(
+        """
+        UPDATE users SET unread_notification_count = counts.n
+        FROM (
+            SELECT user_id, count(*) AS n FROM notifications WHERE is_read = false GROUP BY user_id
+        ) AS counts
+        WHERE users.id = counts.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    for name, _, _ in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON notifications")
+    op.execute("DROP FUNCTION IF EXISTS notifications_unread_count()")
+    op.drop_column("users", "unread_notification_count")
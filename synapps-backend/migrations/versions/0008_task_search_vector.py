@@ -0,0 +1,45 @@
+"""task full-text search vector
+
+`tasks.search_vector` başlık (A) ve açıklama (B) üzerinden veritabanının hesapladığı
+STORED bir tsvector kolonudur; GIN indeksi `search_vector @@ tsquery` aramasını
+tablo boyutundan bağımsız tutar. Generated kolon eklemek tabloyu bir kez yeniden
+yazar, indeks ise yazmaları kilitlemeden (CONCURRENTLY) kurulur.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2025-05-01 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tasks",
+        sa.Column("search_vector", TSVECTOR(), sa.Computed(SEARCH_VECTOR_SQL, persisted=True)),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_search_vector", "tasks", ["search_vector"],
+            postgresql_using="gin", postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_search_vector", table_name="tasks", postgresql_concurrently=True, if_exists=True
+        )
+    op.drop_column("tasks", "search_vector")
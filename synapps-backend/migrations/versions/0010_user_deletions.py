@@ -0,0 +1,35 @@
+"""user deletion jobs
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2025-05-01 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_deletions",
+        sa.Column("id", sa.String(32), primary_key=True),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False, server_default="pending"),
+        sa.Column("tasks_deleted", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("notifications_deleted", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("boards_deleted", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_user_deletions_user_id", "user_deletions", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_deletions_user_id", table_name="user_deletions")
+    op.drop_table("user_deletions")
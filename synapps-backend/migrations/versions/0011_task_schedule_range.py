@@ -0,0 +1,39 @@
+"""task schedule range
+
+`tasks.schedule`, start_date..end_date aralığını tutan STORED bir tsrange kolonudur.
+GiST indeksi "bu pencereyle çakışan görevler" (`schedule && tsrange(:from, :to)`)
+sorgusunu tarihsiz ve pencere dışındaki görevleri okumadan karşılar.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2025-05-01 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSRANGE
+
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+SCHEDULE_SQL = (
+    "CASE WHEN start_date IS NULL AND end_date IS NULL THEN NULL "
+    "ELSE tsrange(least(start_date, end_date), greatest(start_date, end_date), '[]') END"
+)
+
+
+def upgrade() -> None:
+    op.add_column("tasks", sa.Column("schedule", TSRANGE(), sa.Computed(SCHEDULE_SQL, persisted=True)))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_schedule", "tasks", ["schedule"],
+            postgresql_using="gist", postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_tasks_schedule", table_name="tasks", postgresql_concurrently=True, if_exists=True)
+    op.drop_column("tasks", "schedule")
@@ -0,0 +1,139 @@
+"""task transitions and flow rollups
+
+task_transitions, görevlerin durum/kolon/board değişikliklerinin append-only kaydıdır.
+tasks üzerindeki statement-level trigger'lar (transition table) her INSERT/UPDATE/DELETE
+ifadesinin değişen satırlarını tek INSERT ile yazar; böylece update_task, toplu taşıma,
+import, klonlama ve kaskad silmeler aynı şekilde kaydedilir. Silinen görevin board'u, kolonu
+o anda silinmiş olabileceği için görevin son geçişinden alınır.
+
+board_flow_daily ve board_throughput_daily günlük özetlerdir; services/flow_metrics.py'deki
+arka plan işi flow_rollup_state'teki son id'den sonraki geçişleri bunlara ekler. Mevcut
+görevler oluşturulma anlarıyla tek geçiş olarak geriye dönük yazılır.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2025-05-01 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+FUNCTION = """
+CREATE OR REPLACE FUNCTION tasks_record_transitions() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO task_transitions (task_id, to_board_id, to_column_id, to_status)
+        SELECT new_rows.id, columns.board_id, new_rows.column_id, new_rows.status
+        FROM new_rows JOIN columns ON columns.id = new_rows.column_id
+        ORDER BY new_rows.id;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO task_transitions (task_id, from_board_id, from_column_id, from_status)
+        SELECT old_rows.id, last.to_board_id, old_rows.column_id, old_rows.status
+        FROM old_rows
+        LEFT JOIN LATERAL (
+            SELECT to_board_id FROM task_transitions
+            WHERE task_transitions.task_id = old_rows.id
+            ORDER BY task_transitions.id DESC LIMIT 1
+        ) AS last ON true
+        ORDER BY old_rows.id;
+    ELSE
+        INSERT INTO task_transitions (
+            task_id, from_board_id, to_board_id, from_column_id, to_column_id, from_status, to_status
+        )
+        SELECT new_rows.id, old_columns.board_id, new_columns.board_id,
+               old_rows.column_id, new_rows.column_id, old_rows.status, new_rows.status
+        FROM old_rows
+        JOIN new_rows ON new_rows.id = old_rows.id
+        JOIN columns AS old_columns ON old_columns.id = old_rows.column_id
+        JOIN columns AS new_columns ON new_columns.id = new_rows.column_id
+        WHERE old_rows.status IS DISTINCT FROM new_rows.status
+           OR old_rows.column_id IS DISTINCT FROM new_rows.column_id
+        ORDER BY new_rows.id;
+    END IF;
+    RETURN NULL;
+END
+$$;
+"""
+
+TRIGGERS = [
+    ("tasks_record_transitions_insert", "INSERT", "NEW TABLE AS new_rows"),
+    ("tasks_record_transitions_update", "UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    ("tasks_record_transitions_delete", "DELETE", "OLD TABLE AS old_rows"),
+]
+
+task_status = postgresql.ENUM(name="task_status", create_type=False)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_transitions",
+        sa.Column("id", sa.BigInteger(), primary_key=True),
+        sa.Column("task_id", sa.Integer(), nullable=False),
+        sa.Column("from_board_id", sa.Integer(), nullable=True),
+        sa.Column("to_board_id", sa.Integer(), nullable=True),
+        sa.Column("from_column_id", sa.Integer(), nullable=True),
+        sa.Column("to_column_id", sa.Integer(), nullable=True),
+        sa.Column("from_status", task_status, nullable=True),
+        sa.Column("to_status", task_status, nullable=True),
+        sa.Column("changed_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index("ix_task_transitions_task_id_id", "task_transitions", ["task_id", "id"])
+    op.create_table(
+        "board_flow_daily",
+        sa.Column("board_id", sa.Integer(), primary_key=True),
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("status", task_status, primary_key=True),
+        sa.Column("entered", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("exited", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_table(
+        "board_throughput_daily",
+        sa.Column("board_id", sa.Integer(), primary_key=True),
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("completed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("cycle_time_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("cycle_time_seconds", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("lead_time_seconds", sa.Float(), nullable=False, server_default="0"),
+    )
+    op.create_table(
+        "flow_rollup_state",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("last_transition_id", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    op.execute("INSERT INTO flow_rollup_state (id) VALUES (1)")
+
+    op.execute(FUNCTION)
+    # Trigger'lar oluşturulurken görev yazılmasın; mevcut görevler aynı kilit altında kaydedilir
+    op.execute("LOCK TABLE tasks IN SHARE ROW EXCLUSIVE MODE")
+    for name, event, referencing in TRIGGERS:
+        op.execute(
+            f"CREATE TRIGGER {name} AFTER {event} ON tasks "
+            f"REFERENCING {referencing} FOR EACH STATEMENT EXECUTE FUNCTION tasks_record_transitions()"
+        )
+    op.execute(
+        """
+        INSERT INTO task_transitions (task_id, to_board_id, to_column_id, to_status, changed_at)
+        SELECT tasks.id, columns.board_id, tasks.column_id, tasks.status, coalesce(tasks.created_at, now())
+        FROM tasks JOIN columns ON columns.id = tasks.column_id
+        ORDER BY tasks.created_at, tasks.id
+        """
+    )
+
+
+def downgrade() -> None:
+    for name, _, _ in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS tasks_record_transitions()")
+    op.drop_table("flow_rollup_state")
+    op.drop_table("board_throughput_daily")
+    op.drop_table("board_flow_daily")
+    op.drop_index("ix_task_transitions_task_id_id", table_name="task_transitions")
+    op.drop_table("task_transitions")
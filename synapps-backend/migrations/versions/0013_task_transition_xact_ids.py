@@ -0,0 +1,43 @@
+"""task transition transaction ids
+
+Özet işi geçişleri id sırasıyla ve "changed_at LAG'den eski" kuralıyla alıyordu. changed_at
+transaction'ın başlangıç zamanıdır; LAG'den uzun süren bir transaction (büyük import, kullanıcı
+silme) commit ettiğinde geçişlerinin id'leri işin çoktan geçtiği sınırın altında kalıyor ve
+hiç sayılmıyordu.
+
+Her geçiş artık onu yazan transaction'ın id'sini (xact_id) taşır. İş yalnızca snapshot xmin'inden
+küçük xact_id'li geçişleri alır: bu transaction'ların hepsi bitmiştir, satırları görünür ve
+kesindir. İlerleme (xact_id, id) çiftiyle tutulur. Mevcut geçişler 0 alır (tablo yeniden
+yazılmaz); işlenmemiş olanlar (0, last_transition_id) imlecinin arkasında kalır.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2025-05-01 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0013"
+down_revision = "0012"
+branch_labels = None
+depends_on = None
+
+XACT_ID_SQL = "(pg_current_xact_id()::text)::bigint"
+
+
+def upgrade() -> None:
+    op.add_column(
+        "task_transitions", sa.Column("xact_id", sa.BigInteger(), nullable=False, server_default="0")
+    )
+    op.alter_column("task_transitions", "xact_id", server_default=sa.text(XACT_ID_SQL))
+    op.create_index("ix_task_transitions_xact_id_id", "task_transitions", ["xact_id", "id"])
+    op.add_column(
+        "flow_rollup_state", sa.Column("last_xact_id", sa.BigInteger(), nullable=False, server_default="0")
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("flow_rollup_state", "last_xact_id")
+    op.drop_index("ix_task_transitions_xact_id_id", table_name="task_transitions")
+    op.drop_column("task_transitions", "xact_id")
@@ -6,4 +6,8 @@ from .column import Column
 from .task import Task
 from .session import Session
 from .notification import Notification
-from .board_member import BoardMember
\ No newline at end of file
+from .board_member import BoardMember
+from .outbox_event import OutboxEvent
+from .user_deletion import UserDeletion
+from .task_transition import TaskTransition
+from .board_flow import BoardFlowDaily, BoardThroughputDaily, FlowRollupState
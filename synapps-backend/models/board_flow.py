@@ -0,0 +1,40 @@
+# models/board_flow.py
+from sqlalchemy import BigInteger, Column, Date, DateTime, Float, Integer, Enum
+from sqlalchemy.sql import func
+from models.base import Base
+from models.task import TaskStatus
+
+# task_transitions'tan arka plan işiyle artımlı doldurulan günlük board özetleri
+# (services/flow_metrics.py). Analitik uçları yalnızca bu tabloları okur.
+
+# Gün içinde bir duruma giren/çıkan görev sayısı; cumulative flow bunların farkının
+# kümülatif toplamıdır
+class BoardFlowDaily(Base):
+    __tablename__ = "board_flow_daily"
+
+    board_id = Column(Integer, primary_key=True)
+    day = Column(Date, primary_key=True)
+    status = Column(Enum(TaskStatus, name="task_status"), primary_key=True)
+    entered = Column(Integer, nullable=False, default=0, server_default="0")
+    exited = Column(Integer, nullable=False, default=0, server_default="0")
+
+# Gün içinde tamamlanan (done'a geçen) görevler; ortalamalar toplam / sayı ile hesaplanır
+class BoardThroughputDaily(Base):
+    __tablename__ = "board_throughput_daily"
+
+    board_id = Column(Integer, primary_key=True)
+    day = Column(Date, primary_key=True)
+    completed = Column(Integer, nullable=False, default=0, server_default="0")
+    # in_progress'e hiç girmeden tamamlananların cycle time'ı yoktur
+    cycle_time_count = Column(Integer, nullable=False, default=0, server_default="0")
+    cycle_time_seconds = Column(Float, nullable=False, default=0, server_default="0")
+    lead_time_seconds = Column(Float, nullable=False, default=0, server_default="0")
+
+# Özet işinin işlediği son geçişin (xact_id, id) imleci (tek satır, id=1)
+class FlowRollupState(Base):
+    __tablename__ = "flow_rollup_state"
+
+    id = Column(Integer, primary_key=True)
+    last_xact_id = Column(BigInteger, nullable=False, default=0, server_default="0")
+    last_transition_id = Column(BigInteger, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime, nullable=False, server_default=func.now())
@@ -2,7 +2,7 @@
 from sqlalchemy import Column, Integer, ForeignKey, Enum, DateTime
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from sqlalchemy.schema import UniqueConstraint
+from sqlalchemy.schema import Index, UniqueConstraint
 from models.base import Base
 from enum import Enum as PyEnum
 
@@ -25,4 +25,6 @@ class BoardMember(Base):
     # Benzersizlik kısıtını doğru şekilde tanımlıyoruz
     __table_args__ = (
         UniqueConstraint("board_id", "user_id", name="unique_board_user"),
+        Index("ix_board_members_user_id", "user_id"),
+        Index("ix_board_members_board_id_id", "board_id", "id"),
     )
\ No newline at end of file
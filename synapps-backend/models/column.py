@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from models.base import Base  # Base'i buradan ithal ediyoruz
@@ -10,7 +10,12 @@ class Column(Base):
     title = Column(String, nullable=False)
     board_id = Column(Integer, ForeignKey("project_boards.id", ondelete="CASCADE"), nullable=False)
     position = Column(Integer, default=0, nullable=False)
+    rank = Column(String(collation="C"), nullable=False)
     created_at = Column(DateTime, server_default=func.now())
 
     project_board = relationship("ProjectBoard", back_populates="columns")
-    tasks = relationship("Task", back_populates="column", cascade="all, delete-orphan", order_by="Task.position")
\ No newline at end of file
+    tasks = relationship("Task", back_populates="column", cascade="all, delete-orphan", order_by="Task.rank")
+
+    __table_args__ = (
+        Index("ix_columns_board_id_rank", "board_id", "rank"),
+    )
\ No newline at end of file
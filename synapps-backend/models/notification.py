@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from models.base import Base  # Base'i buradan ithal ediyoruz
@@ -17,4 +17,9 @@ class Notification(Base):
     related_item_type = Column(String)
     data = Column(JSON, nullable=True)
 
-    user = relationship("User", back_populates="notifications")
\ No newline at end of file
+    user = relationship("User", back_populates="notifications")
+
+    __table_args__ = (
+        Index("ix_notifications_user_id_id", "user_id", "id"),
+        Index("ix_notifications_user_id_is_read_id", "user_id", "is_read", "id"),
+    )
\ No newline at end of file
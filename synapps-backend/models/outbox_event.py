@@ -0,0 +1,23 @@
+# models/outbox_event.py
+from sqlalchemy import Column, DateTime, Integer, String, Text, JSON, Index
+from sqlalchemy.sql import func
+from models.base import Base
+
+# İş değişikliğiyle aynı transaction'da yazılan yan etki kayıtları (services/outbox.py).
+# Başarıyla işlenen kayıt silinir; deneme hakkı biten kayıt failed_at ile işaretlenip tabloda kalır.
+class OutboxEvent(Base):
+    __tablename__ = "outbox_events"
+
+    id = Column(Integer, primary_key=True)
+    topic = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    available_at = Column(DateTime, nullable=False, server_default=func.now())
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    last_error = Column(Text, nullable=True)
+    failed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # Worker'ın "sıradaki bekleyen kayıtlar" sorgusu
+        Index("ix_outbox_events_pending", "available_at", "id", postgresql_where=failed_at.is_(None)),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Boolean, Column, Integer, String, ForeignKey, DateTime, Index, false
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from models.base import Base  # Base'i buradan ithal ediyoruz
@@ -11,7 +11,15 @@ class ProjectBoard(Base):
     description = Column(String, nullable=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     created_at = Column(DateTime, server_default=func.now())
+    # Board içeriği her değiştiğinde artar (services/board_version.py); ETag olarak kullanılır
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    # Kullanıcı tanımlı şablon: yeni board'lar bundan kopyalanabilir (services/board_templates.py)
+    is_template = Column(Boolean, nullable=False, default=False, server_default=false())
 
     user = relationship("User", back_populates="project_boards")
     columns = relationship("Column", back_populates="project_board", cascade="all, delete-orphan")
-    board_members = relationship("BoardMember", back_populates="project_board", cascade="all, delete-orphan")
\ No newline at end of file
+    board_members = relationship("BoardMember", back_populates="project_board", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        Index("ix_project_boards_user_id", "user_id"),
+    )
\ No newline at end of file
@@ -1,6 +1,7 @@
 # models/task.py
-from sqlalchemy import Column, DateTime, Integer, String, Text, ForeignKey, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, DateTime, Integer, String, Text, ForeignKey, Enum, Index
+from sqlalchemy.dialects.postgresql import TSRANGE, TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 from models.base import Base
 from enum import Enum as PyEnum
@@ -12,6 +13,20 @@ class TaskStatus(PyEnum):
     review = "review"
     cancelled = "cancelled"
 
+# Başlık (A) ve açıklama (B) ağırlıklı arama vektörü; dil bağımsız "simple" sözlük
+SEARCH_CONFIG = "simple"
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+)
+
+# Zaman çizelgesi aralığı: iki tarih de boşsa NULL, biri boşsa tek noktalık aralık;
+# ters girilmiş tarihler aralığı bozmasın diye least/greatest kullanılır
+SCHEDULE_SQL = (
+    "CASE WHEN start_date IS NULL AND end_date IS NULL THEN NULL "
+    "ELSE tsrange(least(start_date, end_date), greatest(start_date, end_date), '[]') END"
+)
+
 class Task(Base):
     __tablename__ = "tasks"
     
@@ -22,13 +37,29 @@ class Task(Base):
     assigned_user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True)  # Nullable=True eklendi
     status = Column(Enum(TaskStatus, name="task_status"), default=TaskStatus.todo, nullable=False)
     created_at = Column(DateTime, server_default=func.now())
+    # İstemcinin istediği son sıra (yalnızca bilgi amaçlı); gerçek sıralama `rank` ile yapılır
     position = Column(Integer, default=0, nullable=False)
+    rank = Column(String(collation="C"), nullable=False)
     priority = Column(String, default="medium", nullable=False)
     start_date = Column(DateTime, nullable=True)
     end_date = Column(DateTime, nullable=True)
     dependency_id = Column(Integer, ForeignKey("tasks.id", ondelete="SET NULL"), nullable=True)
+    # Tam metin arama (services/task_search.py); veritabanı hesaplar, normal sorgularda yüklenmez
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True)))
+    # Zaman çizelgesi sorguları (GET /boards/{id}/timeline) için start_date..end_date aralığı
+    schedule = deferred(Column(TSRANGE, Computed(SCHEDULE_SQL, persisted=True)))
 
     # İlişkiler
     column = relationship("Column", back_populates="tasks")
     assigned_user = relationship("User", back_populates="tasks")  # Doğru ilişki, assigned_user_id ile eşleşiyor
-    dependency = relationship("Task", remote_side=[id], backref="dependent_tasks")
\ No newline at end of file
+    dependency = relationship("Task", remote_side=[id], backref="dependent_tasks")
+
+    # Router sorgularının kullandığı indeksler (migrations/versions/0002, 0004, 0005, 0008, 0011)
+    __table_args__ = (
+        Index("ix_tasks_column_id_rank", "column_id", "rank"),
+        Index("ix_tasks_assigned_user_id_id", "assigned_user_id", "id"),
+        Index("ix_tasks_status_id", "status", "id"),
+        Index("ix_tasks_dependency_id", "dependency_id"),
+        Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_tasks_schedule", "schedule", postgresql_using="gist"),
+    )
\ No newline at end of file
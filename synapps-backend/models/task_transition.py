@@ -0,0 +1,32 @@
+# models/task_transition.py
+from sqlalchemy import BigInteger, Column, DateTime, Integer, Enum, Index, text
+from sqlalchemy.sql import func
+from models.base import Base
+from models.task import TaskStatus
+
+# Görevlerin durum/kolon/board değişikliklerinin yalnızca eklenen (append-only) kaydı.
+# Uygulama yazmaz; tasks üzerindeki statement-level trigger'lar doldurur (migrations/versions/0012).
+# Oluşturmada from_* alanları, silmede to_* alanları boştur. Görev veya board silindikten
+# sonra da geçmiş kalsın diye FK yoktur.
+class TaskTransition(Base):
+    __tablename__ = "task_transitions"
+
+    id = Column(BigInteger, primary_key=True)
+    task_id = Column(Integer, nullable=False)
+    from_board_id = Column(Integer, nullable=True)
+    to_board_id = Column(Integer, nullable=True)
+    from_column_id = Column(Integer, nullable=True)
+    to_column_id = Column(Integer, nullable=True)
+    from_status = Column(Enum(TaskStatus, name="task_status"), nullable=True)
+    to_status = Column(Enum(TaskStatus, name="task_status"), nullable=True)
+    changed_at = Column(DateTime, nullable=False, server_default=func.now())
+    # Geçişi yazan transaction'ın id'si; özet işi yalnızca bitmiş transaction'ların
+    # geçişlerini alır (migrations/versions/0013)
+    xact_id = Column(BigInteger, nullable=False, server_default=text("(pg_current_xact_id()::text)::bigint"))
+
+    __table_args__ = (
+        # Görevin son geçişi (silme trigger'ı) ve cycle time hesabındaki önceki geçişler
+        Index("ix_task_transitions_task_id_id", "task_id", "id"),
+        # Özet işinin (xact_id, id) imleci
+        Index("ix_task_transitions_xact_id_id", "xact_id", "id"),
+    )
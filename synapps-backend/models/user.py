@@ -13,6 +13,9 @@ class User(Base):
     hashed_password = Column(String, nullable=False)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now())
+    # Okunmamış bildirim sayısı; notifications tablosundaki trigger'lar tarafından
+    # artımlı olarak güncellenir (migrations/versions/0006), uygulama yazmaz
+    unread_notification_count = Column(Integer, nullable=False, default=0, server_default="0")
 
     project_boards = relationship("ProjectBoard", back_populates="user")
     tasks = relationship("Task", back_populates="assigned_user")
@@ -0,0 +1,23 @@
+# models/user_deletion.py
+from sqlalchemy import Column, DateTime, Integer, String, Index
+from sqlalchemy.sql import func
+from models.base import Base
+
+# Büyük hesapların arka planda silinme takibi (services/user_deletion.py). Kullanıcı silindikten
+# sonra da sorgulanabilsin diye users'a FK yoktur; id tahmin edilemez bir token'dır.
+class UserDeletion(Base):
+    __tablename__ = "user_deletions"
+
+    id = Column(String(32), primary_key=True)
+    user_id = Column(Integer, nullable=False)
+    status = Column(String, nullable=False, default="pending", server_default="pending")
+    tasks_deleted = Column(Integer, nullable=False, default=0, server_default="0")
+    notifications_deleted = Column(Integer, nullable=False, default=0, server_default="0")
+    boards_deleted = Column(Integer, nullable=False, default=0, server_default="0")
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    updated_at = Column(DateTime, nullable=False, server_default=func.now())
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_user_deletions_user_id", "user_id"),
+    )
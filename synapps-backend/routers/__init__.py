@@ -6,5 +6,6 @@ from .board_member import router as board_member_router
 from .notification import router as notification_router
 from .auth import router as auth_router
 from .user import router as user_router
+from .internal import router as internal_router
 
-__all__ = ["auth_router", "task_router", "board_router", "column_router", "board_member_router", "notification_router", "user_router"]
\ No newline at end of file
+__all__ = ["auth_router", "task_router", "board_router", "column_router", "board_member_router", "notification_router", "user_router", "internal_router"]
\ No newline at end of file
@@ -1,90 +1,284 @@
 # routers/board.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, union
 from sqlalchemy.future import select
-from typing import List
-from database import get_db
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+from config import settings
+from database import get_db, get_read_db, read_session_maker
 from models.project_board import ProjectBoard
-from schemas.board import ProjectBoardCreate, ProjectBoardResponse, ProjectBoardUpdate
-from models.board_member import BoardMember, RoleType
-from models.column import Column
-
-# Varsayılan sütunlar
-DEFAULT_COLUMNS = [
-    {"title": "Yapılacak", "position": 0},
-    {"title": "Devam Ediyor", "position": 1},
-    {"title": "Tamamlandı", "position": 2}
-]
+from schemas.board import (
+    BoardFlowMetricsResponse, BoardImportReport, BoardTemplateResponse, ProjectBoardClone, ProjectBoardCloneResponse, ProjectBoardCreate,
+    ProjectBoardResponse, ProjectBoardUpdate, ProjectBoardSnapshotResponse, ProjectBoardSummaryResponse,
+)
+from models.board_member import BoardMember
+from services.board_snapshot import load_board_row, load_board_snapshot
+from services.board_summary import load_board_summaries
+from services.board_templates import (
+    BUILTIN_TEMPLATES, DEFAULT_TEMPLATE, builtin_templates, clone_board, create_board_from_titles, load_user_templates,
+)
+from services.task_dependencies import get_dependency_graph
+from services.flow_metrics import load_flow_metrics
+from services.task_timeline import load_timeline, timeline_cursor_extra
+from core.pagination import Page, finish_page, page_params
+from schemas.task import CriticalPathResponse, TaskDependencyGraphResponse, TimelineTask
+from services.board_events import board_event_stream, publish_board_event
+from services.board_transfer import export_board_chunks, import_board, parse_import
+from services.board_version import board_etag, bump_board_version, etag_matches, get_board_version
+from core.board_access import (
+    board_access_cache, board_member_required, board_owner_required, get_board_roles, require_board_access,
+)
+from core.security import get_current_user
+from models.user import User
 
 router = APIRouter(prefix="/boards", tags=["boards"])
 
-# Yeni bir board oluşturma
+# Yeni bir board oluşturma. Board, owner üyeliği ve şablonun kolonları (template_id verilirse
+# şablon board'un görevleri de) tek ifadeyle ve tek transaction'da yazılır.
 @router.post("/", response_model=ProjectBoardResponse, status_code=201)
-async def create_board(board: ProjectBoardCreate, db: AsyncSession = Depends(get_db)):
-    # Board'u oluştur
-    db_board = ProjectBoard(
-        name=board.name,
-        description=board.description if hasattr(board, 'description') else None,
-        user_id=board.user_id
-    )
-    db.add(db_board)
+async def create_board(
+    board: ProjectBoardCreate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    if board.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Başka bir kullanıcı adına board oluşturulamaz")
+    if board.template_id is not None:
+        await require_board_access(db, current_user, board.template_id)
+        template = await db.get(ProjectBoard, board.template_id)
+        if template is None or not template.is_template:
+            raise HTTPException(status_code=400, detail="Board is not a template")
+        db_board = await clone_board(db, template.id, board.name, board.description, board.user_id)
+    else:
+        titles = BUILTIN_TEMPLATES.get(board.template or DEFAULT_TEMPLATE)
+        if titles is None:
+            raise HTTPException(status_code=400, detail=f"Unknown template: {board.template}")
+        db_board = await create_board_from_titles(db, board.name, board.description, board.user_id, titles)
     await db.commit()
-    await db.refresh(db_board)
-    
-    # Board owner'ı board_members tablosuna ekle
-    owner_member = BoardMember(
-        board_id=db_board.id,
-        user_id=board.user_id,
-        role=RoleType.OWNER
+    board_access_cache.invalidate(board.user_id)
+    return db_board
+
+# Hazır şablonlar ve kullanıcının erişebildiği şablon board'lar (is_template)
+@router.get("/templates", response_model=List[BoardTemplateResponse])
+async def get_board_templates(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    roles = await get_board_roles(db, current_user.id)
+    return builtin_templates() + await load_user_templates(db, list(roles))
+
+# Board'u (kolonlar ve isteğe bağlı görevlerle) çağıranın sahip olduğu yeni bir board'a kopyalar.
+# Kopyalama veritabanı içinde tek INSERT ... SELECT ifadesiyle yapılır.
+@router.post("/{board_id}/clone", response_model=ProjectBoardCloneResponse, status_code=201)
+async def clone_board_route(
+    board_id: int,
+    clone: ProjectBoardClone,
+    current_user: User = Depends(board_member_required),
+    db: AsyncSession = Depends(get_db)
+):
+    db_board = await clone_board(
+        db, board_id, clone.name, clone.description, current_user.id,
+        include_tasks=clone.include_tasks, is_template=clone.is_template,
     )
-    db.add(owner_member)
-    
-    # Default kolonları ekle
-    for col_data in DEFAULT_COLUMNS:
-        db_column = Column(
-            title=col_data["title"],
-            position=col_data["position"],
-            board_id=db_board.id
-        )
-        db.add(db_column)
-    
     await db.commit()
-    await db.refresh(db_board)
-    
-    # Board'u ve kolonlarıyla birlikte dön
+    board_access_cache.invalidate(current_user.id)
     return db_board
 
 # Tüm boardları listeleme
 @router.get("/", response_model=List[ProjectBoardResponse])
-async def get_boards(user_id: int, db: AsyncSession = Depends(get_db)):
+async def get_boards(
+    user_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    if user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Yalnızca kendi board'larınızı listeleyebilirsiniz")
+    # OR yerine UNION: iki kol da kendi indeksini kullanır (ix_project_boards_user_id, ix_board_members_user_id)
+    visible_board_ids = union(
+        select(ProjectBoard.id).where(ProjectBoard.user_id == user_id),
+        select(BoardMember.board_id).where(BoardMember.user_id == user_id),
+    )
     result = await db.execute(
-        select(ProjectBoard)
-        .where(
-            (ProjectBoard.user_id == user_id) |
-            (ProjectBoard.id.in_(
-                select(BoardMember.board_id)
-                .where(BoardMember.user_id == user_id)
-            ))
-        )
+        select(ProjectBoard).where(ProjectBoard.id.in_(visible_board_ids))
     )
     boards = result.scalars().all()
     if not boards:
         return []
     return boards
 
+# Dashboard için kullanıcının görebildiği tüm board'ların özet sayıları; board sayısından
+# bağımsız olarak sabit sayıda gruplu sorgu (services/board_summary.py)
+@router.get("/summary", response_model=List[ProjectBoardSummaryResponse])
+async def get_board_summaries(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    roles = await get_board_roles(db, current_user.id)
+    return await load_board_summaries(db, roles)
+
 # Belirli bir boardu alma
 @router.get("/{board_id}", response_model=ProjectBoardResponse)
-async def get_board(board_id: int, db: AsyncSession = Depends(get_db)):
+async def get_board(
+    board_id: int,
+    request: Request,
+    response: Response,
+    current_user: User = Depends(board_member_required),
+    db: AsyncSession = Depends(get_read_db)
+):
     board = await db.get(ProjectBoard, board_id)
     if not board:
         raise HTTPException(status_code=404, detail="Board not found")
+    etag = board_etag(board.id, board.version)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return board
 
+# Board'u kolonları, görevleri ve üyeleriyle tek istekte alma
+@router.get("/{board_id}/full", response_model=ProjectBoardSnapshotResponse)
+async def get_board_full(
+    board_id: int,
+    request: Request,
+    response: Response,
+    current_user: User = Depends(board_member_required),
+    db: AsyncSession = Depends(get_read_db)
+):
+    board = await load_board_row(db, board_id)
+    if board is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+    # Board değişmediyse kolon/görev/üye sorgularını hiç çalıştırma
+    etag = board_etag(board_id, board["version"])
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return await load_board_snapshot(db, board)
+
+# Board'u NDJSON (board, kolon ve görev kayıtları) veya CSV olarak akış halinde dışa aktarır
+@router.get("/{board_id}/export")
+async def export_board(
+    board_id: int,
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    current_user: User = Depends(board_member_required),
+    db: AsyncSession = Depends(get_read_db)
+):
+    if await get_board_version(db, board_id) is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+    await db.close()
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        export_board_chunks(read_session_maker(request), board_id, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="board-{board_id}.{format}"'},
+    )
+
+# Export biçimindeki (NDJSON veya Content-Type: text/csv) kolon ve görevleri tek transaction'da
+# toplu olarak yükler. Geçersiz satırlar atlanır ve raporda listelenir.
+@router.post("/{board_id}/import", response_model=BoardImportReport)
+async def import_board_route(
+    board_id: int,
+    request: Request,
+    current_user: User = Depends(board_member_required),
+    db: AsyncSession = Depends(get_db)
+):
+    records = parse_import(await request.body(), request.headers.get("content-type", ""))
+    report = await import_board(db, board_id, records)
+    version = await bump_board_version(db, board_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+    await db.commit()
+    publish_board_event(board_id, version, "board.imported", {
+        "columns_created": report.columns_created, "tasks_created": report.tasks_created,
+    })
+    return report.as_dict()
+
+# Zaman çizelgesi: from..to penceresiyle çakışan görevler, başlangıca göre sıralı ve sayfalı
+@router.get("/{board_id}/timeline", response_model=List[TimelineTask])
+async def get_board_timeline(
+    board_id: int,
+    response: Response,
+    window_start: datetime = Query(..., alias="from"),
+    window_end: datetime = Query(..., alias="to"),
+    page: Page = Depends(page_params),
+    current_user: User = Depends(board_member_required),
+    db: AsyncSession = Depends(get_read_db)
+):
+    if window_end < window_start:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+    rows = await load_timeline(db, board_id, window_start, window_end, page)
+    return finish_page(rows, page, response, timeline_cursor_extra)
+
+# Akış metrikleri (throughput, cycle/lead time, cumulative flow); yalnızca günlük özet
+# tabloları okunur. Özetler arka plan işiyle güncellenir, rolled_up_at son çalışmayı gösterir.
+@router.get("/{board_id}/flow-metrics", response_model=BoardFlowMetricsResponse)
+async def get_board_flow_metrics(
+    board_id: int,
+    start: Optional[date] = Query(None, alias="from"),
+    end: Optional[date] = Query(None, alias="to"),
+    current_user: User = Depends(board_member_required),
+    db: AsyncSession = Depends(get_read_db)
+):
+    end = end or date.today()
+    start = start or end - timedelta(days=settings.FLOW_METRICS_DEFAULT_DAYS - 1)
+    if end < start:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+    if (end - start).days + 1 > settings.FLOW_METRICS_MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"At most {settings.FLOW_METRICS_MAX_DAYS} days can be requested")
+    return await load_flow_metrics(db, board_id, start, end)
+
+# Board'un bağımlılık grafiği (dependency_id) ve kritik yolu tek çağrıda; board version'ı
+# değişmediyse önbellekten döner
+@router.get("/{board_id}/dependencies", response_model=TaskDependencyGraphResponse)
+async def get_board_dependencies(
+    board_id: int,
+    current_user: User = Depends(board_member_required),
+    db: AsyncSession = Depends(get_read_db)
+):
+    return await get_dependency_graph(db, board_id)
+
+# Yalnızca kritik yol: toplam süresi (end_date - start_date) en uzun bağımlılık zinciri
+@router.get("/{board_id}/critical-path", response_model=CriticalPathResponse)
+async def get_board_critical_path(
+    board_id: int,
+    current_user: User = Depends(board_member_required),
+    db: AsyncSession = Depends(get_read_db)
+):
+    graph = await get_dependency_graph(db, board_id)
+    nodes = {node["id"]: node for node in graph["nodes"]}
+    return {
+        "board_id": board_id,
+        "tasks": [nodes[task_id] for task_id in graph["critical_path"]],
+        "duration_seconds": graph["critical_path_seconds"],
+    }
+
+# Board'daki görev/kolon/üye değişikliklerini Server-Sent Events olarak yayınlar.
+# Her olayın id'si board version'ıdır; yeniden bağlanan istemci Last-Event-ID ile bunu geri gönderir.
+@router.get("/{board_id}/events")
+async def stream_board_events(
+    board_id: int,
+    request: Request,
+    current_user: User = Depends(board_member_required),
+    db: AsyncSession = Depends(get_read_db)
+):
+    version = await get_board_version(db, board_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+    # Akış boyunca bağlantı havuzundan bağlantı tutulmasın
+    await db.close()
+    return StreamingResponse(
+        board_event_stream(request, board_id, version),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 # Boardu güncelleme
 @router.put("/{board_id}", response_model=ProjectBoardResponse)
 async def update_board(
     board_id: int,
     board_update: ProjectBoardUpdate,
+    current_user: User = Depends(board_owner_required),
     db: AsyncSession = Depends(get_db)
 ):
     board = await db.get(ProjectBoard, board_id)
@@ -97,19 +291,29 @@ async def update_board(
         setattr(board, key, value)
     
     db.add(board)
+    await bump_board_version(db, board_id)
     await db.commit()
     await db.refresh(board)
     return board
 
-# Boardu silme
+# Boardu silme. ORM nesneleri yüklenmez: tek DELETE, kolonları, görevleri ve üyelikleri
+# veritabanındaki ON DELETE CASCADE ile siler (kullanıcı silmedeki gibi). Olay akışındaki
+# istemcilere board'un son version'ının bir fazlasıyla "board.deleted" yayınlanır.
 @router.delete("/{board_id}", status_code=204)
-async def delete_board(board_id: int, db: AsyncSession = Depends(get_db)):
-    board = await db.get(ProjectBoard, board_id)
-    if not board:
+async def delete_board(
+    board_id: int,
+    current_user: User = Depends(board_owner_required),
+    db: AsyncSession = Depends(get_db)
+):
+    version = (await db.execute(
+        delete(ProjectBoard).where(ProjectBoard.id == board_id).returning(ProjectBoard.version)
+        .execution_options(synchronize_session=False)
+    )).scalar_one_or_none()
+    if version is None:
         raise HTTPException(status_code=404, detail="Board not found")
-    
-    await db.delete(board)
     await db.commit()
+    board_access_cache.invalidate_board(board_id)
+    publish_board_event(board_id, version + 1, "board.deleted", {"id": board_id})
     return None
 
 # Yeni Board açıldığında hazır kolonlarla beraber gelecek
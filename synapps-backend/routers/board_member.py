@@ -1,22 +1,35 @@
 # routers/board_member.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 from typing import List
-from database import get_db
+from database import get_db, get_read_db
+from core.pagination import Page, finish_page, page_params, paginate
 from models.board_member import BoardMember, RoleType
 from schemas.board_member import BoardMemberCreate, BoardMemberResponse, BoardMemberUpdate, BoardMemberWithUserResponse
 from models.notification import Notification
 from models.project_board import ProjectBoard
 from schemas.notification import NotificationCreate
 from models.user import User
+from core.board_access import board_access_cache, get_board_roles, require_board_access
+from core.security import get_current_user
+from services.board_events import member_event_data, publish_board_event
+from services.board_version import bump_board_version
+from services.invitations import enqueue_board_invitation
+from services.notification_events import publish_notification_event
 
 router = APIRouter(prefix="/board-members", tags=["board_members"])
 
 # Yeni bir board üyesi oluşturma
 @router.post("/", response_model=BoardMemberResponse, status_code=201)
-async def create_board_member(board_member: BoardMemberCreate, db: AsyncSession = Depends(get_db)):
+async def create_board_member(
+    board_member: BoardMemberCreate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    # Davet için board'a erişim, doğrudan owner eklemek için sahiplik gerekir
+    await require_board_access(db, current_user, board_member.board_id, owner=board_member.role == RoleType.OWNER)
     # Aynı board_id ve user_id kombinasyonunun varlığını kontrol et
     result = await db.execute(
         select(BoardMember).where(
@@ -36,46 +49,51 @@ async def create_board_member(board_member: BoardMemberCreate, db: AsyncSession
     if board_member.role == RoleType.OWNER:
         db_board_member = BoardMember(**board_member.dict())
         db.add(db_board_member)
+        version = await bump_board_version(db, board_member.board_id)
         await db.commit()
         await db.refresh(db_board_member)
+        board_access_cache.invalidate(db_board_member.user_id)
+        publish_board_event(board_member.board_id, version, "member.added", member_event_data(db_board_member))
         return db_board_member
 
-    # Owner değilse notification (davet) oluştur
-    notification = Notification(
-        user_id=board_member.user_id,
-        notification_type="board_invitation",
-        message=f"'{board.name}' panosuna katılmak için davet edildiniz.",
-        related_item_id=board.id,
-        related_item_type="board",
-        data={"board_id": board.id, "board_name": board.name}
-    )
-    db.add(notification)
+    # Owner değilse davet bildirimi outbox üzerinden oluşturulur (services/invitations.py)
+    enqueue_board_invitation(db, board_member.user_id, board)
     await db.commit()
-    await db.refresh(notification)
     # Davet bildirimi oluşturulduktan sonra, BoardMember eklenmez. Kullanıcı daveti kabul edince eklenecek.
     return None
 
 # Tüm board üyelerini listeleme (isteğe bağlı board_id veya user_id filtresi)
 @router.get("/", response_model=List[BoardMemberWithUserResponse])
 async def get_board_members(
+    response: Response,
     board_id: int = None,
-    db: AsyncSession = Depends(get_db)
+    page: Page = Depends(page_params),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     query = select(BoardMember).options(selectinload(BoardMember.user))
     if board_id is not None:
+        await require_board_access(db, current_user, board_id)
         query = query.where(BoardMember.board_id == board_id)
-    result = await db.execute(query)
-    members = result.scalars().all()
+    else:
+        query = query.where(BoardMember.board_id.in_(list(await get_board_roles(db, current_user.id))))
+    result = await db.execute(paginate(query, BoardMember.id, page))
+    members = finish_page(result.scalars().all(), page, response)
     if not members:
         return []
     return members
 
 # Belirli bir board üyesini alma
 @router.get("/{member_id}", response_model=BoardMemberResponse)
-async def get_board_member(member_id: int, db: AsyncSession = Depends(get_db)):
+async def get_board_member(
+    member_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
     member = await db.get(BoardMember, member_id)
     if not member:
         raise HTTPException(status_code=404, detail="Board member not found")
+    await require_board_access(db, current_user, member.board_id)
     return member
 
 # Board üyesini güncelleme (örneğin, rol değiştirme)
@@ -83,11 +101,14 @@ async def get_board_member(member_id: int, db: AsyncSession = Depends(get_db)):
 async def update_board_member(
     member_id: int,
     member_update: BoardMemberUpdate,
+    current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     member = await db.get(BoardMember, member_id)
     if not member:
         raise HTTPException(status_code=404, detail="Board member not found")
+    # Rolleri yalnızca board sahibi değiştirebilir
+    await require_board_access(db, current_user, member.board_id, owner=True)
     
     # Güncellenecek alanları kontrol et ve uygula
     update_data = member_update.dict(exclude_unset=True)
@@ -95,24 +116,38 @@ async def update_board_member(
         setattr(member, key, value)
     
     db.add(member)
+    version = await bump_board_version(db, member.board_id)
     await db.commit()
     await db.refresh(member)
+    board_access_cache.invalidate(member.user_id)
+    publish_board_event(member.board_id, version, "member.updated", member_event_data(member))
     return member
 
 # Board üyesini silme
 @router.delete("/{member_id}", status_code=204)
-async def delete_board_member(member_id: int, db: AsyncSession = Depends(get_db)):
+async def delete_board_member(
+    member_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
     member = await db.get(BoardMember, member_id)
     if not member:
         raise HTTPException(status_code=404, detail="Board member not found")
+    # Üye kendi üyeliğinden çıkabilir; başkasını yalnızca board sahibi çıkarabilir
+    if member.user_id != current_user.id:
+        await require_board_access(db, current_user, member.board_id, owner=True)
     
     await db.delete(member)
+    version = await bump_board_version(db, member.board_id)
     await db.commit()
+    board_access_cache.invalidate(member.user_id)
+    publish_board_event(member.board_id, version, "member.removed", {"id": member_id, "user_id": member.user_id})
     return None
 
 @router.post("/accept-invitation/{notification_id}", response_model=BoardMemberResponse)
 async def accept_board_invitation(
     notification_id: int,
+    current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     # Bildirimi bul
@@ -124,6 +159,9 @@ async def accept_board_invitation(
     if not notification:
         raise HTTPException(status_code=404, detail="Bildirim bulunamadı")
     
+    if notification.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Bu davet size ait değil")
+
     if notification.notification_type != "board_invitation":
         raise HTTPException(status_code=400, detail="Geçersiz bildirim türü")
     
@@ -138,18 +176,28 @@ async def accept_board_invitation(
     # Bildirimi sil
     await db.delete(notification)
     
+    version = await bump_board_version(db, board_member.board_id)
     await db.commit()
     await db.refresh(board_member)
+    board_access_cache.invalidate(board_member.user_id)
+    publish_board_event(board_member.board_id, version, "member.added", member_event_data(board_member))
+    await publish_notification_event(db, board_member.user_id, "notification.deleted", {"id": notification_id})
     
     return board_member
 
 @router.post("/request")
-async def request_board_membership(data: dict, db: AsyncSession = Depends(get_db)):
+async def request_board_membership(
+    data: dict,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
     email = data.get("email")
     board_id = data.get("board_id")
-    inviter_id = data.get("inviter_id")
     if not email or not board_id:
         raise HTTPException(status_code=400, detail="E-posta ve board_id zorunludur.")
+    # Davet eden, isteği yapan kullanıcıdır ve board'a erişebilmelidir
+    await require_board_access(db, current_user, board_id)
+    inviter_id = current_user.id
 
     # Kullanıcıyı bul
     result = await db.execute(select(User).where(User.email == email))
@@ -176,16 +224,7 @@ async def request_board_membership(data: dict, db: AsyncSession = Depends(get_db
     if not board:
         raise HTTPException(status_code=404, detail="Board bulunamadı.")
 
-    # Davet bildirimi oluştur
-    notification = Notification(
-        user_id=user.id,
-        notification_type="board_invitation",
-        message=f"'{board.name}' panosuna katılmak için davet edildiniz.",
-        related_item_id=board.id,
-        related_item_type="board",
-        data={"board_id": board.id, "board_name": board.name, "inviter_id": inviter_id}
-    )
-    db.add(notification)
+    # Davet bildirimi outbox üzerinden oluşturulur
+    enqueue_board_invitation(db, user.id, board, inviter_id)
     await db.commit()
-    await db.refresh(notification)
     return {"detail": "Davet bildirimi gönderildi."}
\ No newline at end of file
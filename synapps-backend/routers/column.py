@@ -1,12 +1,21 @@
 # routers/column.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 from typing import List
-from database import get_db
+from database import get_db, get_read_db
 from models.column import Column
+from models.project_board import ProjectBoard
 from schemas.column import ColumnCreate, ColumnResponse, ColumnUpdate
+from services.board_version import board_etag, bump_board_version, etag_matches, get_board_version
+from services.board_events import column_event_data, publish_board_event
+from services.ordering import column_rank_at
+from services.board_snapshot import load_columns_with_tasks
+from core.fast_json import fast_json
+from core.board_access import forget_column, get_board_roles, require_board_access
+from core.security import get_current_user
+from models.user import User
 from pydantic import BaseModel
 
 router = APIRouter(prefix="/columns", tags=["columns"])
@@ -14,14 +23,22 @@ router = APIRouter(prefix="/columns", tags=["columns"])
 class PositionUpdate(BaseModel):
     position: int
 
-# Yeni bir sütun oluşturma
+# Yeni bir sütun oluşturma; position gönderilmediyse sona eklenir
 @router.post("/", response_model=ColumnResponse, status_code=201)
-async def create_column(column: ColumnCreate, db: AsyncSession = Depends(get_db)):
+async def create_column(
+    column: ColumnCreate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    await require_board_access(db, current_user, column.board_id)
     try:
-        db_column = Column(**column.dict())
+        index = column.position if "position" in column.model_fields_set else None
+        db_column = Column(**column.dict(), rank=await column_rank_at(db, column.board_id, index))
         db.add(db_column)
+        version = await bump_board_version(db, column.board_id)
         await db.commit()
         await db.refresh(db_column)
+        publish_board_event(column.board_id, version, "column.created", column_event_data(db_column))
         
         # Sütunu tasks ilişkisiyle birlikte yeniden yükle
         result = await db.execute(
@@ -37,59 +54,104 @@ async def create_column(column: ColumnCreate, db: AsyncSession = Depends(get_db)
 
 # Tüm sütunları listeleme (isteğe bağlı board_id filtresi)
 @router.get("/", response_model=List[ColumnResponse])
-async def get_columns(board_id: int = None, db: AsyncSession = Depends(get_db)):
-    query = select(Column).options(selectinload(Column.tasks))
+async def get_columns(
+    request: Request,
+    response: Response,
+    board_id: int = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    # Board filtresi varsa board versiyonu ETag olur; değişmediyse kolon/görev yüklenmez
     if board_id is not None:
-        query = query.where(Column.board_id == board_id)
-    query = query.order_by(Column.position)
-    result = await db.execute(query)
-    columns = result.scalars().all()
-    if not columns:
-        return []
-    # Her sütunun görevlerini de pozisyona göre sırala
-    for col in columns:
-        if hasattr(col, 'tasks') and col.tasks:
-            col.tasks.sort(key=lambda t: t.position)
-    return columns
+        await require_board_access(db, current_user, board_id)
+        version = await get_board_version(db, board_id)
+        if version is not None:
+            etag = board_etag(board_id, version)
+            if etag_matches(request, etag):
+                return Response(status_code=304, headers={"ETag": etag})
+            response.headers["ETag"] = etag
+
+    if board_id is not None:
+        condition = Column.board_id == board_id
+    else:
+        # Filtre yoksa yalnızca kullanıcının erişebildiği board'ların kolonları
+        condition = Column.board_id.in_(list(await get_board_roles(db, current_user.id)))
+    # Kolonlar rank, görevler kolon içinde rank sırasıyla; binlerce görevli board'larda
+    # doğrulama ve ORM maliyeti olmadan yazılır
+    return fast_json(await load_columns_with_tasks(db, condition), response)
 
 # Belirli bir sütunu alma
 @router.get("/{column_id}", response_model=ColumnResponse)
-async def get_column(column_id: int, db: AsyncSession = Depends(get_db)):
-    column = await db.get(Column, column_id)
-    if not column:
+async def get_column(
+    column_id: int,
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    result = await db.execute(
+        select(Column.board_id, ProjectBoard.version)
+        .join(ProjectBoard, ProjectBoard.id == Column.board_id)
+        .where(Column.id == column_id)
+    )
+    row = result.first()
+    if not row:
         raise HTTPException(status_code=404, detail="Column not found")
-    return column
+    await require_board_access(db, current_user, row.board_id)
+    etag = board_etag(row.board_id, row.version)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    columns = await load_columns_with_tasks(db, Column.id == column_id)
+    if not columns:
+        raise HTTPException(status_code=404, detail="Column not found")
+    return fast_json(columns[0], response)
 
 # Sütunu güncelleme
 @router.put("/{column_id}", response_model=ColumnResponse)
 async def update_column(
     column_id: int,
     column_update: ColumnUpdate,
+    current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     column = await db.get(Column, column_id)
     if not column:
         raise HTTPException(status_code=404, detail="Column not found")
+    await require_board_access(db, current_user, column.board_id)
     
     # Güncellenecek alanları kontrol et ve uygula
     update_data = column_update.dict(exclude_unset=True)
     for key, value in update_data.items():
         setattr(column, key, value)
+    if "position" in update_data:
+        column.rank = await column_rank_at(db, column.board_id, update_data["position"], exclude_column_id=column.id)
     
     db.add(column)
+    version = await bump_board_version(db, column.board_id)
     await db.commit()
     await db.refresh(column)
+    publish_board_event(column.board_id, version, "column.updated", column_event_data(column))
     return column
 
 # Sütunu silme
 @router.delete("/{column_id}", status_code=204)
-async def delete_column(column_id: int, db: AsyncSession = Depends(get_db)):
+async def delete_column(
+    column_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
     column = await db.get(Column, column_id)
     if not column:
         raise HTTPException(status_code=404, detail="Column not found")
+    await require_board_access(db, current_user, column.board_id)
     
     await db.delete(column)
+    version = await bump_board_version(db, column.board_id)
     await db.commit()
+    forget_column(column_id)
+    publish_board_event(column.board_id, version, "column.deleted", {"id": column_id})
     return None
 
 # Sütun pozisyonunu güncelleme
@@ -97,15 +159,20 @@ async def delete_column(column_id: int, db: AsyncSession = Depends(get_db)):
 async def update_column_position(
     column_id: int,
     data: PositionUpdate,
+    current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     column = await db.get(Column, column_id)
     if not column:
         raise HTTPException(status_code=404, detail="Column not found")
+    await require_board_access(db, current_user, column.board_id)
     column.position = data.position
+    column.rank = await column_rank_at(db, column.board_id, data.position, exclude_column_id=column.id)
     db.add(column)
+    version = await bump_board_version(db, column.board_id)
     await db.commit()
     await db.refresh(column)
+    publish_board_event(column.board_id, version, "column.updated", column_event_data(column))
     # Sütunu görevleriyle birlikte yükle
     result = await db.execute(
         select(Column).options(selectinload(Column.tasks)).where(Column.id == column_id)
@@ -0,0 +1,54 @@
+# routers/internal.py
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.board_access import board_access_cache
+from core.principal_cache import principal_cache
+from core.password_pool import password_pool
+from core.background import jobs
+from services.board_events import board_events
+from database import get_db, pool_stats
+from services.outbox import outbox_stats
+from services.task_dependencies import dependency_graph_cache
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+# Kullanıcı önbelleği istatistikleri (hit/miss, kaç DB sorgusu kazanıldığı)
+@router.get("/principal-cache")
+async def get_principal_cache_stats():
+    return principal_cache.stats()
+
+# Board yetki önbelleği istatistikleri
+@router.get("/board-access")
+async def get_board_access_stats():
+    return board_access_cache.stats()
+
+# Bağımlılık grafiği önbelleği
+@router.get("/dependency-graphs")
+async def get_dependency_graph_stats():
+    return dependency_graph_cache.stats()
+
+# Şifre (bcrypt) thread havuzu doluluğu ve reddedilen istek sayısı
+@router.get("/password-pool")
+async def get_password_pool_stats():
+    return password_pool.stats()
+
+# Veritabanı bağlantı havuzu: kullanılan/taşan bağlantılar, bekleme süresi histogramı
+@router.get("/pool")
+async def get_pool_stats():
+    return pool_stats()
+
+
+# Arka plan işlerinin (core/background.py) çalışma sayısı, hataları ve son sonucu
+@router.get("/jobs")
+async def get_job_stats():
+    return {name: job.stats() for name, job in jobs.items()}
+
+# Board olay akışı: açık kanal/dinleyici sayısı, yayınlanan ve düşürülen dinleyiciler
+@router.get("/events")
+async def get_event_stats():
+    return board_events.stats()
+
+# Outbox: bekleyen/başarısız kayıt sayısı, en eski bekleyen kaydın yaşı, işleme gecikmesi
+@router.get("/outbox")
+async def get_outbox_stats(db: AsyncSession = Depends(get_db)):
+    return await outbox_stats(db)
@@ -1,61 +1,204 @@
 # routers/notification.py
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, func, update
 from sqlalchemy.future import select
 from typing import List
-from database import get_db
+from database import get_db, get_read_db
+from core.fast_json import fast_json, response_columns
+from core.pagination import Page, finish_page, page_params, paginate
 from models.notification import Notification
-from schemas.notification import NotificationCreate, NotificationResponse, NotificationUpdate
+from models.user import User
+from core.security import get_current_user
+from schemas.notification import (
+    NotificationBulkResponse, NotificationCreate, NotificationIds, NotificationResponse, NotificationUpdate,
+    UnreadCountResponse,
+)
+from services.notification_events import (
+    get_unread_count, notification_event_data, notification_event_stream, publish_notification_event,
+)
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
-# Yeni bir bildirim oluşturma
+NOTIFICATION_RESPONSE_COLUMNS = response_columns(NotificationResponse, Notification.__table__)
+
+# Yalnızca oturumdaki kullanıcının bildirimi; başkasınınki yokmuş gibi 404
+async def get_own_notification(db: AsyncSession, notification_id: int, user: User) -> Notification:
+    result = await db.execute(
+        select(Notification).where(Notification.id == notification_id, Notification.user_id == user.id)
+    )
+    notification = result.scalar_one_or_none()
+    if not notification:
+        raise HTTPException(status_code=404, detail="Notification not found")
+    return notification
+
+# Yeni bir bildirim oluşturma; yalnızca oturumdaki kullanıcının kendisine
 @router.post("/", response_model=NotificationResponse, status_code=201)
-async def create_notification(notification: NotificationCreate, db: AsyncSession = Depends(get_db)):
+async def create_notification(
+    notification: NotificationCreate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    if notification.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Başka bir kullanıcı adına bildirim oluşturulamaz")
     db_notification = Notification(**notification.dict())
     db.add(db_notification)
     await db.commit()
     await db.refresh(db_notification)
+    await publish_notification_event(
+        db, db_notification.user_id, "notification.created", notification_event_data(db_notification)
+    )
     return db_notification
 
-# Tüm bildirimleri listeleme (isteğe bağlı user_id ve is_read filtresi)
+# Oturumdaki kullanıcının bildirimleri (isteğe bağlı is_read filtresi), en yeniden eskiye sayfalı
 @router.get("/", response_model=List[NotificationResponse])
 async def get_notifications(
-    user_id: int = None,
+    response: Response,
     is_read: bool = None,
-    db: AsyncSession = Depends(get_db)
+    page: Page = Depends(page_params),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    query = select(Notification)
-    if user_id is not None:
-        query = query.where(Notification.user_id == user_id)
+    query = select(*NOTIFICATION_RESPONSE_COLUMNS).where(Notification.user_id == current_user.id)
     if is_read is not None:
         query = query.where(Notification.is_read == is_read)
     
-    result = await db.execute(query)
-    notifications = result.scalars().all()
-    if not notifications:
-        return []
-    return notifications
+    result = await db.execute(paginate(query, Notification.id, page, descending=True))
+    notifications = finish_page(result.all(), page, response)
+    return fast_json([notification._asdict() for notification in notifications], response)
+
+# Oturumdaki kullanıcının okunmamış bildirim sayısı; saymak yerine users tablosundaki sayaçtan okunur
+@router.get("/unread-count", response_model=UnreadCountResponse)
+async def get_unread_notification_count(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    count = await get_unread_count(db, current_user.id)
+    if count is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return {"user_id": current_user.id, "unread_count": count}
+
+# Oturumdaki kullanıcının bildirimlerini Server-Sent Events olarak yayınlar: yeni, güncellenen
+# ve silinen bildirimler; her olay güncel okunmamış sayısını da taşır
+@router.get("/stream")
+async def stream_notifications(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    user_id = current_user.id
+    count = await get_unread_count(db, user_id)
+    if count is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    # Akış boyunca bağlantı havuzundan bağlantı tutulmasın
+    await db.close()
+    return StreamingResponse(
+        notification_event_stream(request, user_id, count),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+# Toplu işlemler: her biri tek UPDATE/DELETE ifadesidir, etkilenen satır sayısını döner.
+# Yalnızca oturumdaki kullanıcının bildirimlerine dokunur; başka kullanıcıya ait id'ler
+# sessizce atlanır. Okunmamış sayaçları notifications trigger'larıyla aynı ifade içinde güncellenir.
+
+# Kullanıcının tüm okunmamış bildirimlerini okundu yap
+@router.post("/mark-all-read", response_model=NotificationBulkResponse)
+async def mark_all_notifications_read(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    user_id = current_user.id
+    result = await db.execute(
+        update(Notification)
+        .where(Notification.user_id == user_id, Notification.is_read == False)
+        .values(is_read=True, updated_at=func.now())
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    if result.rowcount:
+        await publish_notification_event(db, user_id, "notifications.read_all", {})
+    return {"affected": result.rowcount}
+
+# Verilen bildirimleri okundu yap
+@router.post("/mark-read", response_model=NotificationBulkResponse)
+async def mark_notifications_read(
+    body: NotificationIds,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    user_id = current_user.id
+    result = await db.execute(
+        update(Notification)
+        .where(Notification.user_id == user_id, Notification.id.in_(body.ids), Notification.is_read == False)
+        .values(is_read=True, updated_at=func.now())
+        .returning(Notification.id)
+        .execution_options(synchronize_session=False)
+    )
+    ids = list(result.scalars())
+    await db.commit()
+    if ids:
+        await publish_notification_event(db, user_id, "notifications.read", {"ids": ids})
+    return {"affected": len(ids)}
+
+# Verilen bildirimleri sil
+@router.post("/bulk-delete", response_model=NotificationBulkResponse)
+async def delete_notifications(
+    body: NotificationIds,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    user_id = current_user.id
+    result = await db.execute(
+        delete(Notification)
+        .where(Notification.user_id == user_id, Notification.id.in_(body.ids))
+        .returning(Notification.id)
+        .execution_options(synchronize_session=False)
+    )
+    ids = list(result.scalars())
+    await db.commit()
+    if ids:
+        await publish_notification_event(db, user_id, "notifications.deleted", {"ids": ids})
+    return {"affected": len(ids)}
+
+# Kullanıcının `before` tarihinden eski bildirimlerini sil
+@router.delete("/older-than", response_model=NotificationBulkResponse)
+async def delete_notifications_older_than(
+    before: datetime,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    user_id = current_user.id
+    result = await db.execute(
+        delete(Notification)
+        .where(Notification.user_id == user_id, Notification.created_at < before)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    if result.rowcount:
+        await publish_notification_event(db, user_id, "notifications.deleted_before", {"before": before})
+    return {"affected": result.rowcount}
 
 # Belirli bir bildirimi alma
 @router.get("/{notification_id}", response_model=NotificationResponse)
-async def get_notification(notification_id: int, db: AsyncSession = Depends(get_db)):
-    notification = await db.get(Notification, notification_id)
-    if not notification:
-        raise HTTPException(status_code=404, detail="Notification not found")
-    return notification
+async def get_notification(
+    notification_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    return await get_own_notification(db, notification_id, current_user)
 
 # Bildirimi güncelleme (örneğin, okundu olarak işaretleme)
 @router.put("/{notification_id}", response_model=NotificationResponse)
 async def update_notification(
     notification_id: int,
     notification_update: NotificationUpdate,
+    current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    notification = await db.get(Notification, notification_id)
-    if not notification:
-        raise HTTPException(status_code=404, detail="Notification not found")
+    notification = await get_own_notification(db, notification_id, current_user)
     
     # Güncellenecek alanları kontrol et ve uygula
     update_data = notification_update.dict(exclude_unset=True)
@@ -67,26 +210,35 @@ async def update_notification(
     db.add(notification)
     await db.commit()
     await db.refresh(notification)
+    await publish_notification_event(
+        db, notification.user_id, "notification.updated", notification_event_data(notification)
+    )
     return notification
 
 # Bildirimi silme
 @router.delete("/{notification_id}", status_code=204)
-async def delete_notification(notification_id: int, db: AsyncSession = Depends(get_db)):
-    notification = await db.get(Notification, notification_id)
-    if not notification:
-        raise HTTPException(status_code=404, detail="Notification not found")
+async def delete_notification(
+    notification_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    notification = await get_own_notification(db, notification_id, current_user)
     
     await db.delete(notification)
     await db.commit()
+    await publish_notification_event(db, notification.user_id, "notification.deleted", {"id": notification_id})
     return None
 
 @router.put("/{notification_id}/read", response_model=NotificationResponse)
-async def mark_notification_as_read(notification_id: int, db: AsyncSession = Depends(get_db)):
-    notification = await db.get(Notification, notification_id)
-    if not notification:
-        raise HTTPException(status_code=404, detail="Notification not found")
+async def mark_notification_as_read(
+    notification_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    notification = await get_own_notification(db, notification_id, current_user)
     # Bildirimi sil
     await db.delete(notification)
     await db.commit()
+    await publish_notification_event(db, notification.user_id, "notification.deleted", {"id": notification_id})
     # Silindiği için response olarak None dönebiliriz veya özel bir mesaj dönebiliriz
     return None
\ No newline at end of file
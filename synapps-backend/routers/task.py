@@ -1,47 +1,119 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import List
-from database import get_db
+from typing import List, Optional
+from database import get_db, get_read_db
+from core.fast_json import fast_json
+from core.pagination import Page, finish_page, page_params, paginate
+from models.column import Column
 from models.task import Task, TaskStatus
-from schemas.task import TaskCreate, TaskResponse, TaskUpdate
+from schemas.task import TaskBatchMove, TaskCreate, TaskPositionResponse, TaskResponse, TaskSearchResult, TaskUpdate
+from core.board_access import get_board_roles, require_board_access, require_column_access
+from core.security import get_current_user
+from models.user import User
+from services.board_events import publish_board_event, publish_cleared_dependencies, task_event_data
+from services.board_snapshot import TASK_RESPONSE_COLUMNS
+from services.board_version import bump_board_version, bump_board_version_for_columns
+from services.ordering import task_rank_at
+from services.task_moves import apply_task_moves
+from services.task_dependencies import check_task_dependency, clear_cross_board_dependencies
+from services.task_search import search_cursor_extra, search_tasks
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
-# Yeni görev oluşturma
+# Yeni görev oluşturma (kolonun sonuna eklenir)
 @router.post("/", response_model=TaskResponse, status_code=201)
-async def create_task(task: TaskCreate, db: AsyncSession = Depends(get_db)):
-    db_task = Task(**task.dict())
+async def create_task(
+    task: TaskCreate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    board_id = await require_column_access(db, current_user, task.column_id)
+    if task.dependency_id is not None:
+        await check_task_dependency(db, None, task.dependency_id, board_id)
+    db_task = Task(**task.dict(), rank=await task_rank_at(db, task.column_id))
     db.add(db_task)
+    versions = await bump_board_version_for_columns(db, task.column_id)
     await db.commit()
     await db.refresh(db_task)
+    for board_id, version in versions.items():
+        publish_board_event(board_id, version, "task.created", task_event_data(db_task))
     return db_task
 
+# Birden fazla görevi (kolonlar arası dahil) tek transaction'da taşıma.
+# Taşınan görevlerin yeni kolon ve rank değerleri döner.
+@router.post("/batch-move", response_model=List[TaskPositionResponse])
+async def batch_move_tasks(
+    batch: TaskBatchMove,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    moved, board_moves, cleared, versions = await apply_task_moves(db, batch.moves, current_user)
+    await db.commit()
+    for board_id, version in versions.items():
+        if board_id in board_moves:
+            publish_board_event(board_id, version, "tasks.moved", board_moves[board_id])
+    publish_cleared_dependencies(cleared, versions)
+    return moved
+
 # Tüm görevleri listeleme (isteğe bağlı filtreleme: column_id, assigned_user_id)
+# Sayfalıdır: devamı varsa X-Next-Cursor başlığı döner, sonraki sayfa için ?cursor= ile gönderilir
 @router.get("/", response_model=List[TaskResponse])
 async def get_tasks(
+    response: Response,
     column_id: int = None,
     assigned_user_id: int = None,
-    db: AsyncSession = Depends(get_db)
+    page: Page = Depends(page_params),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    query = select(Task)
+    query = select(*TASK_RESPONSE_COLUMNS)
     if column_id is not None:
+        await require_column_access(db, current_user, column_id)
         query = query.where(Task.column_id == column_id)
+    else:
+        # Kolon filtresi yoksa yalnızca erişilebilen board'ların görevleri
+        board_ids = list(await get_board_roles(db, current_user.id))
+        query = query.join(Column, Column.id == Task.column_id).where(Column.board_id.in_(board_ids))
     if assigned_user_id is not None:
         query = query.where(Task.assigned_user_id == assigned_user_id)
     
-    result = await db.execute(query)
-    tasks = result.scalars().all()
+    result = await db.execute(paginate(query, Task.id, page))
+    tasks = finish_page(result.all(), page, response)
     if not tasks:
         raise HTTPException(status_code=404, detail="No tasks found")
-    return tasks
+    return fast_json([task._asdict() for task in tasks], response)
+
+# Tam metin arama (websearch sözdizimi: "tam ifade", -hariç, or). board_id verilmezse
+# kullanıcının erişebildiği tüm board'larda arar. Sonuçlar skora göre sıralı ve sayfalıdır.
+@router.get("/search", response_model=List[TaskSearchResult])
+async def search_tasks_route(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    board_id: Optional[int] = None,
+    page: Page = Depends(page_params),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    if board_id is not None:
+        await require_board_access(db, current_user, board_id)
+        board_ids = [board_id]
+    else:
+        board_ids = list(await get_board_roles(db, current_user.id))
+    rows = await search_tasks(db, q, board_ids, page)
+    return finish_page(rows, page, response, search_cursor_extra)
 
 # Belirli bir görevi alma
 @router.get("/{task_id}", response_model=TaskResponse)
-async def get_task(task_id: int, db: AsyncSession = Depends(get_db)):
+async def get_task(
+    task_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
     task = await db.get(Task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
+    await require_column_access(db, current_user, task.column_id)
     return task
 
 # Görevi güncelleme (örneğin, durum değiştirme veya atama yapma)
@@ -49,67 +121,101 @@ async def get_task(task_id: int, db: AsyncSession = Depends(get_db)):
 async def update_task(
     task_id: int,
     task_update: TaskUpdate,
+    current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     try:
-        # Tüm işlemleri tek bir transaction içinde yap
-        async with db.begin():
-            # Mevcut görevi bul
-            result = await db.execute(select(Task).where(Task.id == task_id))
-            task = result.scalar_one_or_none()
-            if not task:
-                raise HTTPException(status_code=404, detail="Görev bulunamadı")
-
-            # Görevi güncelle
-            update_data = task_update.dict(exclude_unset=True)
-            for field, value in update_data.items():
-                setattr(task, field, value)
-
-            # Eğer position değiştiyse, aynı sütundaki diğer görevlerin pozisyonlarını güncelle
-            if task_update.position is not None:
-                # Aynı sütundaki diğer görevleri bul ve pozisyonları güncelle
-                result = await db.execute(
-                    select(Task)
-                    .where(Task.column_id == task.column_id)
-                    .where(Task.id != task.id)
-                    .order_by(Task.position)
-                )
-                other_tasks = result.scalars().all()
-
-                # Pozisyonları güncelle
-                for idx, other_task in enumerate(other_tasks):
-                    if idx >= task_update.position:
-                        other_task.position = idx + 1
-                    else:
-                        other_task.position = idx
-
-            await db.flush()
-            await db.refresh(task)
-            return task
+        # Mevcut görevi bul
+        result = await db.execute(select(Task).where(Task.id == task_id))
+        task = result.scalar_one_or_none()
+        if not task:
+            raise HTTPException(status_code=404, detail="Görev bulunamadı")
 
+        previous_column_id = task.column_id
+        source_board_id = board_id = await require_column_access(db, current_user, previous_column_id)
+        if task_update.column_id is not None and task_update.column_id != previous_column_id:
+            board_id = await require_column_access(db, current_user, task_update.column_id)
+
+        # Görevi güncelle
+        update_data = task_update.dict(exclude_unset=True)
+        if update_data.get("dependency_id") is not None and update_data["dependency_id"] != task.dependency_id:
+            await check_task_dependency(db, task.id, update_data["dependency_id"], board_id)
+        for field, value in update_data.items():
+            setattr(task, field, value)
+
+        # Sıra veya kolon değiştiyse yalnızca bu görevin rank'i yeniden hesaplanır;
+        # kolondaki diğer görevlere dokunulmaz
+        if task_update.position is not None or task.column_id != previous_column_id:
+            task.rank = await task_rank_at(
+                db, task.column_id, task_update.position, exclude_task_id=task.id
+            )
+
+        # Board değiştiyse iki yöndeki board'lar arası bağımlılıklar kaldırılır
+        cleared = {}
+        if board_id != source_board_id:
+            cleared = await clear_cross_board_dependencies(db, [task.id])
+
+        # Tüm değişiklikler tek transaction'da commit edilir
+        versions = await bump_board_version_for_columns(db, previous_column_id, task.column_id)
+        for cleared_board_id in cleared.keys() - versions.keys():
+            versions[cleared_board_id] = await bump_board_version(db, cleared_board_id)
+        await db.commit()
+        await db.refresh(task)
+
+        # Başka board'a taşınan görevin içeriği yalnızca hedef board'a gider; kaynak board'a
+        # yalnızca id'siyle board'dan çıktığı bildirilir (toplu taşımadaki tasks.moved gibi)
+        if board_id != source_board_id:
+            publish_board_event(source_board_id, versions.get(source_board_id), "tasks.moved", [
+                {"id": task.id, "column_id": None, "rank": None},
+            ])
+        publish_board_event(board_id, versions.get(board_id), "task.updated", task_event_data(task))
+        publish_cleared_dependencies(cleared, versions)
+        return task
+
+    except HTTPException:
+        await db.rollback()
+        raise
     except Exception as e:
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"Görev güncellenirken bir hata oluştu: {str(e)}")
 
 # Görevi silme
 @router.delete("/{task_id}", status_code=204)
-async def delete_task(task_id: int, db: AsyncSession = Depends(get_db)):
+async def delete_task(
+    task_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
     task = await db.get(Task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
+    await require_column_access(db, current_user, task.column_id)
     
     await db.delete(task)
+    versions = await bump_board_version_for_columns(db, task.column_id)
     await db.commit()
+    for board_id, version in versions.items():
+        publish_board_event(board_id, version, "task.deleted", {"id": task_id, "column_id": task.column_id})
     return None
 
 # Ek Özellik: Görevi belirli bir duruma göre filtreleme
 @router.get("/by-status/", response_model=List[TaskResponse])
 async def get_tasks_by_status(
+    response: Response,
     status: TaskStatus,
-    db: AsyncSession = Depends(get_db)
+    board_id: int = None,
+    page: Page = Depends(page_params),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    result = await db.execute(select(Task).where(Task.status == status))
-    tasks = result.scalars().all()
+    query = select(*TASK_RESPONSE_COLUMNS).where(Task.status == status).join(Column, Column.id == Task.column_id)
+    if board_id is not None:
+        await require_board_access(db, current_user, board_id)
+        query = query.where(Column.board_id == board_id)
+    else:
+        query = query.where(Column.board_id.in_(list(await get_board_roles(db, current_user.id))))
+    result = await db.execute(paginate(query, Task.id, page))
+    tasks = finish_page(result.all(), page, response)
     if not tasks:
         raise HTTPException(status_code=404, detail=f"No tasks found with status: {status}")
-    return tasks
\ No newline at end of file
+    return fast_json([task._asdict() for task in tasks], response)
\ No newline at end of file
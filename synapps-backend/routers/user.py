@@ -1,36 +1,48 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from database import get_db
+from database import get_db, get_read_db
 from models.user import User
-from models.project_board import ProjectBoard
-from models.board_member import BoardMember, RoleType
-from models.task import Task
-from models.notification import Notification
-from models.session import Session
+from models.user_deletion import UserDeletion
+from schemas.user import UserDeletionResponse
+from core.security import get_current_user
+from services.user_deletion import (
+    delete_user_rows, forget_deleted_user, is_large_account, schedule_user_deletion,
+)
 
 router = APIRouter(prefix="/users", tags=["users"])
 
-@router.delete("/{user_id}", status_code=204)
-async def delete_user(user_id: int, db: AsyncSession = Depends(get_db)):
-    user = await db.get(User, user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
+# Kullanıcı yalnızca kendi hesabını silebilir. Küçük hesaplar istek içinde iki DELETE ile
+# silinir (204); büyük hesaplar arka plana alınır ve 202 ile takip kaydı döner.
+@router.delete("/{user_id}", status_code=204, responses={202: {"model": UserDeletionResponse}})
+async def delete_user(
+    user_id: int,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    if user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Yalnızca kendi hesabınızı silebilirsiniz")
+    email = current_user.email
 
-    # 1. Owner olduğu tüm board'ları sil
-    result = await db.execute(select(ProjectBoard).where(ProjectBoard.user_id == user_id))
-    owned_boards = result.scalars().all()
-    for board in owned_boards:
-        await db.delete(board)
+    if await is_large_account(db, user_id):
+        deletion = await schedule_user_deletion(db, user_id)
+        await db.commit()
+        await db.refresh(deletion)
+        response.status_code = 202
+        response.headers["Location"] = f"/users/deletions/{deletion.id}"
+        return UserDeletionResponse.model_validate(deletion, from_attributes=True)
 
-    # 2. Üye olduğu board'lardan sadece üyeliği sil (owner değilse)
-    result = await db.execute(select(BoardMember).where(BoardMember.user_id == user_id))
-    memberships = result.scalars().all()
-    for member in memberships:
-        if member.role != RoleType.OWNER:
-            await db.delete(member)
-
-    # 3. Kullanıcıya ait diğer ilişkili veriler (bildirimler, görevler, sessionlar, vs.) zaten CASCADE ile silinir
-    await db.delete(user)
+    board_ids, versions = await delete_user_rows(db, user_id)
     await db.commit()
-    return None 
\ No newline at end of file
+    # Silinen kullanıcının önbellekteki kaydını düşür, etkilenen board'lara yayınla
+    forget_deleted_user(user_id, email, board_ids, versions)
+    return None
+
+# Arka plandaki silme işinin durumu; kullanıcı silindikten sonra da token gerektirmeden
+# (tahmin edilemez id ile) sorgulanabilir
+@router.get("/deletions/{deletion_id}", response_model=UserDeletionResponse)
+async def get_user_deletion(deletion_id: str, db: AsyncSession = Depends(get_read_db)):
+    deletion = await db.get(UserDeletion, deletion_id)
+    if not deletion:
+        raise HTTPException(status_code=404, detail="Silme işi bulunamadı")
+    return deletion
@@ -1,23 +1,99 @@
 # schemas/board.py
 from pydantic import BaseModel
-from datetime import datetime
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+from schemas.column import ColumnResponse
+from schemas.board_member import BoardMemberWithUserResponse
 
+# template: hazır şablon anahtarı (GET /boards/templates); template_id: kullanıcı şablonu board'u
 class ProjectBoardCreate(BaseModel):
     name: str
     user_id: int
     description: str = None
+    template: Optional[str] = None
+    template_id: Optional[int] = None
 
 class ProjectBoardResponse(BaseModel):
     id: int
     name: str
     user_id: int
     created_at: datetime
-    description: str = None
+    description: Optional[str] = None
+    is_template: bool = False
 
     class Config:
         orm_mode = True
 
+# Sahiplik bu uçla devredilemez (üyelik ve yetki önbelleği güncellenmez); user_id gibi
+# bilinmeyen alanlar 422 ile reddedilir
 class ProjectBoardUpdate(BaseModel):
     name: str = None
-    user_id: int = None
-    description: str = None
\ No newline at end of file
+    description: str = None
+    is_template: Optional[bool] = None
+
+    class Config:
+        extra = "forbid"
+
+# POST /boards/{board_id}/clone
+class ProjectBoardClone(BaseModel):
+    name: str
+    description: Optional[str] = None
+    include_tasks: bool = True
+    is_template: bool = False
+
+class ProjectBoardCloneResponse(ProjectBoardResponse):
+    columns_copied: int
+    tasks_copied: int
+
+# Hazır şablonlarda key, kullanıcı şablonlarında (board) id dolu
+class BoardTemplateResponse(BaseModel):
+    id: Optional[int] = None
+    key: Optional[str] = None
+    name: str
+    description: Optional[str] = None
+    columns: List[str] = []
+    task_count: int = 0
+
+# GET /boards/{board_id}/full: board + sıralı kolonlar/görevler + üyeler tek yanıtta
+class ProjectBoardSnapshotResponse(ProjectBoardResponse):
+    columns: List[ColumnResponse] = []
+    members: List[BoardMemberWithUserResponse] = []
+
+# POST /boards/{board_id}/import: atlanan satırlar satır numarasıyla (ilk 100)
+class BoardImportReport(BaseModel):
+    columns_created: int
+    tasks_created: int
+    skipped: int
+    errors: List[Dict[str, Any]] = []
+    warnings: List[Dict[str, Any]] = []
+
+# GET /boards/summary: panodaki ilerleme sayıları
+class ProjectBoardSummaryResponse(BaseModel):
+    id: int
+    name: str
+    user_id: int
+    role: str
+    version: int
+    task_counts: Dict[str, int] = {}
+    total_tasks: int = 0
+    overdue_tasks: int = 0
+    member_count: int = 0
+
+# GET /boards/{board_id}/flow-metrics: günlük tamamlanan görevler, ortalama süreler (saniye)
+# ve gün sonunda her durumdaki görev sayısı (cumulative flow)
+class FlowMetricsDay(BaseModel):
+    day: date
+    completed: int = 0
+    cycle_time_avg_seconds: Optional[float] = None
+    lead_time_avg_seconds: Optional[float] = None
+    wip: Dict[str, int] = {}
+
+class BoardFlowMetricsResponse(BaseModel):
+    board_id: int
+    start: date
+    end: date
+    rolled_up_at: Optional[datetime] = None
+    completed: int = 0
+    cycle_time_avg_seconds: Optional[float] = None
+    lead_time_avg_seconds: Optional[float] = None
+    days: List[FlowMetricsDay] = []
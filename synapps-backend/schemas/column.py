@@ -14,6 +14,7 @@ class ColumnResponse(BaseModel):
     title: str
     board_id: int
     position: int
+    rank: str
     created_at: datetime
     tasks: List[TaskResponse] = []
 
@@ -1,6 +1,7 @@
 # schemas/notification.py
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
+from typing import List
 
 class NotificationCreate(BaseModel):
     user_id: int
@@ -27,4 +28,15 @@ class NotificationResponse(BaseModel):
 
 class NotificationUpdate(BaseModel):
     is_read: bool = None
-    message: str = None
\ No newline at end of file
+    message: str = None
+
+class UnreadCountResponse(BaseModel):
+    user_id: int
+    unread_count: int
+
+# Toplu işlemler: tek istekte en fazla 1000 bildirim
+class NotificationIds(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=1000)
+
+class NotificationBulkResponse(BaseModel):
+    affected: int
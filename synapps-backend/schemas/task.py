@@ -1,8 +1,8 @@
 # schemas/task.py
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 from models.task import TaskStatus
-from typing import Optional
+from typing import List, Optional
 
 class TaskCreate(BaseModel):
     title: str
@@ -27,6 +27,7 @@ class TaskResponse(BaseModel):
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
     dependency_id: Optional[int] = None
+    rank: str
 
     class Config:
         orm_mode = True
@@ -41,4 +42,70 @@ class TaskUpdate(BaseModel):
     priority: Optional[str] = None
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
-    dependency_id: Optional[int] = None
\ No newline at end of file
+    dependency_id: Optional[int] = None
+# Toplu taşıma: position, hedef kolondaki 0 tabanlı sıradır; taşımalar istek sırasıyla uygulanır
+class TaskMove(BaseModel):
+    task_id: int
+    column_id: int
+    position: int = Field(..., ge=0)
+
+class TaskBatchMove(BaseModel):
+    moves: List[TaskMove] = Field(..., min_length=1, max_length=1000)
+
+class TaskPositionResponse(BaseModel):
+    id: int
+    column_id: int
+    rank: str
+
+# GET /boards/{board_id}/dependencies: board'un görevleri (bağımlılıklar yalnızca aynı board içinde)
+class DependencyNode(BaseModel):
+    id: int
+    title: str
+    column_id: int
+    board_id: int
+    status: TaskStatus
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    dependency_id: Optional[int] = None
+
+# critical_path: kökten sona görev id'leri; cycles: eski veride kalmış döngüler
+class TaskDependencyGraphResponse(BaseModel):
+    board_id: int
+    nodes: List[DependencyNode] = []
+    critical_path: List[int] = []
+    critical_path_seconds: float = 0
+    cycles: List[List[int]] = []
+
+class CriticalPathResponse(BaseModel):
+    board_id: int
+    tasks: List[DependencyNode] = []
+    duration_seconds: float = 0
+
+# GET /boards/{board_id}/timeline: zaman çizelgesinin çizdiği alanlar
+class TimelineTask(BaseModel):
+    id: int
+    title: str
+    column_id: int
+    status: TaskStatus
+    priority: str
+    assigned_user_id: Optional[int] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    dependency_id: Optional[int] = None
+
+    class Config:
+        orm_mode = True
+
+# Arama sonucu: vurgular eşleşen kelimeleri <mark> ile sarar
+class TaskSearchResult(BaseModel):
+    id: int
+    title: str
+    column_id: int
+    board_id: int
+    status: TaskStatus
+    score: float
+    title_highlight: str
+    description_highlight: str
+
+    class Config:
+        orm_mode = True
@@ -1,6 +1,7 @@
 # schemas/user.py
 from pydantic import BaseModel, EmailStr
 from datetime import datetime
+from typing import Optional
 
 #kayıt için
 class UserCreate(BaseModel):
@@ -19,6 +20,21 @@ class UserResponse(BaseModel):
     class Config:
         orm_mode = True
 
+# Arka planda silinen hesap: DELETE /users/{id} 202 ile bunu döner, durum /users/deletions/{id}'den izlenir
+class UserDeletionResponse(BaseModel):
+    id: str
+    user_id: int
+    status: str
+    tasks_deleted: int
+    notifications_deleted: int
+    boards_deleted: int
+    created_at: datetime
+    updated_at: datetime
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
+
 #kullanıcı bilgisi güncelleme
 class UserUpdate(BaseModel):
     name: str = None
@@ -0,0 +1,113 @@
+# scripts/bench_board_events.py
+# Tek worker'da binlerce boşta board olay akışı (GET /boards/{id}/events) dinleyicisinin
+# maliyetini ölçen benchmark. Veritabanı gerekmez: her dinleyici, StreamingResponse'un
+# yaptığı gibi, core/events.sse_stream üretecini kendi task'ında tüketir. Ölçülenler: dinleyici
+# başına bellek, boşta ve heartbeat sırasında event loop gecikmesi, her board'a bir olay
+# yayınlamanın süresi ve olayların tüm dinleyicilere ulaşma süresi.
+#
+#   cd synapps-backend && python scripts/bench_board_events.py --subscribers 10000 --boards 500
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DEBUG", "false")
+
+def rss_mb() -> float:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+# Bağlantısı açık kalan bir istemci gibi davranır
+class IdleRequest:
+    async def is_disconnected(self) -> bool:
+        return False
+
+async def consume(stream, received: list, index: int) -> None:
+    async for chunk in stream:
+        if chunk.startswith("id:"):
+            received[index] += 1
+
+async def loop_lag(seconds: float, interval: float = 0.01) -> list:
+    lags = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append((time.perf_counter() - started - interval) * 1000)
+    return sorted(lags)
+
+def describe(lags: list) -> str:
+    p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+    return f"p50 {statistics.median(lags):6.2f} ms  p99 {p99:6.2f} ms  max {lags[-1]:6.2f} ms"
+
+async def run(subscribers: int, boards: int, idle_seconds: float, ramp: float) -> None:
+    from config import settings
+    from core.events import sse_stream
+    from services.board_events import board_events, publish_board_event
+
+    print(
+        f"{subscribers} subscribers on {boards} boards, connecting over {ramp:g} s, "
+        f"heartbeat every {settings.EVENT_HEARTBEAT_SECONDS:g} s"
+    )
+    print(f"no subscribers   loop lag {describe(await loop_lag(1))}")
+
+    rss_before = rss_mb()
+    tracemalloc.start()
+    heap_before = tracemalloc.get_traced_memory()[0]
+    received = [0] * subscribers
+    request = IdleRequest()
+    # Gerçek istemciler zamana yayılarak bağlanır; ramp=0 hepsini aynı anda bağlar ve
+    # heartbeat'lerini aynı ana toplar (en kötü durum)
+    tasks = []
+    for i in range(subscribers):
+        tasks.append(asyncio.create_task(consume(sse_stream(request, board_events, i % boards), received, i)))
+        if ramp and i % 100 == 99:
+            await asyncio.sleep(ramp * 100 / subscribers)
+    await asyncio.sleep(0.5)
+    heap = tracemalloc.get_traced_memory()[0] - heap_before
+    tracemalloc.stop()
+    rss = rss_mb() - rss_before
+    print(
+        f"memory           {heap / subscribers / 1024:.1f} KiB Python heap per subscriber, "
+        f"RSS +{rss:.0f} MiB ({rss * 1024 / subscribers:.1f} KiB per subscriber)"
+    )
+    print(f"idle             loop lag {describe(await loop_lag(idle_seconds))}")
+
+    started = time.perf_counter()
+    for board_id in range(boards):
+        publish_board_event(board_id, 1, "task.updated", {"id": board_id, "title": "Task", "status": "todo"})
+    published = time.perf_counter() - started
+    while sum(received) < subscribers:
+        await asyncio.sleep(0.001)
+    delivered = time.perf_counter() - started
+    print(
+        f"fan-out          {boards} events published in {published * 1000:.1f} ms, "
+        f"all {subscribers} subscribers received theirs in {delivered * 1000:.1f} ms"
+    )
+    print(f"broker           {board_events.stats()}")
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Idle board event stream subscribers per worker")
+    parser.add_argument("--subscribers", type=int, default=10000)
+    parser.add_argument("--boards", type=int, default=500)
+    parser.add_argument("--idle-seconds", type=float, default=20, help="loop lag is measured over this window")
+    parser.add_argument("--heartbeat", type=float, help="override EVENT_HEARTBEAT_SECONDS for the run")
+    parser.add_argument("--ramp", type=float, help="seconds over which subscribers connect (default: one heartbeat)")
+    args = parser.parse_args()
+    # Ayar config import edilirken okunur, bu yüzden import'tan önce yazılır
+    if args.heartbeat is not None:
+        os.environ["EVENT_HEARTBEAT_SECONDS"] = str(args.heartbeat)
+    from config import settings
+    ramp = settings.EVENT_HEARTBEAT_SECONDS if args.ramp is None else args.ramp
+    asyncio.run(run(args.subscribers, args.boards, args.idle_seconds, ramp))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# scripts/bench_board_snapshot.py
+# GET /boards/{id}/full tek çağrısını, board açarken eskiden yapılan üç çağrılık diziyle
+# (GET /boards/{id}, GET /columns/?board_id=, GET /board-members/?board_id=) karşılaştırır.
+# DATABASE_URL son migration'a yükseltilmiş bir veritabanını göstermeli; benchmark kendi
+# kullanıcılarını ve board'unu SQL ile oluşturur, sonunda siler.
+#
+#   cd synapps-backend && python scripts/bench_board_snapshot.py --columns 5 --tasks 5000
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DEBUG", "false")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from config import settings
+from core.security import create_access_token
+
+# Sahip (bench-0) + üyeler, board, kolonlar ve görevler; kullanıcı e-postaları `tag` ile işaretlenir
+SEED = [
+    "INSERT INTO board_members (board_id, user_id, role) "
+    "SELECT :board_id, id, CASE WHEN email = :owner THEN 'OWNER' ELSE 'MEMBER' END::roletype "
+    "FROM users WHERE email LIKE :pattern",
+    "INSERT INTO columns (title, board_id, position, rank) "
+    "SELECT 'Column ' || g, :board_id, g, chr(65 + g) FROM generate_series(0, :columns - 1) g",
+    "INSERT INTO tasks (title, description, column_id, status, position, priority, rank) "
+    "SELECT 'Task ' || g, repeat('Lorem ipsum ', 4), c.id, 'todo', g, 'medium', 'V' || lpad(g::text, 6, '0') || '1' "
+    "FROM columns c, generate_series(1, :per_column) g WHERE c.board_id = :board_id",
+    "ANALYZE tasks",
+]
+
+def owner_email(tag: str) -> str:
+    return f"bench-0-{tag}@example.com"
+
+async def seed(tag: str, columns: int, per_column: int, members: int) -> int:
+    params = {
+        "tag": tag, "owner": owner_email(tag), "pattern": f"bench-%-{tag}@example.com",
+        "columns": columns, "per_column": per_column, "members": members,
+    }
+    engine = create_async_engine(settings.DATABASE_URL)
+    async with engine.begin() as connection:
+        await connection.execute(text(
+            "INSERT INTO users (name, email, hashed_password) "
+            "SELECT 'bench', 'bench-' || g || '-' || :tag || '@example.com', 'x' FROM generate_series(0, :members) g"
+        ), params)
+        params["board_id"] = (await connection.execute(text(
+            "INSERT INTO project_boards (name, user_id) SELECT 'bench', id FROM users WHERE email = :owner RETURNING id"
+        ), params)).scalar_one()
+        for statement in SEED:
+            await connection.execute(text(statement), params)
+    await engine.dispose()
+    return params["board_id"]
+
+async def cleanup(tag: str) -> None:
+    engine = create_async_engine(settings.DATABASE_URL)
+    async with engine.begin() as connection:
+        pattern = {"pattern": f"bench-%-{tag}@example.com"}
+        await connection.execute(text(
+            "DELETE FROM project_boards WHERE user_id IN (SELECT id FROM users WHERE email LIKE :pattern)"
+        ), pattern)
+        await connection.execute(text("DELETE FROM users WHERE email LIKE :pattern"), pattern)
+    await engine.dispose()
+
+def timed(call, repeat: int) -> float:
+    call()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Board snapshot vs. three-call board load")
+    parser.add_argument("--columns", type=int, default=5)
+    parser.add_argument("--tasks", type=int, default=5000, help="tasks on the board, spread over the columns")
+    parser.add_argument("--members", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    tag = uuid.uuid4().hex[:12]
+    per_column = args.tasks // args.columns
+    board_id = asyncio.run(seed(tag, args.columns, per_column, args.members))
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': owner_email(tag)})}"}
+    try:
+        import main as app_module
+        with TestClient(app_module.app) as client:
+            def get(url: str) -> int:
+                response = client.get(url, headers=headers)
+                assert response.status_code == 200, (url, response.status_code, response.text[:200])
+                return len(response.content)
+
+            def three_calls() -> int:
+                return (
+                    get(f"/boards/{board_id}")
+                    + get(f"/columns/?board_id={board_id}")
+                    + get(f"/board-members/?board_id={board_id}")
+                )
+
+            def snapshot() -> int:
+                return get(f"/boards/{board_id}/full")
+
+            print(
+                f"board {board_id}: {args.columns} columns, {per_column * args.columns} tasks, "
+                f"{args.members + 1} members; {three_calls()} bytes in three calls, {snapshot()} bytes in /full"
+            )
+            sequence = timed(three_calls, args.repeat)
+            full = timed(snapshot, args.repeat)
+            print(f"three calls    median {sequence:8.1f} ms")
+            print(f"/full          median {full:8.1f} ms  ({sequence / full:.1f}x)")
+    finally:
+        asyncio.run(cleanup(tag))
+
+if __name__ == "__main__":
+    main()
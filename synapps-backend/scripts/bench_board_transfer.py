@@ -0,0 +1,130 @@
+# scripts/bench_board_transfer.py
+# Board içe/dışa aktarmanın (services/board_transfer.py) büyük board'lardaki maliyetini ölçer:
+# POST /boards/{id}/import ile 100.000 görevlik NDJSON yükleme, aynı board'un CSV export'unu
+# başka bir board'a yükleme, karşılaştırma için tek tek POST /tasks/ çağrıları ve export'un
+# süresi ile bellek tepe noktası (10.000 ve 100.000 görevlik board'larda).
+# DATABASE_URL son migration'a yükseltilmiş bir veritabanını göstermeli; benchmark kendi
+# kullanıcısını ve board'larını oluşturur, sonunda siler.
+#
+#   cd synapps-backend && python scripts/bench_board_transfer.py --tasks 100000
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DEBUG", "false")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from config import settings
+from core.security import create_access_token
+from services.board_transfer import export_board_chunks
+
+COLUMNS = 10
+
+def ndjson_body(tasks: int) -> str:
+    lines = [json.dumps({"type": "column", "id": f"c{i}", "title": f"Column {i}"}) for i in range(COLUMNS)]
+    lines += [
+        json.dumps({
+            "type": "task", "id": i, "title": f"Task {i}", "description": "Lorem ipsum dolor sit amet",
+            "column_id": f"c{i % COLUMNS}", "status": "todo", "priority": "medium",
+            "dependency_id": i - 1 if i % 5 else None, "start_date": "2025-01-01T00:00:00",
+        })
+        for i in range(tasks)
+    ]
+    return "\n".join(lines)
+
+async def execute(statement: str, params: dict):
+    engine = create_async_engine(settings.DATABASE_URL)
+    async with engine.begin() as connection:
+        result = (await connection.execute(text(statement), params)).scalars().all()
+    await engine.dispose()
+    return result
+
+# Export akışını HTTP istemcisi tamponlamadan doğrudan tüketir
+async def export(board_id: int, fmt: str, trace: bool) -> tuple:
+    engine = create_async_engine(settings.DATABASE_URL)
+    if trace:
+        tracemalloc.start()
+    started = time.perf_counter()
+    size = 0
+    async for chunk in export_board_chunks(async_sessionmaker(engine, expire_on_commit=False), board_id, fmt):
+        size += len(chunk)
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1] if trace else 0
+    if trace:
+        tracemalloc.stop()
+    await engine.dispose()
+    return elapsed, size, peak
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Board import/export at large board sizes")
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--small", type=int, default=10000, help="smaller board for the export memory comparison")
+    parser.add_argument("--baseline", type=int, default=300, help="tasks created one by one through POST /tasks/")
+    args = parser.parse_args()
+
+    email = f"bench-{uuid.uuid4().hex}@example.com"
+    asyncio.run(execute("INSERT INTO users (name, email, hashed_password) VALUES ('bench', :email, 'x') RETURNING id", {"email": email}))
+    board_ids = asyncio.run(execute(
+        "INSERT INTO project_boards (name, user_id) "
+        "SELECT 'bench ' || g, (SELECT id FROM users WHERE email = :email) FROM generate_series(1, 3) g RETURNING id",
+        {"email": email},
+    ))
+    large, copy, small = sorted(board_ids)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': email})}"}
+    try:
+        import main as app_module
+        with TestClient(app_module.app) as client:
+            def import_body(board_id: int, body: str, content_type: str) -> dict:
+                started = time.perf_counter()
+                response = client.post(
+                    f"/boards/{board_id}/import", content=body, headers={**headers, "content-type": content_type}
+                )
+                assert response.status_code == 200, response.text[:500]
+                elapsed = time.perf_counter() - started
+                report = response.json()
+                print(
+                    f"import {content_type:<21}{report['tasks_created']:>8} tasks in {elapsed:6.2f} s "
+                    f"({report['tasks_created'] / elapsed:8.0f} tasks/s, {len(body) / 2**20:.1f} MiB body)"
+                )
+                return report
+
+            import_body(large, ndjson_body(args.tasks), "application/x-ndjson")
+            csv_body = client.get(f"/boards/{large}/export?format=csv", headers=headers).text
+            import_body(copy, csv_body, "text/csv")
+            import_body(small, ndjson_body(args.small), "application/x-ndjson")
+
+            column_id = client.get(f"/columns/?board_id={small}", headers=headers).json()[0]["id"]
+            started = time.perf_counter()
+            for i in range(args.baseline):
+                response = client.post(
+                    "/tasks/", json={"title": f"One by one {i}", "column_id": column_id}, headers=headers
+                )
+                assert response.status_code < 300, response.text[:500]
+            elapsed = time.perf_counter() - started
+            print(f"POST /tasks/ one by one   {args.baseline:>8} tasks in {elapsed:6.2f} s ({args.baseline / elapsed:8.0f} tasks/s)")
+
+        for board_id, label in ((small, "small"), (large, "large")):
+            for fmt in ("ndjson", "csv"):
+                elapsed, size, _ = asyncio.run(export(board_id, fmt, trace=False))
+                _, _, peak = asyncio.run(export(board_id, fmt, trace=True))
+                print(
+                    f"export {label} {fmt:<7}{size / 2**20:8.1f} MiB in {elapsed:5.2f} s, "
+                    f"peak Python memory {peak / 2**20:5.1f} MiB"
+                )
+    finally:
+        asyncio.run(execute(
+            "DELETE FROM project_boards WHERE user_id = (SELECT id FROM users WHERE email = :email) RETURNING id",
+            {"email": email},
+        ))
+        asyncio.run(execute("DELETE FROM users WHERE email = :email RETURNING id", {"email": email}))
+
+if __name__ == "__main__":
+    main()
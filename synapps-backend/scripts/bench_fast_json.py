@@ -0,0 +1,102 @@
+# scripts/bench_fast_json.py
+# FAST_JSON_RESPONSES hızlı yolunu (core/fast_json.py) standart yolla karşılaştıran mikro benchmark.
+# Veritabanı gerekmez: satırlar, uçların okuduğu biçimde (response_model alanlarıyla dict'ler)
+# bellekte üretilir ve aynı uç iki ayarla çağrılır; iki yolun yanıt gövdesinin aynı olduğu da
+# kontrol edilir.
+#
+#   cd synapps-backend && python scripts/bench_fast_json.py --columns 3 --tasks 5000
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DEBUG", "false")
+
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+from config import settings
+from core.fast_json import fast_json
+from models.task import TaskStatus
+from schemas.column import ColumnResponse
+from schemas.task import TaskResponse
+
+STATUSES = list(TaskStatus)
+
+def make_task(task_id: int, column_id: int) -> dict:
+    created_at = datetime(2025, 1, 1) + timedelta(seconds=task_id)
+    return {
+        "id": task_id,
+        "title": f"Task {task_id}",
+        "description": "Lorem ipsum dolor sit amet " * 4 if task_id % 2 else None,
+        "column_id": column_id,
+        "assigned_user_id": task_id % 7 or None,
+        "status": STATUSES[task_id % len(STATUSES)],
+        "created_at": created_at,
+        "priority": "medium",
+        "start_date": created_at,
+        "end_date": created_at + timedelta(days=3) if task_id % 3 else None,
+        "dependency_id": task_id - 1 if task_id % 5 else None,
+        "rank": f"{task_id:08d}",
+    }
+
+def make_columns(column_count: int, task_count: int) -> List[dict]:
+    columns = []
+    for column_id in range(1, column_count + 1):
+        columns.append({
+            "id": column_id, "title": f"Column {column_id}", "board_id": 1, "position": column_id - 1,
+            "rank": f"{column_id:04d}", "created_at": datetime(2025, 1, 1),
+            "tasks": [
+                make_task(task_id, column_id)
+                for task_id in range(column_id, task_count + 1, column_count)
+            ],
+        })
+    return columns
+
+def build_app(columns: List[dict], tasks: List[dict]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/columns", response_model=List[ColumnResponse])
+    def get_columns(response: Response):
+        return fast_json(columns, response)
+
+    @app.get("/tasks", response_model=List[TaskResponse])
+    def get_tasks(response: Response):
+        return fast_json(tasks, response)
+
+    return app
+
+def measure(client: TestClient, url: str, fast: bool, repeat: int):
+    settings.FAST_JSON_RESPONSES = fast
+    body = client.get(url).content
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        client.get(url)
+        timings.append(time.perf_counter() - started)
+    return body, statistics.median(timings) * 1000
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare FAST_JSON_RESPONSES on and off")
+    parser.add_argument("--columns", type=int, default=3)
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    columns = make_columns(args.columns, args.tasks)
+    tasks = [task for column in columns for task in column["tasks"]]
+    client = TestClient(build_app(columns, tasks))
+    print(f"{args.columns} columns, {args.tasks} tasks, median of {args.repeat} requests")
+    for url in ("/columns", "/tasks"):
+        standard_body, standard_ms = measure(client, url, False, args.repeat)
+        fast_body, fast_ms = measure(client, url, True, args.repeat)
+        print(
+            f"{url:<9} standard {standard_ms:8.1f} ms   fast {fast_ms:8.1f} ms   "
+            f"speedup {standard_ms / fast_ms:4.1f}x   identical body: {standard_body == fast_body}"
+        )
+
+if __name__ == "__main__":
+    main()
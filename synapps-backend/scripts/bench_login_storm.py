@@ -0,0 +1,96 @@
+# scripts/bench_login_storm.py
+# Login fırtınası sırasında şifre işi dışındaki uçların gecikmesini ölçen benchmark.
+# Veritabanı gerekmez: küçük bir uygulama /login (bcrypt doğrulaması password_pool'da,
+# core/security.verify_password_async), /login-inline (aynı doğrulama event loop'ta) ve
+# /ping uçlarını sunar. Eşzamanlı login istemcileri çalışırken /ping düzenli aralıklarla
+# çağrılır; fırtınasız, inline ve havuzlu durumlar için /ping gecikmesi ve login/s yazılır.
+#
+#   cd synapps-backend && python scripts/bench_login_storm.py --clients 16 --seconds 5
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DEBUG", "false")
+
+import httpx
+from fastapi import FastAPI
+from core.password_pool import password_pool
+from core.security import get_password_hash, verify_password, verify_password_async
+
+PASSWORD = "correct horse battery staple"
+
+def build_app(hashed: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/login")
+    async def login():
+        return {"ok": await verify_password_async(PASSWORD, hashed)}
+
+    @app.post("/login-inline")
+    async def login_inline():
+        return {"ok": verify_password(PASSWORD, hashed)}
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+async def storm(client: httpx.AsyncClient, url: str, deadline: float, counter: list) -> None:
+    while time.perf_counter() < deadline:
+        response = await client.post(url)
+        if response.status_code == 200:
+            counter[0] += 1
+
+# Gecikme, isteğin planlandığı andan yanıta kadar ölçülür; event loop bloke olduğunda
+# kaçırılan her probe da bekleme süresiyle birlikte sayılır
+async def probe(client: httpx.AsyncClient, deadline: float, interval: float) -> list:
+    latencies = []
+    due = time.perf_counter()
+    while due < deadline:
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+        await client.get("/ping")
+        now = time.perf_counter()
+        while due <= now and due < deadline:
+            latencies.append((now - due) * 1000)
+            due += interval
+    return latencies
+
+async def run_case(app: FastAPI, url, clients: int, seconds: float, interval: float) -> tuple:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        deadline = time.perf_counter() + seconds
+        counter = [0]
+        storms = [storm(client, url, deadline, counter) for _ in range(clients)] if url else []
+        latencies, *_ = await asyncio.gather(probe(client, deadline, interval), *storms)
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return statistics.median(latencies), p99, latencies[-1], counter[0] / seconds
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Non-auth latency during a login storm")
+    parser.add_argument("--clients", type=int, default=16, help="concurrent login clients")
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--interval", type=float, default=0.02, help="seconds between /ping probes")
+    args = parser.parse_args()
+
+    app = build_app(get_password_hash(PASSWORD))
+    print(
+        f"{args.clients} login clients, {args.seconds:g} s per case, "
+        f"pool: {password_pool.workers} workers + {password_pool.max_queue} queued"
+    )
+    cases = [("no logins", None), ("inline bcrypt", "/login-inline"), ("password pool", "/login")]
+    for name, url in cases:
+        p50, p99, worst, logins = asyncio.run(run_case(app, url, args.clients, args.seconds, args.interval))
+        print(
+            f"{name:<14} /ping p50 {p50:7.1f} ms  p99 {p99:7.1f} ms  max {worst:7.1f} ms  "
+            f"logins/s {logins:6.1f}"
+        )
+    password_pool.shutdown()
+
+if __name__ == "__main__":
+    main()
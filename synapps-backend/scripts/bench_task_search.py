@@ -0,0 +1,97 @@
+# scripts/bench_task_search.py
+# Tam metin görev aramasının (services/task_search.py) büyük veri setindeki gecikmesini ölçer.
+# DATABASE_URL son migration'a yükseltilmiş bir veritabanını göstermeli. Görevler tek bir
+# transaction'da üretilir ve sonunda geri alınır; veritabanında iz kalmaz. Başlık ve açıklamalar
+# 20.000 kelimelik bir sözlükten, birkaç kelimesi çok sık geçecek şekilde çekilir.
+#
+#   cd synapps-backend && python scripts/bench_task_search.py --tasks 1000000
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DEBUG", "false")
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from config import settings
+from core.pagination import Page
+from services.task_search import search_tasks
+
+VOCABULARY = 20000
+# random()^3 küçük sayıları öne çıkarır: w1..w20 çok sık, w10000 üstü nadir
+WORD = f"'w' || floor(power(random(), 3) * {VOCABULARY})::int"
+
+def words(count: int) -> str:
+    return " || ' ' || ".join([WORD] * count)
+
+SEED = [
+    "INSERT INTO users (name, email, hashed_password) VALUES ('bench', :email, 'x')",
+    "INSERT INTO project_boards (name, user_id) "
+    "SELECT 'bench ' || g, (SELECT id FROM users WHERE email = :email) FROM generate_series(1, :boards) g",
+    "INSERT INTO columns (title, board_id, position, rank) "
+    "SELECT 'Column ' || g, b.id, g, chr(65 + g) FROM project_boards b, generate_series(0, 3) g "
+    "WHERE b.user_id = (SELECT id FROM users WHERE email = :email)",
+    "INSERT INTO tasks (title, description, column_id, status, position, priority, rank) "
+    f"SELECT {words(4)}, {words(12)}, "
+    "c.id, 'todo', g, 'medium', 'V' || lpad(g::text, 7, '0') || '1' "
+    "FROM columns c JOIN project_boards b ON b.id = c.board_id, generate_series(1, :per_column) g "
+    "WHERE b.user_id = (SELECT id FROM users WHERE email = :email)",
+    "SELECT gin_clean_pending_list('ix_tasks_search_vector'::regclass)",
+    "ANALYZE columns",
+    "ANALYZE tasks",
+]
+
+# Sondaki "w1" çok sık geçen bir terimdir: eşleşen her satır skorlanır (README'deki uyarı)
+QUERIES = ["w15000", "w3000", "w40", "w3 w900", '"w2 w7"', "w1200 -w5", "w1300 or w1400", "w1"]
+
+async def run(tasks: int, boards: int, repeat: int) -> None:
+    engine = create_async_engine(settings.DATABASE_URL)
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        params = {"email": f"bench-{uuid.uuid4().hex}@example.com", "boards": boards, "per_column": tasks // boards // 4}
+        started = time.perf_counter()
+        for statement in SEED:
+            await connection.execute(text(statement), params)
+        board_ids = (await connection.execute(text(
+            "SELECT b.id FROM project_boards b JOIN users u ON u.id = b.user_id WHERE u.email = :email ORDER BY b.id"
+        ), params)).scalars().all()
+        print(
+            f"seeded {params['per_column'] * 4 * boards} tasks on {boards} boards "
+            f"in {time.perf_counter() - started:.0f} s"
+        )
+
+        db = AsyncSession(bind=connection)
+        print(f"{'query':<18}{'matches':>9}{'all boards':>14}{'one board':>13}")
+        for q in QUERIES:
+            matches = (await connection.execute(text(
+                "SELECT count(*) FROM tasks t JOIN columns c ON c.id = t.column_id "
+                "WHERE c.board_id = ANY(:board_ids) AND t.search_vector @@ websearch_to_tsquery('simple', :q)"
+            ), {"q": q, "board_ids": board_ids})).scalar_one()
+            timings = []
+            for scope in (board_ids, board_ids[:1]):
+                await search_tasks(db, q, scope, Page(20, None))
+                samples = []
+                for _ in range(repeat):
+                    query_started = time.perf_counter()
+                    await search_tasks(db, q, scope, Page(20, None))
+                    samples.append((time.perf_counter() - query_started) * 1000)
+                timings.append(statistics.median(samples))
+            print(f"{q:<18}{matches:>9}{timings[0]:>11.1f} ms{timings[1]:>10.1f} ms")
+        await transaction.rollback()
+    await engine.dispose()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Task search latency on a large generated dataset")
+    parser.add_argument("--tasks", type=int, default=1000000)
+    parser.add_argument("--boards", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run(args.tasks, args.boards, args.repeat))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# scripts/bench_timeline.py
+# Zaman çizelgesi sorgusunun (services/task_timeline.py) büyük board'daki gecikmesini ölçer ve
+# eski yolla, yani board'un tüm görevlerini indirip pencereyi istemcide süzmekle karşılaştırır.
+# DATABASE_URL son migration'a yükseltilmiş bir veritabanını göstermeli. Görevler tek bir
+# transaction'da üretilir ve sonunda geri alınır; veritabanında iz kalmaz.
+#
+#   cd synapps-backend && python scripts/bench_timeline.py --tasks 50000
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DEBUG", "false")
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from config import settings
+from core.pagination import Page
+from models.column import Column
+from models.task import Task
+from services.board_snapshot import TASK_RESPONSE_COLUMNS
+from services.task_timeline import load_timeline
+
+START = datetime(2025, 1, 1)
+
+# Görevler iki yıla yayılır ve 1-30 gün sürer; yaklaşık onda biri tarihsizdir
+SEED = [
+    "INSERT INTO users (name, email, hashed_password) VALUES ('bench', :email, 'x')",
+    "INSERT INTO project_boards (name, user_id) "
+    "SELECT 'bench ' || g, (SELECT id FROM users WHERE email = :email) FROM generate_series(1, :boards) g",
+    "INSERT INTO columns (title, board_id, position, rank) "
+    "SELECT 'Column ' || g, b.id, g, chr(65 + g) FROM project_boards b, generate_series(0, 4) g "
+    "WHERE b.user_id = (SELECT id FROM users WHERE email = :email)",
+    "INSERT INTO tasks (title, column_id, status, position, priority, rank, start_date, end_date) "
+    "SELECT 'Task ' || g, c.id, 'todo', g, 'medium', 'V' || lpad(g::text, 7, '0') || '1', "
+    "CASE WHEN g % 10 <> 0 THEN timestamp '2025-01-01' + random() * interval '730 days' END, NULL "
+    "FROM columns c JOIN project_boards b ON b.id = c.board_id, generate_series(1, :per_column) g "
+    "WHERE b.user_id = (SELECT id FROM users WHERE email = :email)",
+    "UPDATE tasks SET end_date = start_date + (1 + floor(random() * 30)) * interval '1 day' "
+    "WHERE start_date IS NOT NULL AND column_id IN (SELECT c.id FROM columns c JOIN project_boards b "
+    "ON b.id = c.board_id JOIN users u ON u.id = b.user_id WHERE u.email = :email)",
+    "ANALYZE columns",
+    "ANALYZE tasks",
+]
+
+WINDOWS = [("1 day", 1), ("1 week", 7), ("1 month", 30), ("1 quarter", 91), ("1 year", 365)]
+
+async def median_ms(call, repeat: int) -> float:
+    await call()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+async def run(tasks: int, boards: int, repeat: int) -> None:
+    engine = create_async_engine(settings.DATABASE_URL)
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        params = {"email": f"bench-{uuid.uuid4().hex}@example.com", "boards": boards, "per_column": tasks // 5}
+        started = time.perf_counter()
+        for statement in SEED:
+            await connection.execute(text(statement), params)
+        board_id = (await connection.execute(text(
+            "SELECT min(b.id) FROM project_boards b JOIN users u ON u.id = b.user_id WHERE u.email = :email"
+        ), params)).scalar_one()
+        print(
+            f"seeded {boards} boards x {params['per_column'] * 5} tasks (90% dated) "
+            f"in {time.perf_counter() - started:.0f} s"
+        )
+
+        db = AsyncSession(bind=connection)
+        window_start = START + timedelta(days=365)
+
+        # Eski yol: board'un bütün görevleri indirilir, pencere istemcide süzülür
+        async def download_all():
+            rows = (await db.execute(
+                select(*TASK_RESPONSE_COLUMNS).join(Column, Column.id == Task.column_id).where(Column.board_id == board_id)
+            )).all()
+            return rows
+
+        print(f"all tasks of the board          median {await median_ms(download_all, repeat):8.1f} ms")
+        print(f"{'window':<12}{'overlapping':>12}{'first page':>14}{'all pages':>13}")
+        for label, days in WINDOWS:
+            window_end = window_start + timedelta(days=days)
+            overlapping = (await connection.execute(text(
+                "SELECT count(*) FROM tasks t JOIN columns c ON c.id = t.column_id "
+                "WHERE c.board_id = :board_id AND t.schedule && tsrange(:start, :end, '[]')"
+            ), {"board_id": board_id, "start": window_start, "end": window_end})).scalar_one()
+
+            async def first_page():
+                return await load_timeline(db, board_id, window_start, window_end, Page(settings.DEFAULT_PAGE_SIZE, None))
+
+            # İstemci X-Next-Cursor'ı izleyerek bütün pencereyi MAX_PAGE_SIZE'lık sayfalarla çeker
+            async def all_pages():
+                page = Page(settings.MAX_PAGE_SIZE, None)
+                while True:
+                    rows = await load_timeline(db, board_id, window_start, window_end, page)
+                    if len(rows) <= page.limit:
+                        return
+                    last = rows[page.limit - 1]
+                    page = Page(page.limit, last.id, {"id": last.id, "start": last.starts_at.isoformat()})
+
+            first = await median_ms(first_page, repeat)
+            every = await median_ms(all_pages, repeat)
+            print(f"{label:<12}{overlapping:>12}{first:>11.1f} ms{every:>10.1f} ms")
+        await transaction.rollback()
+    await engine.dispose()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Board timeline latency on large boards")
+    parser.add_argument("--tasks", type=int, default=50000, help="tasks per board")
+    parser.add_argument("--boards", type=int, default=4, help="boards of that size; the first one is queried")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run(args.tasks, args.boards, args.repeat))
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from models.user import User
 from schemas.user import UserCreate
-from core.security import get_password_hash, verify_password
+from core.security import get_password_hash_async, verify_password_async
 
 # Kullanıcı oluştur
 async def create_user(user_data: UserCreate, db: AsyncSession) -> User:
-    hashed_pw = get_password_hash(user_data.password)
+    hashed_pw = await get_password_hash_async(user_data.password)
     new_user = User(
         name=user_data.name,
         email=user_data.email,
@@ -22,7 +22,7 @@ async def create_user(user_data: UserCreate, db: AsyncSession) -> User:
 async def authenticate_user(email: str, password: str, db: AsyncSession) -> Optional[User]:
     result = await db.execute(select(User).where(User.email == email))
     user = result.scalars().first()
-    if not user or not verify_password(password, user.hashed_password):
+    if not user or not await verify_password_async(password, user.hashed_password):
         return None
     return user
 
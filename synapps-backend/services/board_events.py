@@ -0,0 +1,49 @@
+# services/board_events.py
+from typing import AsyncIterator, Dict, List, Optional
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from config import settings
+from core.events import EventBroker, format_sse, sse_stream
+
+# Board değişiklik olayları; kanal board id'sidir. Olaylar commit'ten sonra yayınlanır
+# ve board'un yeni version değerini taşır (GET uçlarının ETag'iyle aynı sayaç).
+board_events = EventBroker(settings.EVENT_QUEUE_SIZE)
+
+TASK_FIELDS = ("id", "column_id", "rank", "title", "status", "assigned_user_id", "priority", "dependency_id")
+COLUMN_FIELDS = ("id", "board_id", "rank", "title")
+MEMBER_FIELDS = ("id", "board_id", "user_id", "role")
+
+def _fields(obj, fields) -> dict:
+    return {field: getattr(obj, field) for field in fields}
+
+def task_event_data(task) -> dict:
+    return _fields(task, TASK_FIELDS)
+
+def column_event_data(column) -> dict:
+    return _fields(column, COLUMN_FIELDS)
+
+def member_event_data(member) -> dict:
+    return _fields(member, MEMBER_FIELDS)
+
+# Board değiştiren taşımalarda bağımlılığı kaldırılan görevler, board başına tek olayla
+def publish_cleared_dependencies(cleared: Dict[int, List[int]], versions: Dict[int, int]) -> None:
+    for board_id, task_ids in cleared.items():
+        publish_board_event(board_id, versions.get(board_id), "dependencies.cleared", {"ids": task_ids})
+
+def publish_board_event(board_id: int, version: Optional[int], event_type: str, data) -> None:
+    board_events.publish(board_id, {
+        "type": event_type,
+        "id": version,
+        "board_id": board_id,
+        "version": version,
+        "data": jsonable_encoder(data),
+    })
+
+# Last-Event-ID (son görülen version) güncel version'dan farklıysa istemci aradaki
+# olayları kaçırmıştır; önce "resync" gönderilir, istemci /boards/{id}/full ile tazeler.
+def board_event_stream(request: Request, board_id: int, version: int) -> AsyncIterator[str]:
+    initial = []
+    last_event_id = request.headers.get("last-event-id")
+    if last_event_id is not None and last_event_id != str(version):
+        initial.append(format_sse("resync", {"board_id": board_id, "version": version}, version))
+    return sse_stream(request, board_events, board_id, initial)
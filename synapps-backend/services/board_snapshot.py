@@ -0,0 +1,81 @@
+# services/board_snapshot.py
+from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.board_member import BoardMember
+from models.column import Column
+from models.project_board import ProjectBoard
+from models.task import Task
+from models.user import User
+from core.fast_json import response_columns
+from schemas.column import ColumnResponse
+from schemas.task import TaskResponse
+
+USER_FIELDS = ("id", "name", "email", "created_at", "updated_at")
+# Hesaplanan kolonlar (arama vektörü, zaman aralığı) snapshot'a girmez
+TASK_COLUMNS = [column for column in Task.__table__.columns if column.key not in ("search_vector", "schedule")]
+COLUMN_RESPONSE_COLUMNS = response_columns(ColumnResponse, Column.__table__)
+TASK_RESPONSE_COLUMNS = response_columns(TaskResponse, Task.__table__)
+
+# Board satırını (version dahil) ORM nesnesi üretmeden al; yoksa None
+async def load_board_row(db: AsyncSession, board_id: int) -> Optional[dict]:
+    return (await db.execute(
+        select(ProjectBoard.__table__).where(ProjectBoard.id == board_id)
+    )).mappings().first()
+
+# Board'un sıralı kolonlarını, sıralı görevlerini ve üyelerini sabit sayıda (3) sorguyla,
+# satır -> dict olarak yükler ve board satırıyla birleştirir.
+async def load_board_snapshot(db: AsyncSession, board: dict) -> dict:
+    board_id = board["id"]
+    column_rows = (await db.execute(
+        select(Column.__table__)
+        .where(Column.board_id == board_id)
+        .order_by(Column.rank, Column.id)
+    )).mappings().all()
+
+    task_rows = (await db.execute(
+        select(*TASK_COLUMNS)
+        .join(Column, Column.id == Task.column_id)
+        .where(Column.board_id == board_id)
+        .order_by(Task.column_id, Task.rank, Task.id)
+    )).mappings().all()
+
+    member_rows = (await db.execute(
+        select(BoardMember.__table__, *[getattr(User, f).label(f"user_{f}") for f in USER_FIELDS])
+        .join(User, User.id == BoardMember.user_id)
+        .where(BoardMember.board_id == board_id)
+        .order_by(BoardMember.id)
+    )).mappings().all()
+
+    columns = [{**row, "tasks": []} for row in column_rows]
+    tasks_by_column = {column["id"]: column["tasks"] for column in columns}
+    for row in task_rows:
+        tasks_by_column[row["column_id"]].append(dict(row))
+
+    members = []
+    for row in member_rows:
+        member = {key: row[key] for key in BoardMember.__table__.columns.keys()}
+        member["user"] = {f: row[f"user_{f}"] for f in USER_FIELDS}
+        members.append(member)
+
+    return {**board, "columns": columns, "members": members}
+
+# Koşula uyan kolonlar ve sıralı görevleri iki sorguda, ColumnResponse/TaskResponse alanlarıyla
+# dict olarak (GET /columns hızlı yolu, core/fast_json.py); ORM nesnesi üretilmez
+async def load_columns_with_tasks(db: AsyncSession, condition) -> List[dict]:
+    column_rows = (await db.execute(
+        select(*COLUMN_RESPONSE_COLUMNS).where(condition).order_by(Column.rank, Column.id)
+    )).mappings().all()
+    if not column_rows:
+        return []
+    columns = [dict(row, tasks=[]) for row in column_rows]
+    tasks_by_column = {column["id"]: column["tasks"] for column in columns}
+    task_rows = (await db.execute(
+        select(*TASK_RESPONSE_COLUMNS)
+        .join(Column, Column.id == Task.column_id)
+        .where(condition)
+        .order_by(Task.column_id, Task.rank, Task.id)
+    )).mappings()
+    for row in task_rows:
+        tasks_by_column[row["column_id"]].append(dict(row))
+    return columns
@@ -0,0 +1,61 @@
+# services/board_summary.py
+from typing import Dict, List
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.board_member import BoardMember
+from models.column import Column
+from models.project_board import ProjectBoard
+from models.task import Task, TaskStatus
+
+# Bitmiş sayılan durumlar; bitiş tarihi geçmiş olsa da gecikmiş sayılmaz
+CLOSED_STATUSES = (TaskStatus.done, TaskStatus.cancelled)
+
+# Board sayısından bağımsız olarak 3 gruplu sorguyla board başına görev sayıları
+# (duruma göre), gecikmiş görev sayısı ve üye sayısı. roles: {board_id: rol}
+async def load_board_summaries(db: AsyncSession, roles: Dict[int, str]) -> List[dict]:
+    board_ids = list(roles)
+    if not board_ids:
+        return []
+
+    boards = (await db.execute(
+        select(ProjectBoard.id, ProjectBoard.name, ProjectBoard.user_id, ProjectBoard.version)
+        .where(ProjectBoard.id.in_(board_ids))
+        .order_by(ProjectBoard.id)
+    )).mappings().all()
+    summaries = {
+        board["id"]: {
+            **board,
+            "role": roles[board["id"]],
+            "task_counts": {status.value: 0 for status in TaskStatus},
+            "total_tasks": 0,
+            "overdue_tasks": 0,
+            "member_count": 0,
+        }
+        for board in boards
+    }
+
+    overdue = func.count().filter(Task.end_date < func.now(), Task.status.not_in(CLOSED_STATUSES))
+    task_rows = (await db.execute(
+        select(Column.board_id, Task.status, func.count(), overdue)
+        .join(Task, Task.column_id == Column.id)
+        .where(Column.board_id.in_(board_ids))
+        .group_by(Column.board_id, Task.status)
+    )).all()
+    for board_id, status, count, overdue_count in task_rows:
+        summary = summaries.get(board_id)
+        if summary is None:
+            continue
+        summary["task_counts"][status.value] = count
+        summary["total_tasks"] += count
+        summary["overdue_tasks"] += overdue_count
+
+    member_rows = (await db.execute(
+        select(BoardMember.board_id, func.count())
+        .where(BoardMember.board_id.in_(board_ids))
+        .group_by(BoardMember.board_id)
+    )).all()
+    for board_id, count in member_rows:
+        if board_id in summaries:
+            summaries[board_id]["member_count"] = count
+
+    return list(summaries.values())
@@ -0,0 +1,153 @@
+# services/board_templates.py
+from typing import Dict, List, Optional
+from sqlalchemy import Integer, String, column, func, insert, literal, null, select, values
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.lexorank import even_ranks
+from models.board_member import BoardMember, RoleType
+from models.column import Column
+from models.project_board import ProjectBoard
+from models.task import Task
+
+# Hazır şablonlar: anahtar -> kolon başlıkları. "kanban" varsayılandır.
+DEFAULT_TEMPLATE = "kanban"
+BUILTIN_TEMPLATES: Dict[str, List[str]] = {
+    "kanban": ["Yapılacak", "Devam Ediyor", "Tamamlandı"],
+    "scrum": ["Backlog", "Sprint", "Devam Ediyor", "İncelemede", "Tamamlandı"],
+    "basic": ["Yapılacak", "Tamamlandı"],
+}
+
+BOARD_RETURNING = (
+    ProjectBoard.id, ProjectBoard.name, ProjectBoard.description, ProjectBoard.user_id,
+    ProjectBoard.created_at, ProjectBoard.version, ProjectBoard.is_template,
+)
+
+def _next_id(table: str):
+    return func.nextval(func.pg_get_serial_sequence(table, "id"))
+
+# Board satırı ve sahip üyeliği; çağıran CTE'leri tek ifadeye ekler
+def _new_board_ctes(name: str, description: Optional[str], user_id: int, is_template: bool):
+    new_board = (
+        insert(ProjectBoard)
+        .values(name=name, description=description, user_id=user_id, version=1, is_template=is_template)
+        .returning(*BOARD_RETURNING)
+        .cte("new_board")
+    )
+    owner = insert(BoardMember).from_select(
+        ["board_id", "user_id", "role"],
+        select(new_board.c.id, literal(user_id), literal(RoleType.OWNER, BoardMember.role.type)),
+    ).cte("owner_member")
+    return new_board, owner
+
+# Board, sahip üyeliği ve kolonlar tek INSERT ... RETURNING ifadesiyle (tek gidiş-dönüş)
+async def create_board_from_titles(
+    db: AsyncSession, name: str, description: Optional[str], user_id: int, titles: List[str]
+) -> dict:
+    new_board, owner = _new_board_ctes(name, description, user_id, False)
+    template_columns = values(
+        column("title", String), column("position", Integer), column("rank", String), name="template_columns"
+    ).data([(title, position, rank) for position, (title, rank) in enumerate(zip(titles, even_ranks(len(titles))))])
+    columns = insert(Column).from_select(
+        ["title", "board_id", "position", "rank"],
+        select(template_columns.c.title, new_board.c.id, template_columns.c.position, template_columns.c.rank),
+    ).cte("new_columns")
+    result = await db.execute(select(*new_board.c).add_cte(owner, columns))
+    return dict(result.mappings().one())
+
+# Kaynak board'un kolonlarını ve (include_tasks ise) görevlerini veritabanı içinde kopyalar.
+# Yeni id'ler CTE'de nextval ile ayrılır; görevlerin kolon ve board içi bağımlılıkları bu
+# eşlemeyle yeni satırlara taşınır, board dışına işaret eden bağımlılıklar ve atamalar
+# kopyalanmaz. Tümü tek INSERT ... SELECT ... RETURNING ifadesidir; commit çağırana aittir.
+async def clone_board(
+    db: AsyncSession, source_board_id: int, name: str, description: Optional[str], user_id: int,
+    include_tasks: bool = True, is_template: bool = False,
+) -> dict:
+    new_board, owner = _new_board_ctes(name, description, user_id, is_template)
+    source_columns = (
+        select(
+            Column.id.label("old_id"), _next_id("columns").label("new_id"),
+            Column.title, Column.position, Column.rank,
+        )
+        .where(Column.board_id == source_board_id)
+        .cte("source_columns")
+        .prefix_with("MATERIALIZED")
+    )
+    columns = insert(Column).from_select(
+        ["id", "title", "board_id", "position", "rank"],
+        select(source_columns.c.new_id, source_columns.c.title, new_board.c.id,
+               source_columns.c.position, source_columns.c.rank),
+    ).cte("new_columns")
+    ctes = [owner, columns]
+    task_count = literal(0)
+
+    if include_tasks:
+        source_tasks = (
+            select(
+                Task.id.label("old_id"), _next_id("tasks").label("new_id"),
+                source_columns.c.new_id.label("column_id"), Task.title, Task.description, Task.status,
+                Task.priority, Task.start_date, Task.end_date, Task.dependency_id, Task.position, Task.rank,
+            )
+            .join(source_columns, source_columns.c.old_id == Task.column_id)
+            .cte("source_tasks")
+            .prefix_with("MATERIALIZED")
+        )
+        dependency = source_tasks.alias("source_dependency")
+        tasks = insert(Task).from_select(
+            ["id", "column_id", "title", "description", "status", "priority",
+             "start_date", "end_date", "dependency_id", "position", "rank", "assigned_user_id"],
+            select(
+                source_tasks.c.new_id, source_tasks.c.column_id, source_tasks.c.title,
+                source_tasks.c.description, source_tasks.c.status, source_tasks.c.priority,
+                source_tasks.c.start_date, source_tasks.c.end_date, dependency.c.new_id,
+                source_tasks.c.position, source_tasks.c.rank, null(),
+            ).outerjoin(dependency, dependency.c.old_id == source_tasks.c.dependency_id),
+        ).cte("new_tasks")
+        ctes.append(tasks)
+        task_count = select(func.count()).select_from(source_tasks).scalar_subquery()
+
+    result = await db.execute(
+        select(
+            *new_board.c,
+            select(func.count()).select_from(source_columns).scalar_subquery().label("columns_copied"),
+            task_count.label("tasks_copied"),
+        ).add_cte(*ctes)
+    )
+    return dict(result.mappings().one())
+
+# Erişilebilen kullanıcı şablonları: kolon başlıkları ve görev sayısıyla, sabit sayıda (3) sorguda
+async def load_user_templates(db: AsyncSession, board_ids: List[int]) -> List[dict]:
+    if not board_ids:
+        return []
+    boards = (await db.execute(
+        select(ProjectBoard.id, ProjectBoard.name, ProjectBoard.description)
+        .where(ProjectBoard.id.in_(board_ids), ProjectBoard.is_template.is_(True))
+        .order_by(ProjectBoard.id)
+    )).all()
+    if not boards:
+        return []
+    template_ids = [board.id for board in boards]
+    column_rows = (await db.execute(
+        select(Column.board_id, func.array_agg(aggregate_order_by(Column.title, Column.rank)).label("titles"))
+        .where(Column.board_id.in_(template_ids))
+        .group_by(Column.board_id)
+    )).all()
+    task_counts = dict((await db.execute(
+        select(Column.board_id, func.count(Task.id))
+        .join(Task, Task.column_id == Column.id)
+        .where(Column.board_id.in_(template_ids))
+        .group_by(Column.board_id)
+    )).all())
+    titles = {row.board_id: row.titles for row in column_rows}
+    return [
+        {
+            "id": board.id, "key": None, "name": board.name, "description": board.description,
+            "columns": titles.get(board.id, []), "task_count": task_counts.get(board.id, 0),
+        }
+        for board in boards
+    ]
+
+def builtin_templates() -> List[dict]:
+    return [
+        {"id": None, "key": key, "name": key, "description": None, "columns": titles, "task_count": 0}
+        for key, titles in BUILTIN_TEMPLATES.items()
+    ]
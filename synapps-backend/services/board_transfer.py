@@ -0,0 +1,340 @@
+# services/board_transfer.py
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, List, Optional
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from config import settings
+from database import mark_session_write
+from core.lexorank import even_ranks, rank_between
+from models.column import Column
+from models.project_board import ProjectBoard
+from models.task import Task, TaskStatus
+from models.user import User
+from services.ordering import lock_board, lock_column
+from services.rank_rebalance import check_task_rank
+from services.task_dependencies import find_cycles
+
+# Dışa/içe aktarma kayıt biçimi (NDJSON satırı veya CSV satırı). "column" kayıtlarında
+# yalnızca id, title ve rank; "task" kayıtlarında column_id dosyadaki kolon kaydının id'sidir.
+# Böylece export çıktısı olduğu gibi başka bir board'a import edilebilir.
+EXPORT_FIELDS = (
+    "type", "id", "column_id", "title", "description", "status", "priority",
+    "assigned_user_id", "start_date", "end_date", "dependency_id", "rank",
+)
+TASK_EXPORT_COLUMNS = (
+    Task.id, Task.column_id, Task.title, Task.description, Task.status, Task.priority,
+    Task.assigned_user_id, Task.start_date, Task.end_date, Task.dependency_id, Task.rank,
+)
+TASK_COPY_COLUMNS = [
+    "id", "title", "description", "column_id", "assigned_user_id", "status",
+    "priority", "start_date", "end_date", "dependency_id", "position", "rank",
+]
+MAX_REPORTED_ERRORS = 100
+
+TASK_STATUSES = set(TaskStatus.__members__)
+
+def _record(kind: str, row) -> dict:
+    record = {"type": kind, **row._mapping}
+    if isinstance(record.get("status"), TaskStatus):
+        record["status"] = record["status"].value
+    return record
+
+# jsonable_encoder satır başına çok pahalı; yalnızca tarih alanları dönüştürülür
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def format_ndjson(records: List[dict]) -> str:
+    return "".join(json.dumps(record, separators=(",", ":"), default=_json_default) + "\n" for record in records)
+
+def format_csv(records: List[dict], header: bool = False) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS, extrasaction="ignore")
+    if header:
+        writer.writeheader()
+    writer.writerows(records)
+    return buffer.getvalue()
+
+# Board'u kolonlar ve görevler halinde, server-side cursor'dan EXPORT_BATCH_SIZE'lık
+# parçalar olarak okur; bellek kullanımı görev sayısından bağımsızdır.
+# Oturumu kendisi açar: yanıt akarken istek dependency'sinin oturumu kapanmış olur.
+async def export_board_chunks(session_maker, board_id: int, fmt: str) -> AsyncIterator[str]:
+    formatter = format_csv if fmt == "csv" else format_ndjson
+    async with session_maker() as db:
+        column_rows = (await db.execute(
+            select(Column.id, Column.title, Column.rank)
+            .where(Column.board_id == board_id)
+            .order_by(Column.rank, Column.id)
+        )).all()
+        if fmt == "csv":
+            yield format_csv([_record("column", row) for row in column_rows], header=True)
+        else:
+            board = (await db.execute(
+                select(ProjectBoard.id, ProjectBoard.name, ProjectBoard.description, ProjectBoard.version)
+                .where(ProjectBoard.id == board_id)
+            )).one()
+            yield formatter([_record("board", board)] + [_record("column", row) for row in column_rows])
+
+        result = await db.stream(
+            select(*TASK_EXPORT_COLUMNS)
+            .join(Column, Column.id == Task.column_id)
+            .where(Column.board_id == board_id)
+            .order_by(Task.column_id, Task.rank, Task.id)
+            .execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+        )
+        async for rows in result.partitions():
+            yield formatter([_record("task", row) for row in rows])
+
+# İstek gövdesini kayıtlara çevir; her kayıt kaynak satır numarasını (_line) taşır
+def parse_import(body: bytes, content_type: str) -> List[dict]:
+    try:
+        text = body.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Import body must be UTF-8")
+    records = []
+    if "csv" in content_type:
+        for line, row in enumerate(csv.DictReader(io.StringIO(text)), start=2):
+            records.append({**{key: (value if value != "" else None) for key, value in row.items()}, "_line": line})
+    else:
+        for line, raw in enumerate(text.splitlines(), start=1):
+            if not raw.strip():
+                continue
+            try:
+                record = json.loads(raw)
+            except ValueError:
+                record = None
+            if not isinstance(record, dict):
+                record = {"type": None}
+            records.append({**record, "_line": line})
+    if len(records) > settings.IMPORT_MAX_ROWS:
+        raise HTTPException(status_code=413, detail=f"Import is limited to {settings.IMPORT_MAX_ROWS} rows")
+    return records
+
+INT4_MAX = 2**31 - 1
+
+# Alan doğrulayıcıları: COPY hatalı bir değerde tüm import'u 500 ile düşürmesin diye her
+# değer tasks tablosunun tipine (TaskCreate şemasıyla aynı kurallar) uygun olmalı.
+# CSV değerleri metin olarak geldiği için sayılar rakam dizisi olarak da kabul edilir.
+def _text_or_none(field: str, value) -> Optional[str]:
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise ValueError(f"{field} must be a string")
+    if "\x00" in value:
+        raise ValueError(f"{field} must not contain NUL characters")
+    return value
+
+def _int_or_none(field: str, value) -> Optional[int]:
+    if value is None:
+        return None
+    if isinstance(value, str) and value.strip().isdigit():
+        value = int(value)
+    if isinstance(value, bool) or not isinstance(value, int) or not 0 < value <= INT4_MAX:
+        raise ValueError(f"{field} must be a positive integer")
+    return value
+
+# Sütunlar saat dilimsiz; saat dilimi verilmiş tarihler UTC'ye çevrilir
+def _datetime_or_none(field: str, value) -> Optional[datetime]:
+    if value is None:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{field} must be an ISO 8601 datetime")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+class ImportReport:
+
+    def __init__(self):
+        self.columns_created = 0
+        self.tasks_created = 0
+        self.skipped = 0
+        self.errors = []
+        self.warnings = []
+
+    def error(self, record: dict, message: str) -> None:
+        self.skipped += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": record["_line"], "error": message})
+
+    def warning(self, record: dict, message: str) -> None:
+        if len(self.warnings) < MAX_REPORTED_ERRORS:
+            self.warnings.append({"line": record["_line"], "warning": message})
+
+    def as_dict(self) -> dict:
+        return {
+            "columns_created": self.columns_created,
+            "tasks_created": self.tasks_created,
+            "skipped": self.skipped,
+            "errors": sorted(self.errors, key=lambda error: error["line"]),
+            "warnings": sorted(self.warnings, key=lambda warning: warning["line"]),
+        }
+
+def _validate_task(record: dict) -> dict:
+    title = _text_or_none("title", record.get("title"))
+    if title is None or not title.strip():
+        raise ValueError("title is required")
+    status = _text_or_none("status", record.get("status")) or TaskStatus.todo.value
+    if status not in TASK_STATUSES:
+        raise ValueError(f"unknown status: {status}")
+    priority = _text_or_none("priority", record.get("priority")) or "medium"
+    return {
+        "title": title,
+        "description": _text_or_none("description", record.get("description")),
+        "status": status,
+        "priority": priority,
+        "assigned_user_id": _int_or_none("assigned_user_id", record.get("assigned_user_id")),
+        "start_date": _datetime_or_none("start_date", record.get("start_date")),
+        "end_date": _datetime_or_none("end_date", record.get("end_date")),
+        # Dosyadaki bir kaydın id'sine referans; import_board eşler, eşlenemeyeni düşürür
+        "dependency_id": record.get("dependency_id"),
+    }
+
+# Sequence'ten n adet id ayır; COPY ile yazılacak satırların id'leri önceden bilinir,
+# bağımlılıklar ve kolon referansları ikinci bir UPDATE olmadan eşlenir
+async def _allocate_ids(db: AsyncSession, table: str, count: int) -> List[int]:
+    if count == 0:
+        return []
+    result = await db.execute(
+        select(func.array_agg(func.nextval(func.pg_get_serial_sequence(table, "id"))))
+        .select_from(func.generate_series(1, count))
+    )
+    return result.scalar_one()
+
+async def _copy_records(db: AsyncSession, table: str, columns: List[str], records: List[tuple]) -> None:
+    if not records:
+        return
+    connection = await (await db.connection()).get_raw_connection()
+    await connection.driver_connection.copy_records_to_table(table, records=records, columns=columns)
+    # COPY oturumun dışından yazar; read-your-writes için oturum elle işaretlenir
+    mark_session_write(db)
+
+# Kolonları ve görevleri doğrular, geçerli olanları COPY ile (istek transaction'ı içinde) yazar.
+# Geçersiz satırlar atlanır ve raporda satır numarasıyla listelenir; commit çağırana aittir.
+async def import_board(db: AsyncSession, board_id: int, records: List[dict]) -> ImportReport:
+    report = ImportReport()
+    column_records = []
+    task_records = []
+    for record in records:
+        kind = record.get("type")
+        if kind == "column":
+            try:
+                title = _text_or_none("title", record.get("title"))
+            except ValueError as exc:
+                report.error(record, str(exc))
+                continue
+            if title is None or not title.strip():
+                report.error(record, "column title is required")
+            else:
+                column_records.append(record)
+        elif kind == "task":
+            task_records.append(record)
+        elif kind != "board":
+            report.error(record, "type must be board, column or task")
+
+    # Dosyadaki kolon referansı -> yeni kolon id'si; referanssız kolonlar da oluşturulur.
+    # Kolon ekleme yolu gibi board kilitlenir; eşzamanlı eklenen bir kolon aynı rank'i alamaz.
+    if column_records:
+        await lock_board(db, board_id)
+    existing_columns = dict((await db.execute(
+        select(Column.id, Column.rank).where(Column.board_id == board_id)
+    )).all())
+    column_ids = await _allocate_ids(db, "columns", len(column_records))
+    column_map: Dict[str, int] = {}
+    last_rank = max(existing_columns.values(), default=None)
+    column_rows = []
+    new_ranks = even_ranks(len(column_records)) if not existing_columns else []
+    for i, (record, column_id) in enumerate(zip(column_records, column_ids)):
+        if record.get("id") is not None:
+            column_map[str(record["id"])] = column_id
+        rank = new_ranks[i] if new_ranks else rank_between(last_rank, None)
+        last_rank = rank
+        column_rows.append((column_id, record["title"], board_id, i, rank))
+
+    # Görev satırları: alan doğrulaması, kolon eşlemesi
+    tasks = []
+    for record in task_records:
+        try:
+            task = _validate_task(record)
+        except ValueError as exc:
+            report.error(record, str(exc))
+            continue
+        reference = record.get("column_id")
+        if reference is not None and str(reference) in column_map:
+            task["column_id"] = column_map[str(reference)]
+        elif reference is not None and str(reference).isdigit() and int(reference) in existing_columns:
+            task["column_id"] = int(reference)
+        else:
+            report.error(record, f"unknown column: {reference}")
+            continue
+        task["record"] = record
+        tasks.append(task)
+
+    assigned = {task["assigned_user_id"] for task in tasks if task["assigned_user_id"] is not None}
+    known_users = set((await db.execute(select(User.id).where(User.id.in_(assigned)))).scalars()) if assigned else set()
+    valid_tasks = []
+    for task in tasks:
+        if task["assigned_user_id"] is not None and task["assigned_user_id"] not in known_users:
+            report.error(task["record"], f"unknown user: {task['assigned_user_id']}")
+        else:
+            valid_tasks.append(task)
+
+    # Bağımlılıklar yalnızca dosyadaki (geçerli) görevlere; diğerleri ve döngü kapatanlar düşürülür
+    task_ids = await _allocate_ids(db, "tasks", len(valid_tasks))
+    task_map = {}
+    for task, task_id in zip(valid_tasks, task_ids):
+        task["id"] = task_id
+        if task["record"].get("id") is not None:
+            task_map[str(task["record"]["id"])] = task_id
+    by_id = {task["id"]: task for task in valid_tasks}
+    for task in valid_tasks:
+        reference = task["dependency_id"]
+        task["dependency_id"] = task_map.get(str(reference)) if reference is not None else None
+        if reference is not None and task["dependency_id"] is None:
+            report.warning(task["record"], f"dependency {reference} not in import; dropped")
+    for cycle in find_cycles(by_id):
+        report.warning(by_id[cycle[0]]["record"], "dependency cycle; dropped")
+        by_id[cycle[0]]["dependency_id"] = None
+
+    # Kolon başına rank: yeni kolonda eşit aralıklı, mevcut kolonda son görevin arkasına
+    tasks_by_column: Dict[int, list] = {}
+    for task in valid_tasks:
+        tasks_by_column.setdefault(task["column_id"], []).append(task)
+    existing_targets = [column_id for column_id in tasks_by_column if column_id in existing_columns]
+    # Mevcut kolonlar, oluşturma/taşıma yolları gibi (ve aynı id sırasıyla) kilitlenir; eşzamanlı
+    # bir görev son rank'i okuduktan sonra aynı rank'i alamaz
+    for column_id in sorted(existing_targets):
+        await lock_column(db, column_id)
+    last_task_ranks = dict((await db.execute(
+        select(Task.column_id, func.max(Task.rank)).where(Task.column_id.in_(existing_targets)).group_by(Task.column_id)
+    )).all()) if existing_targets else {}
+    task_rows = []
+    for column_id, column_tasks in tasks_by_column.items():
+        if column_id in existing_columns:
+            rank = last_task_ranks.get(column_id)
+            ranks = []
+            for _ in column_tasks:
+                rank = rank_between(rank, None)
+                ranks.append(rank)
+            check_task_rank(column_id, rank)
+        else:
+            ranks = even_ranks(len(column_tasks))
+        for position, (task, rank) in enumerate(zip(column_tasks, ranks)):
+            task_rows.append((
+                task["id"], task["title"], task["description"], column_id, task["assigned_user_id"],
+                task["status"], task["priority"], task["start_date"], task["end_date"],
+                task["dependency_id"], position, rank,
+            ))
+
+    await _copy_records(db, "columns", ["id", "title", "board_id", "position", "rank"], column_rows)
+    await _copy_records(db, "tasks", TASK_COPY_COLUMNS, task_rows)
+    report.columns_created = len(column_rows)
+    report.tasks_created = len(task_rows)
+    return report
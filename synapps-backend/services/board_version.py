@@ -0,0 +1,49 @@
+# services/board_version.py
+from typing import Dict, Optional
+from fastapi import Request
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.column import Column
+from models.project_board import ProjectBoard
+
+# Board içeriğini (kolonlar, görevler, üyeler) değiştiren her işlem, aynı transaction
+# içinde board'un version değerini artırır. GET uçları bu değeri ETag olarak kullanır.
+# Yeni version döner (board yoksa None); olay akışı (services/board_events.py) bunu taşır.
+async def bump_board_version(db: AsyncSession, board_id: int) -> Optional[int]:
+    result = await db.execute(
+        update(ProjectBoard)
+        .where(ProjectBoard.id == board_id)
+        .values(version=ProjectBoard.version + 1)
+        .returning(ProjectBoard.version)
+        .execution_options(synchronize_session=False)
+    )
+    return result.scalar_one_or_none()
+
+# Görev işlemleri için: kolonların ait olduğu board(lar)ın versiyonunu tek sorguda artır;
+# {board_id: yeni version} döner
+async def bump_board_version_for_columns(db: AsyncSession, *column_ids: int) -> Dict[int, int]:
+    board_ids = select(Column.board_id).where(Column.id.in_(set(column_ids)))
+    result = await db.execute(
+        update(ProjectBoard)
+        .where(ProjectBoard.id.in_(board_ids))
+        .values(version=ProjectBoard.version + 1)
+        .returning(ProjectBoard.id, ProjectBoard.version)
+        .execution_options(synchronize_session=False)
+    )
+    return dict(result.all())
+
+async def get_board_version(db: AsyncSession, board_id: int) -> Optional[int]:
+    result = await db.execute(select(ProjectBoard.version).where(ProjectBoard.id == board_id))
+    return result.scalar_one_or_none()
+
+def board_etag(board_id: int, version: int) -> str:
+    return f'"board-{board_id}-v{version}"'
+
+# If-None-Match başlığı verilen ETag ile eşleşiyor mu (304 dönülebilir mi)
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [tag.strip() for tag in header.split(",")]
+    candidates = [tag[2:] if tag.startswith("W/") else tag for tag in candidates]
+    return "*" in candidates or etag in candidates
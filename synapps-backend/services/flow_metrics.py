@@ -0,0 +1,226 @@
+# services/flow_metrics.py
+import logging
+from datetime import date, timedelta
+from typing import Dict
+from sqlalchemy import (
+    BigInteger, Date, Float, Text, and_, cast, extract, func, literal, or_, select, tuple_, union_all, update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from config import settings
+from core.background import register_job
+from database import async_session
+from models.board_flow import BoardFlowDaily, BoardThroughputDaily, FlowRollupState
+from models.task import TaskStatus
+from models.task_transition import TaskTransition
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_STATE_ID = 1
+TASK_STATUSES = [status.value for status in TaskStatus]
+
+# Durum veya board değiştiyse geçiş akışı etkiler (yalnızca kolon değişikliği etkilemez);
+# oluşturma ve silme her zaman etkiler
+def _moves_flow(transition):
+    return or_(
+        transition.from_status.is_distinct_from(transition.to_status),
+        transition.from_board_id.is_distinct_from(transition.to_board_id),
+    )
+
+# Partideki geçişler: girilen durum +1, çıkılan durum +1 (board, gün, durum) bazında toplanıp
+# mevcut satırlara eklenir
+def _flow_upsert(in_batch):
+    t = TaskTransition
+    day = cast(t.changed_at, Date)
+    entered = select(
+        t.to_board_id.label("board_id"), day.label("day"), t.to_status.label("status"),
+        literal(1).label("entered"), literal(0).label("exited"),
+    ).where(in_batch, _moves_flow(t), t.to_board_id.is_not(None), t.to_status.is_not(None))
+    exited = select(
+        t.from_board_id, day, t.from_status, literal(0), literal(1),
+    ).where(in_batch, _moves_flow(t), t.from_board_id.is_not(None), t.from_status.is_not(None))
+    moves = union_all(entered, exited).subquery()
+    stmt = insert(BoardFlowDaily).from_select(
+        ["board_id", "day", "status", "entered", "exited"],
+        select(moves.c.board_id, moves.c.day, moves.c.status, func.sum(moves.c.entered), func.sum(moves.c.exited))
+        .group_by(moves.c.board_id, moves.c.day, moves.c.status),
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=["board_id", "day", "status"],
+        set_={
+            "entered": BoardFlowDaily.entered + stmt.excluded.entered,
+            "exited": BoardFlowDaily.exited + stmt.excluded.exited,
+        },
+    )
+
+# done'a geçişler (oluşturulurken done olanlar hariç). Cycle time: görevin bir önceki
+# tamamlanmasından sonra in_progress'e ilk girişinden bu geçişe kadar; lead time: görevin ilk
+# geçişinden (oluşturulma) bu geçişe kadar. Önceki geçişler ix_task_transitions_task_id_id ile okunur.
+def _throughput_upsert(in_batch):
+    t = TaskTransition
+    previous = aliased(TaskTransition)
+    earlier = aliased(TaskTransition)
+    last_done = (
+        select(func.max(earlier.id))
+        .where(earlier.task_id == t.task_id, earlier.id < t.id, earlier.to_status == TaskStatus.done)
+        .correlate(t)
+        .scalar_subquery()
+    )
+    started_at = (
+        select(func.min(previous.changed_at))
+        .where(
+            previous.task_id == t.task_id, previous.id < t.id, previous.id > func.coalesce(last_done, 0),
+            previous.to_status == TaskStatus.in_progress,
+        )
+        .scalar_subquery()
+    )
+    created_at = select(func.min(previous.changed_at)).where(previous.task_id == t.task_id).scalar_subquery()
+    completions = select(
+        t.to_board_id.label("board_id"), cast(t.changed_at, Date).label("day"),
+        extract("epoch", t.changed_at - started_at).label("cycle_time"),
+        extract("epoch", t.changed_at - created_at).label("lead_time"),
+    ).where(
+        in_batch, t.to_board_id.is_not(None), t.to_status == TaskStatus.done,
+        t.from_status.is_not(None), t.from_status != TaskStatus.done,
+    ).subquery()
+    stmt = insert(BoardThroughputDaily).from_select(
+        ["board_id", "day", "completed", "cycle_time_count", "cycle_time_seconds", "lead_time_seconds"],
+        select(
+            completions.c.board_id, completions.c.day, func.count(),
+            func.count(completions.c.cycle_time),
+            cast(func.coalesce(func.sum(completions.c.cycle_time), 0), Float),
+            cast(func.coalesce(func.sum(completions.c.lead_time), 0), Float),
+        ).group_by(completions.c.board_id, completions.c.day),
+    )
+    excluded = stmt.excluded
+    return stmt.on_conflict_do_update(
+        index_elements=["board_id", "day"],
+        set_={
+            "completed": BoardThroughputDaily.completed + excluded.completed,
+            "cycle_time_count": BoardThroughputDaily.cycle_time_count + excluded.cycle_time_count,
+            "cycle_time_seconds": BoardThroughputDaily.cycle_time_seconds + excluded.cycle_time_seconds,
+            "lead_time_seconds": BoardThroughputDaily.lead_time_seconds + excluded.lead_time_seconds,
+        },
+    )
+
+# Snapshot'ın xmin'i: bundan küçük id'li bütün transaction'lar bitmiştir (commit veya rollback)
+def _snapshot_xmin():
+    return cast(cast(func.pg_snapshot_xmin(func.pg_current_snapshot()), Text), BigInteger)
+
+# Tek parti: durum satırı FOR UPDATE ile kilitlenir (birden fazla süreçte iş aynı anda
+# çalışsa da her geçiş bir kez sayılır). (xact_id, id) imlecinden sonraki en fazla
+# FLOW_ROLLUP_BATCH_SIZE geçiş alınır; yalnızca xact_id'si snapshot xmin'inden küçük olanlar,
+# yani yazan transaction'ı bitmiş olanlar. Uzun süren bir transaction'ın geçişleri böylece
+# commit'ten sonra sıraları gelince işlenir, atlanmaz. Özetlere eklenir ve imleç aynı
+# transaction'da ilerletilir. İşlenen geçiş sayısını döner; commit çağırana aittir.
+async def rollup_flow_batch(db: AsyncSession) -> int:
+    state = await db.get(FlowRollupState, ROLLUP_STATE_ID, with_for_update=True)
+    if state is None:
+        return 0
+    cursor = tuple_(TaskTransition.xact_id, TaskTransition.id)
+    after = cursor > tuple_(state.last_xact_id, state.last_transition_id)
+    window = (
+        select(TaskTransition.xact_id, TaskTransition.id)
+        .where(after, TaskTransition.xact_id < _snapshot_xmin())
+        .order_by(TaskTransition.xact_id, TaskTransition.id)
+        .limit(settings.FLOW_ROLLUP_BATCH_SIZE)
+        .subquery()
+    )
+    last = (await db.execute(
+        select(window.c.xact_id, window.c.id, func.count().over())
+        .order_by(window.c.xact_id.desc(), window.c.id.desc())
+        .limit(1)
+    )).first()
+    if last is None:
+        return 0
+    upper_xact_id, upper_id, count = last
+
+    in_batch = and_(after, cursor <= tuple_(upper_xact_id, upper_id))
+    await db.execute(_flow_upsert(in_batch))
+    await db.execute(_throughput_upsert(in_batch))
+    await db.execute(
+        update(FlowRollupState).where(FlowRollupState.id == ROLLUP_STATE_ID)
+        .values(last_xact_id=upper_xact_id, last_transition_id=upper_id, updated_at=func.now())
+    )
+    return count
+
+# Geçiş kalmayana kadar parti parti işler; her parti kendi kısa transaction'ıdır
+async def rollup_flow_metrics() -> dict:
+    transitions, batches = 0, 0
+    while True:
+        async with async_session() as db:
+            processed = await rollup_flow_batch(db)
+            await db.commit()
+        if not processed:
+            break
+        transitions += processed
+        batches += 1
+        if processed < settings.FLOW_ROLLUP_BATCH_SIZE:
+            break
+    if transitions:
+        logger.info("Rolled up %d task transitions in %d batches", transitions, batches)
+    return {"transitions": transitions, "batches": batches}
+
+rollup_job = register_job("flow_rollup", settings.FLOW_ROLLUP_INTERVAL_SECONDS, rollup_flow_metrics)
+
+def _average(total: float, count: int):
+    return total / count if count else None
+
+# [start, end] günleri için akış metrikleri; yalnızca özet tablolar okunur. Cumulative flow
+# her günün sonunda her durumdaki görev sayısıdır: start'tan önceki farkların toplamı
+# başlangıç değeridir, sonraki günlerin farkları üzerine eklenir.
+async def load_flow_metrics(db: AsyncSession, board_id: int, start: date, end: date) -> dict:
+    baseline = (await db.execute(
+        select(BoardFlowDaily.status, func.sum(BoardFlowDaily.entered - BoardFlowDaily.exited))
+        .where(BoardFlowDaily.board_id == board_id, BoardFlowDaily.day < start)
+        .group_by(BoardFlowDaily.status)
+    )).all()
+    flow_rows = (await db.execute(
+        select(BoardFlowDaily.day, BoardFlowDaily.status, BoardFlowDaily.entered - BoardFlowDaily.exited)
+        .where(BoardFlowDaily.board_id == board_id, BoardFlowDaily.day.between(start, end))
+    )).all()
+    throughput_rows = (await db.execute(
+        select(BoardThroughputDaily)
+        .where(BoardThroughputDaily.board_id == board_id, BoardThroughputDaily.day.between(start, end))
+    )).scalars().all()
+    rolled_up_at = (await db.execute(
+        select(FlowRollupState.updated_at).where(FlowRollupState.id == ROLLUP_STATE_ID)
+    )).scalar_one_or_none()
+
+    wip: Dict[str, int] = dict.fromkeys(TASK_STATUSES, 0)
+    for status, delta in baseline:
+        wip[status.value] += delta
+    deltas: Dict[date, list] = {}
+    for day, status, delta in flow_rows:
+        deltas.setdefault(day, []).append((status.value, delta))
+    throughput = {row.day: row for row in throughput_rows}
+
+    days = []
+    for offset in range((end - start).days + 1):
+        day = start + timedelta(days=offset)
+        for status, delta in deltas.get(day, ()):
+            wip[status] += delta
+        row = throughput.get(day)
+        days.append({
+            "day": day,
+            "completed": row.completed if row else 0,
+            "cycle_time_avg_seconds": _average(row.cycle_time_seconds, row.cycle_time_count) if row else None,
+            "lead_time_avg_seconds": _average(row.lead_time_seconds, row.completed) if row else None,
+            "wip": dict(wip),
+        })
+
+    completed = sum(row.completed for row in throughput_rows)
+    return {
+        "board_id": board_id,
+        "start": start,
+        "end": end,
+        "rolled_up_at": rolled_up_at,
+        "completed": completed,
+        "cycle_time_avg_seconds": _average(
+            sum(row.cycle_time_seconds for row in throughput_rows),
+            sum(row.cycle_time_count for row in throughput_rows),
+        ),
+        "lead_time_avg_seconds": _average(sum(row.lead_time_seconds for row in throughput_rows), completed),
+        "days": days,
+    }
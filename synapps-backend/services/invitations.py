@@ -0,0 +1,50 @@
+# services/invitations.py
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.notification import Notification
+from models.project_board import ProjectBoard
+from services.notification_events import notification_event_data, publish_notification_event
+from services.outbox import enqueue, outbox_handler
+
+BOARD_INVITATION = "board_invitation"
+
+# Davet bildirimi istek içinde değil outbox üzerinden oluşturulur; çağıran commit eder
+def enqueue_board_invitation(db: AsyncSession, user_id: int, board: ProjectBoard, inviter_id: Optional[int] = None) -> None:
+    payload = {"user_id": user_id, "board_id": board.id, "board_name": board.name}
+    if inviter_id is not None:
+        payload["inviter_id"] = inviter_id
+    enqueue(db, BOARD_INVITATION, payload)
+
+# Aynı board için bekleyen davet varsa (tekrar deneme, çift istek) yenisi yazılmaz
+@outbox_handler(BOARD_INVITATION)
+async def create_invitation_notification(db: AsyncSession, payload: dict):
+    result = await db.execute(select(Notification.id).where(
+        Notification.user_id == payload["user_id"],
+        Notification.notification_type == BOARD_INVITATION,
+        Notification.related_item_id == payload["board_id"],
+    ))
+    if result.first() is not None:
+        return None
+
+    data = {"board_id": payload["board_id"], "board_name": payload["board_name"]}
+    if "inviter_id" in payload:
+        data["inviter_id"] = payload["inviter_id"]
+    notification = Notification(
+        user_id=payload["user_id"],
+        notification_type=BOARD_INVITATION,
+        message=f"'{payload['board_name']}' panosuna katılmak için davet edildiniz.",
+        related_item_id=payload["board_id"],
+        related_item_type="board",
+        is_read=False,
+        data=data,
+    )
+    db.add(notification)
+    await db.flush()
+
+    async def publish(db: AsyncSession) -> None:
+        await db.refresh(notification)
+        await publish_notification_event(
+            db, notification.user_id, "notification.created", notification_event_data(notification)
+        )
+    return publish
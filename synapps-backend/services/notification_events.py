@@ -0,0 +1,41 @@
+# services/notification_events.py
+from typing import AsyncIterator, Optional
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from config import settings
+from core.events import EventBroker, format_sse, sse_stream
+from models.user import User
+
+# Kullanıcı başına bildirim akışı; kanal user id'sidir. Her olay güncel okunmamış
+# sayısını da taşır, böylece bildirim zili ayrıca sayım istemez.
+notification_events = EventBroker(settings.EVENT_QUEUE_SIZE)
+
+NOTIFICATION_FIELDS = (
+    "id", "user_id", "notification_type", "message", "is_read",
+    "created_at", "related_item_id", "related_item_type", "data",
+)
+
+def notification_event_data(notification) -> dict:
+    return {field: getattr(notification, field) for field in NOTIFICATION_FIELDS}
+
+async def get_unread_count(db: AsyncSession, user_id: int) -> Optional[int]:
+    result = await db.execute(select(User.unread_notification_count).where(User.id == user_id))
+    return result.scalar_one_or_none()
+
+# Commit'ten sonra çağrılır; kullanıcının açık akışı yoksa sayım sorgusu da yapılmaz
+async def publish_notification_event(db: AsyncSession, user_id: int, event_type: str, data) -> None:
+    if not notification_events.has_subscribers(user_id):
+        return
+    notification_events.publish(user_id, {
+        "type": event_type,
+        "user_id": user_id,
+        "unread_count": await get_unread_count(db, user_id),
+        "data": jsonable_encoder(data),
+    })
+
+# Bağlantı açılınca önce güncel okunmamış sayısı gönderilir
+def notification_event_stream(request: Request, user_id: int, unread_count: int) -> AsyncIterator[str]:
+    initial = [format_sse("unread_count", {"user_id": user_id, "unread_count": unread_count})]
+    return sse_stream(request, notification_events, user_id, initial)
@@ -0,0 +1,74 @@
+# services/notification_retention.py
+import asyncio
+import logging
+from datetime import timedelta
+from sqlalchemy import and_, delete, func, not_, or_, select
+from config import settings
+from core.background import register_job
+from database import async_session
+from models.notification import Notification
+
+logger = logging.getLogger(__name__)
+
+# Süresi dolan bildirimleri küçük partiler halinde siler. Her parti kendi kısa
+# transaction'ıdır ve aralarında beklenir; böylece tablo uzun süre kilitlenmez.
+# Partiler id sırasıyla ilerler (keyset), aynı satırlar tekrar taranmaz.
+# Sınırlar veritabanı saatiyle (now()) hesaplanır; zaman damgalarını yazan da veritabanı
+# olduğu için uygulama sunucusunun saati veya saat dilimi sonucu değiştirmez.
+
+def _expired_condition():
+    now = func.now()
+    retention = dict(settings.NOTIFICATION_RETENTION_DAYS)
+    default_days = retention.pop("default", None)
+    conditions = [
+        and_(Notification.notification_type == notification_type,
+             Notification.created_at < now - timedelta(days=days))
+        for notification_type, days in retention.items()
+    ]
+    if default_days is not None:
+        conditions.append(and_(
+            not_(Notification.notification_type.in_(list(retention))),
+            Notification.created_at < now - timedelta(days=default_days),
+        ))
+    conditions.append(and_(
+        Notification.is_read == True,
+        Notification.updated_at < now - timedelta(days=settings.NOTIFICATION_READ_RETENTION_DAYS),
+    ))
+    return or_(*conditions)
+
+async def purge_expired_notifications() -> dict:
+    expired = _expired_condition()
+    deleted, batches, last_id = 0, 0, 0
+    while True:
+        batch = (
+            select(Notification.id)
+            .where(Notification.id > last_id, expired)
+            .order_by(Notification.id)
+            .limit(settings.NOTIFICATION_RETENTION_BATCH_SIZE)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        async with async_session() as db:
+            result = await db.execute(
+                delete(Notification)
+                .where(Notification.id.in_(batch))
+                .returning(Notification.id)
+                .execution_options(synchronize_session=False)
+            )
+            ids = result.scalars().all()
+            await db.commit()
+        if not ids:
+            break
+        deleted += len(ids)
+        batches += 1
+        last_id = max(ids)
+        if len(ids) < settings.NOTIFICATION_RETENTION_BATCH_SIZE:
+            break
+        await asyncio.sleep(settings.NOTIFICATION_RETENTION_PAUSE_SECONDS)
+    if deleted:
+        logger.info("Purged %d expired notifications in %d batches", deleted, batches)
+    return {"deleted": deleted, "batches": batches}
+
+retention_job = register_job(
+    "notification_retention", settings.NOTIFICATION_RETENTION_INTERVAL_SECONDS, purge_expired_notifications
+)
@@ -0,0 +1,58 @@
+# services/ordering.py
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.lexorank import rank_between
+from models.column import Column
+from models.project_board import ProjectBoard
+from models.task import Task
+from services import rank_rebalance
+
+# Görev ve kolon sıraları `rank` (core/lexorank.py) ile tutulur. İstemci hâlâ 0 tabanlı
+# hedef sıra (position) gönderir; burada o sıradaki iki komşunun rank'i indeksten okunur
+# ve aralarına yeni bir rank üretilir. Diğer satırlara dokunulmaz.
+
+async def _rank_at(db: AsyncSession, query, rank_column, index: Optional[int]) -> str:
+    if index is not None:
+        result = await db.execute(query.order_by(rank_column).offset(max(index - 1, 0)).limit(2))
+        neighbours = result.scalars().all()
+        if index <= 0:
+            return rank_between(None, neighbours[0] if neighbours else None)
+        if neighbours:
+            return rank_between(neighbours[0], neighbours[1] if len(neighbours) > 1 else None)
+    # Sıra verilmediyse veya listenin dışındaysa sona ekle
+    result = await db.execute(query.order_by(rank_column.desc()).limit(1))
+    return rank_between(result.scalar_one_or_none(), None)
+
+# Kolonun satırını kilitler; aynı kolona eşzamanlı taşımalar ve yeniden dengeleme sıralanır
+async def lock_column(db: AsyncSession, column_id: int) -> bool:
+    result = await db.execute(select(Column.id).where(Column.id == column_id).with_for_update())
+    return result.scalar_one_or_none() is not None
+
+async def lock_board(db: AsyncSession, board_id: int) -> bool:
+    result = await db.execute(select(ProjectBoard.id).where(ProjectBoard.id == board_id).with_for_update())
+    return result.scalar_one_or_none() is not None
+
+# Kolonda `index` sırasına (None: sona) yerleşecek görev için rank
+async def task_rank_at(
+    db: AsyncSession, column_id: int, index: Optional[int] = None, exclude_task_id: Optional[int] = None
+) -> str:
+    await lock_column(db, column_id)
+    query = select(Task.rank).where(Task.column_id == column_id)
+    if exclude_task_id is not None:
+        query = query.where(Task.id != exclude_task_id)
+    rank = await _rank_at(db, query, Task.rank, index)
+    rank_rebalance.check_task_rank(column_id, rank)
+    return rank
+
+# Board'da `index` sırasına (None: sona) yerleşecek kolon için rank
+async def column_rank_at(
+    db: AsyncSession, board_id: int, index: Optional[int] = None, exclude_column_id: Optional[int] = None
+) -> str:
+    await lock_board(db, board_id)
+    query = select(Column.rank).where(Column.board_id == board_id)
+    if exclude_column_id is not None:
+        query = query.where(Column.id != exclude_column_id)
+    rank = await _rank_at(db, query, Column.rank, index)
+    rank_rebalance.check_column_rank(board_id, rank)
+    return rank
@@ -0,0 +1,179 @@
+# services/outbox.py
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Awaitable, Callable, Dict, Optional
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from config import settings
+from core.metrics import Histogram
+from database import async_session
+from models.outbox_event import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+# Transactional outbox: istek, yan etkiyi (bildirim, e-posta, webhook...) doğrudan yapmak
+# yerine iş değişikliğiyle aynı transaction'da outbox_events'e bir kayıt yazar. Arka plandaki
+# worker'lar kayıtları FOR UPDATE SKIP LOCKED ile partiler halinde alır ve konuya (topic)
+# kayıtlı handler'ı çalıştırır. Hata alan kayıt üstel bekleme ile tekrar denenir.
+#
+# Handler imzası: async def handler(db, payload) -> Optional[async def after_commit(db)]
+# Handler aynı session'da yazar; döndürdüğü fonksiyon parti commit edildikten sonra çağrılır
+# (örn. canlı akışa olay yayınlamak için).
+Handler = Callable[[AsyncSession, dict], Awaitable[Optional[Callable[[AsyncSession], Awaitable[None]]]]]
+_handlers: Dict[str, Handler] = {}
+
+def outbox_handler(topic: str):
+    def register(handler: Handler) -> Handler:
+        _handlers[topic] = handler
+        return handler
+    return register
+
+def enqueue(db: AsyncSession, topic: str, payload: dict) -> OutboxEvent:
+    outbox_event = OutboxEvent(topic=topic, payload=payload)
+    db.add(outbox_event)
+    db.sync_session.info["outbox_enqueued"] = True
+    return outbox_event
+
+def _backoff_seconds(attempts: int) -> float:
+    return min(settings.OUTBOX_BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), settings.OUTBOX_BACKOFF_MAX_SECONDS)
+
+class OutboxWorker:
+    def __init__(self, workers: int, batch_size: int, poll_seconds: float, max_attempts: int):
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.max_attempts = max_attempts
+        self._tasks = []
+        self._wakeup = None
+        self.processed = 0
+        self.retried = 0
+        self.failed = 0
+        # Kaydın yazılmasından işlenmesine kadar geçen süre (ms)
+        self.drain_lag_ms = Histogram([10, 50, 100, 250, 500, 1000, 5000, 30000, 300000])
+
+    def start(self) -> None:
+        self._wakeup = asyncio.Event()
+        for index in range(self.workers):
+            self._tasks.append(asyncio.create_task(self._loop(), name=f"outbox-worker-{index}"))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    # Yeni kayıt commit edildiğinde beklemekte olan worker'ları uyandırır
+    def wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                claimed = await self.drain_once()
+            except Exception:
+                logger.exception("Outbox drain failed")
+                claimed = 0
+            if claimed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+    # Bir partiyi işler; alınan kayıt sayısını döner
+    async def drain_once(self) -> int:
+        async with async_session() as db:
+            # Bekleme süresi veritabanı saatiyle (created_at ile aynı kaynak) ölçülür
+            result = await db.execute(
+                select(OutboxEvent, func.extract("epoch", func.now() - OutboxEvent.created_at).label("lag_seconds"))
+                .where(OutboxEvent.failed_at.is_(None), OutboxEvent.available_at <= func.now())
+                .order_by(OutboxEvent.available_at, OutboxEvent.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            rows = result.all()
+            if not rows:
+                return 0
+
+            done, callbacks = [], []
+            for outbox_event, lag_seconds in rows:
+                try:
+                    # Her kayıt kendi savepoint'inde; biri hata verirse diğerleri etkilenmez
+                    async with db.begin_nested():
+                        handler = _handlers.get(outbox_event.topic)
+                        if handler is None:
+                            raise LookupError(f"No outbox handler for topic '{outbox_event.topic}'")
+                        callback = await handler(db, outbox_event.payload)
+                except Exception as exc:
+                    outbox_event.attempts += 1
+                    outbox_event.last_error = repr(exc)[:2000]
+                    if outbox_event.attempts >= self.max_attempts:
+                        outbox_event.failed_at = func.now()
+                        self.failed += 1
+                        logger.error("Outbox event %s (%s) failed permanently: %r", outbox_event.id, outbox_event.topic, exc)
+                    else:
+                        outbox_event.available_at = func.now() + timedelta(seconds=_backoff_seconds(outbox_event.attempts))
+                        self.retried += 1
+                    continue
+                await db.delete(outbox_event)
+                done.append(float(lag_seconds))
+                if callback is not None:
+                    callbacks.append(callback)
+            await db.commit()
+
+            for lag_seconds in done:
+                self.drain_lag_ms.observe(lag_seconds * 1000)
+            self.processed += len(done)
+            for callback in callbacks:
+                try:
+                    await callback(db)
+                except Exception:
+                    logger.exception("Outbox after-commit callback failed")
+            return len(rows)
+
+    def stats(self) -> dict:
+        return {
+            "workers": len(self._tasks),
+            "batch_size": self.batch_size,
+            "processed": self.processed,
+            "retried": self.retried,
+            "failed": self.failed,
+            "drain_lag_ms": self.drain_lag_ms.snapshot(),
+        }
+
+outbox_worker = OutboxWorker(
+    settings.OUTBOX_WORKERS, settings.OUTBOX_BATCH_SIZE, settings.OUTBOX_POLL_SECONDS, settings.OUTBOX_MAX_ATTEMPTS
+)
+
+@event.listens_for(Session, "after_commit")
+def _wake_outbox_worker(session):
+    if session.info.pop("outbox_enqueued", False):
+        outbox_worker.wake()
+
+@event.listens_for(Session, "after_rollback")
+def _forget_outbox_enqueue(session):
+    session.info.pop("outbox_enqueued", None)
+
+# Kuyruk derinliği ve en eski bekleyen kaydın yaşı (drain lag)
+async def outbox_stats(db: AsyncSession) -> dict:
+    result = await db.execute(
+        select(
+            func.count().filter(OutboxEvent.failed_at.is_(None)),
+            func.count().filter(OutboxEvent.failed_at.is_not(None)),
+            func.extract("epoch", func.now() - func.min(OutboxEvent.created_at).filter(OutboxEvent.failed_at.is_(None))),
+        )
+    )
+    pending, failed, oldest_age = result.one()
+    return {
+        "pending": pending,
+        "failed": failed,
+        "oldest_pending_seconds": float(oldest_age) if oldest_age is not None else None,
+        **outbox_worker.stats(),
+    }
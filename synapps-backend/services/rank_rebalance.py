@@ -0,0 +1,92 @@
+# services/rank_rebalance.py
+import logging
+from sqlalchemy import Integer, String, column, select, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+from config import settings
+from core.background import register_job
+from core.lexorank import even_ranks
+from database import async_session
+from models.column import Column
+from models.project_board import ProjectBoard
+from models.task import Task
+from services.board_events import publish_board_event
+from services.board_version import bump_board_version
+
+logger = logging.getLogger(__name__)
+
+# Aynı iki komşu arasına defalarca ekleme yapılınca rank'ler uzar. Uzunluk
+# RANK_REBALANCE_LENGTH'i geçince ilgili kolon/board işaretlenir ve arka plan işi
+# sırayı bozmadan kısa, eşit aralıklı rank'leri tek UPDATE ile yeniden yazar.
+_pending_task_columns = set()
+_pending_column_boards = set()
+
+def check_task_rank(column_id: int, rank: str) -> None:
+    if len(rank) > settings.RANK_REBALANCE_LENGTH:
+        _pending_task_columns.add(column_id)
+
+def check_column_rank(board_id: int, rank: str) -> None:
+    if len(rank) > settings.RANK_REBALANCE_LENGTH:
+        _pending_column_boards.add(board_id)
+
+async def _rewrite_ranks(db: AsyncSession, model, ids) -> None:
+    if not ids:
+        return
+    new_ranks = values(column("id", Integer), column("rank", String), name="new_ranks").data(
+        list(zip(ids, even_ranks(len(ids))))
+    )
+    await db.execute(
+        update(model)
+        .where(model.id == new_ranks.c.id)
+        .values(rank=new_ranks.c.rank)
+        .execution_options(synchronize_session=False)
+    )
+
+# Kolonun/board'un tüm rank'leri değiştiği için istemcilere tek tek değil, tazelemeleri
+# için tek bir olay gönderilir. Yeniden dengeleme fonksiyonları (board_id, version) döner.
+async def rebalance_column_tasks(db: AsyncSession, column_id: int):
+    board_id = (await db.execute(
+        select(Column.board_id).where(Column.id == column_id).with_for_update()
+    )).scalar_one_or_none()
+    if board_id is None:
+        return None
+    ids = (await db.execute(
+        select(Task.id).where(Task.column_id == column_id).order_by(Task.rank, Task.id)
+    )).scalars().all()
+    await _rewrite_ranks(db, Task, ids)
+    return board_id, await bump_board_version(db, board_id)
+
+async def rebalance_board_columns(db: AsyncSession, board_id: int):
+    exists = (await db.execute(
+        select(ProjectBoard.id).where(ProjectBoard.id == board_id).with_for_update()
+    )).scalar_one_or_none()
+    if exists is None:
+        return None
+    ids = (await db.execute(
+        select(Column.id).where(Column.board_id == board_id).order_by(Column.rank, Column.id)
+    )).scalars().all()
+    await _rewrite_ranks(db, Column, ids)
+    return board_id, await bump_board_version(db, board_id)
+
+async def rebalance_pending() -> dict:
+    columns, boards = 0, 0
+    while _pending_task_columns:
+        column_id = _pending_task_columns.pop()
+        async with async_session() as db:
+            bumped = await rebalance_column_tasks(db, column_id)
+            await db.commit()
+        if bumped is not None:
+            publish_board_event(*bumped, "tasks.rebalanced", {"column_id": column_id})
+        columns += 1
+    while _pending_column_boards:
+        board_id = _pending_column_boards.pop()
+        async with async_session() as db:
+            bumped = await rebalance_board_columns(db, board_id)
+            await db.commit()
+        if bumped is not None:
+            publish_board_event(*bumped, "columns.rebalanced", {"board_id": board_id})
+        boards += 1
+    if columns or boards:
+        logger.info("Rebalanced task ranks in %d columns and column ranks in %d boards", columns, boards)
+    return {"columns": columns, "boards": boards}
+
+rebalance_job = register_job("rank_rebalance", settings.RANK_REBALANCE_INTERVAL_SECONDS, rebalance_pending)
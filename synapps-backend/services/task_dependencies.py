@@ -0,0 +1,205 @@
+# services/task_dependencies.py
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from fastapi import HTTPException
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from config import settings
+from models.column import Column
+from models.project_board import ProjectBoard
+from models.task import Task
+
+# Bağımlılık düzenlemelerini board başına serileştiren advisory lock'un ilk anahtarı (ikincisi
+# board id): aynı board'daki iki eşzamanlı güncelleme (A -> B ve B -> A) birbirinin zincirini
+# görmeden döngü oluşturamasın. Bağımlılıklar yalnızca aynı board içinde kurulabildiği için
+# farklı board'ların düzenlemeleri birbirini beklemez.
+DEPENDENCY_LOCK_KEY = 0x5EDA_0019
+
+# Board'un bağımlılık grafiği, board'un version değeriyle birlikte saklanır. Version
+# değiştiyse (görev eklendi/silindi/güncellendi) kayıt geçersizdir; açık invalidation gerekmez.
+class DependencyGraphCache:
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[int, tuple[int, dict]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, board_id: int, version: int) -> Optional[dict]:
+        entry = self._entries.get(board_id)
+        if entry is None or entry[0] != version:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(board_id)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, board_id: int, version: int, graph: dict) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[board_id] = (version, graph)
+        self._entries.move_to_end(board_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+dependency_graph_cache = DependencyGraphCache(settings.DEPENDENCY_GRAPH_CACHE_SIZE)
+
+NODE_FIELDS = ("id", "title", "column_id", "board_id", "status", "start_date", "end_date", "dependency_id")
+
+# Board'un görevleri ve board version'ı tek sorguda (version her satırla aynı snapshot'tan).
+# Grafikte yalnızca bu board'un görevleri bulunur; eski veride başka board'a işaret eden
+# bağımlılıkların hedefi düğüm olarak dönmez (çağıranın göremeyeceği görevler sızmaz).
+async def load_dependency_rows(db: AsyncSession, board_id: int) -> list:
+    return (await db.execute(
+        select(
+            Task.id, Task.title, Task.column_id, Column.board_id, Task.status,
+            Task.start_date, Task.end_date, Task.dependency_id, ProjectBoard.version.label("board_version"),
+        )
+        .join(Column, Column.id == Task.column_id)
+        .join(ProjectBoard, ProjectBoard.id == Column.board_id)
+        .where(Column.board_id == board_id)
+        .order_by(Task.id)
+    )).all()
+
+# Görev süresi (saniye); tarihlerden biri yoksa 0
+def task_duration(node: dict) -> float:
+    if node["start_date"] is None or node["end_date"] is None:
+        return 0.0
+    return max((node["end_date"] - node["start_date"]).total_seconds(), 0.0)
+
+# Her görevin tek bir bağımlılığı olduğu için graf bir orman; her düğümden bağımlılık
+# zinciri boyunca yürünerek döngüler bulunur (her düğüm bir kez ziyaret edilir).
+def find_cycles(nodes: Dict[int, dict]) -> List[List[int]]:
+    state: Dict[int, int] = {}  # 1: yol üzerinde, 2: bitti
+    cycles = []
+    for start in nodes:
+        path = []
+        node_id = start
+        while node_id in nodes and node_id not in state:
+            state[node_id] = 1
+            path.append(node_id)
+            node_id = nodes[node_id]["dependency_id"]
+        if node_id in nodes and state.get(node_id) == 1:
+            cycles.append(path[path.index(node_id):])
+        for visited in path:
+            state[visited] = 2
+    return cycles
+
+# Kritik yol: bağımlılık zinciri boyunca toplam süresi en uzun yol (kökten yaprağa).
+# finish[id] = süre(id) + finish[bağımlılık]; döngüdeki görevler hesaba katılmaz.
+def critical_path(nodes: Dict[int, dict], cyclic: set) -> tuple:
+    finish: Dict[int, float] = {}
+    for start in nodes:
+        chain = []
+        node_id = start
+        while node_id in nodes and node_id not in finish and node_id not in cyclic:
+            chain.append(node_id)
+            node_id = nodes[node_id]["dependency_id"]
+        base = finish.get(node_id, 0.0)
+        for chain_id in reversed(chain):
+            base += task_duration(nodes[chain_id])
+            finish[chain_id] = base
+    if not finish:
+        return [], 0.0
+    end_id = max(sorted(finish), key=lambda node_id: finish[node_id])
+    path = []
+    node_id = end_id
+    while node_id in finish:
+        path.append(node_id)
+        node_id = nodes[node_id]["dependency_id"]
+    return list(reversed(path)), finish[end_id]
+
+def build_dependency_graph(board_id: int, rows) -> dict:
+    nodes = {row.id: {field: getattr(row, field) for field in NODE_FIELDS} for row in rows}
+    cycles = find_cycles(nodes)
+    path, duration = critical_path(nodes, {node_id for cycle in cycles for node_id in cycle})
+    return {
+        "board_id": board_id,
+        "nodes": list(nodes.values()),
+        "critical_path": path,
+        "critical_path_seconds": duration,
+        "cycles": cycles,
+    }
+
+# Önbellekteki grafiğin version'ı tek sorguda kontrol edilir; değişmediyse grafik yeniden
+# yüklenmez. Board yoksa 404.
+async def get_dependency_graph(db: AsyncSession, board_id: int) -> dict:
+    version = (await db.execute(
+        select(ProjectBoard.version).where(ProjectBoard.id == board_id)
+    )).scalar_one_or_none()
+    if version is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+    graph = dependency_graph_cache.get(board_id, version)
+    if graph is not None:
+        return graph
+
+    rows = await load_dependency_rows(db, board_id)
+    graph = build_dependency_graph(board_id, rows)
+    dependency_graph_cache.set(board_id, rows[0].board_version if rows else version, graph)
+    return graph
+
+# Görev oluşturma/güncellemede: bağımlılık var mı, görevle aynı board'da mı ve task_id'yi
+# bağımlılığın zincirine eklemek döngü oluşturur mu? Zincir tek recursive CTE ile yürünür.
+# Kontrol ile commit arasında aynı board'da başka bir düzenleme araya girmesin diye board'a
+# özel, transaction'lık advisory lock alınır.
+async def check_task_dependency(db: AsyncSession, task_id: Optional[int], dependency_id: int, board_id: int) -> None:
+    if task_id is not None and dependency_id == task_id:
+        raise HTTPException(status_code=400, detail="A task cannot depend on itself")
+    await db.execute(select(func.pg_advisory_xact_lock(DEPENDENCY_LOCK_KEY, board_id)))
+
+    dependency_board_id = (await db.execute(
+        select(Column.board_id).join(Task, Task.column_id == Column.id).where(Task.id == dependency_id)
+    )).scalar_one_or_none()
+    if dependency_board_id is None:
+        raise HTTPException(status_code=404, detail="Dependency task not found")
+    if dependency_board_id != board_id:
+        raise HTTPException(status_code=400, detail="A task can only depend on tasks on the same board")
+
+    chain = (
+        select(Task.id, Task.dependency_id)
+        .where(Task.id == dependency_id)
+        .cte("dependency_chain", recursive=True)
+    )
+    chain = chain.union(select(Task.id, Task.dependency_id).join(chain, chain.c.dependency_id == Task.id))
+    cycle = (await db.execute(
+        select(func.coalesce(func.bool_or(chain.c.id == task_id), False)).select_from(chain)
+    )).scalar_one()
+    if cycle:
+        raise HTTPException(status_code=400, detail="Dependency would create a cycle")
+
+# Board değiştiren taşımalardan sonra: taşınan görevlerin başka board'daki görevlere ve başka
+# board'daki görevlerin taşınan görevlere olan bağımlılıkları tek UPDATE ile kaldırılır
+# (bağımlılıklar yalnızca aynı board içinde kurulabilir). {board_id: [bağımlılığı kaldırılan
+# görev id'leri]} döner.
+async def clear_cross_board_dependencies(db: AsyncSession, task_ids: List[int]) -> Dict[int, List[int]]:
+    dependency = aliased(Task)
+    task_column = aliased(Column)
+    dependency_column = aliased(Column)
+    result = await db.execute(
+        update(Task)
+        .where(
+            Task.column_id == task_column.id,
+            Task.dependency_id == dependency.id,
+            dependency.column_id == dependency_column.id,
+            task_column.board_id != dependency_column.board_id,
+            or_(Task.id.in_(task_ids), Task.dependency_id.in_(task_ids)),
+        )
+        .values(dependency_id=None)
+        .returning(Task.id, task_column.board_id)
+        .execution_options(synchronize_session=False)
+    )
+    cleared: Dict[int, List[int]] = {}
+    for task_id, board_id in result.all():
+        cleared.setdefault(board_id, []).append(task_id)
+    return cleared
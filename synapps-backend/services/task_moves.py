@@ -0,0 +1,115 @@
+# services/task_moves.py
+from typing import Dict, List, Tuple
+from fastapi import HTTPException
+from sqlalchemy import Integer, String, column, select, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.board_access import require_column_access
+from core.lexorank import rank_between
+from models.column import Column
+from models.user import User
+from models.task import Task
+from schemas.task import TaskMove
+from services.board_version import bump_board_version, bump_board_version_for_columns
+from services.ordering import lock_column
+from services.rank_rebalance import check_task_rank
+from services.task_dependencies import clear_cross_board_dependencies
+
+# Hedef kolonlardaki sıraya `index`'te (0 tabanlı) yerleşecek görevin rank'i; sıra dışındaysa sona
+def _rank_in_order(order: List[tuple], index: int) -> str:
+    if index <= 0:
+        return rank_between(None, order[0][1] if order else None)
+    if index >= len(order):
+        return rank_between(order[-1][1] if order else None, None)
+    return rank_between(order[index - 1][1], order[index][1])
+
+# Taşımaları tek transaction içinde, istek sırasıyla uygular. Hedef kolonların (id, rank)
+# sırası tek sorguda okunur; her taşıma bu sıradan çıkarılıp hedef sıraya yerleştirilir ve
+# komşuları arasına rank üretilir (ilk taşımalar sonrakilerin komşusu olabilir). Yalnızca
+# taşınan görevler tek bir UPDATE ... FROM (VALUES ...) ile yazılır; diğer görevlere dokunulmaz.
+# Taşınan görevlerin yeni (id, column_id, rank) listesini, board başına olay listelerini,
+# board başına bağımlılığı kaldırılan görevleri ve etkilenen board'ların yeni version'larını döner.
+async def apply_task_moves(
+    db: AsyncSession, moves: List[TaskMove], user: User
+) -> Tuple[List[dict], Dict[int, List[dict]], Dict[int, List[int]], Dict[int, int]]:
+    task_ids = [move.task_id for move in moves]
+    if len(set(task_ids)) != len(task_ids):
+        raise HTTPException(status_code=400, detail="Bir görev aynı istekte birden fazla kez taşınamaz")
+
+    result = await db.execute(select(Task.id, Task.column_id).where(Task.id.in_(task_ids)))
+    source_columns = dict(result.all())
+    missing = set(task_ids) - source_columns.keys()
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Görev bulunamadı: {sorted(missing)}")
+
+    target_ids = {move.column_id for move in moves}
+    affected_columns = target_ids | set(source_columns.values())
+    result = await db.execute(select(Column.id, Column.board_id).where(Column.id.in_(affected_columns)))
+    column_boards = dict(result.all())
+    missing = target_ids - column_boards.keys()
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Sütun bulunamadı: {sorted(missing)}")
+
+    # Kullanıcı hem kaynak hem hedef kolonların board'larına erişebilmeli
+    for column_id in affected_columns:
+        await require_column_access(db, user, column_id)
+
+    # Hedef kolonları her zaman aynı (id) sırayla kilitle; eşzamanlı toplu taşımalar kilitlenmesin
+    for column_id in sorted(target_ids):
+        await lock_column(db, column_id)
+
+    result = await db.execute(
+        select(Task.id, Task.column_id, Task.rank)
+        .where(Task.column_id.in_(target_ids))
+        .order_by(Task.column_id, Task.rank, Task.id)
+    )
+    orders: Dict[int, List[tuple]] = {column_id: [] for column_id in target_ids}
+    for task_id, column_id, rank in result.all():
+        orders[column_id].append((task_id, rank))
+
+    current_columns = dict(source_columns)
+    moved = []
+    for move in moves:
+        previous = orders.get(current_columns[move.task_id])
+        if previous is not None:
+            previous[:] = [entry for entry in previous if entry[0] != move.task_id]
+        order = orders[move.column_id]
+        index = max(0, min(move.position, len(order)))
+        rank = _rank_in_order(order, index)
+        check_task_rank(move.column_id, rank)
+        order.insert(index, (move.task_id, rank))
+        current_columns[move.task_id] = move.column_id
+        moved.append({"id": move.task_id, "column_id": move.column_id, "position": move.position, "rank": rank})
+
+    new_positions = values(
+        column("id", Integer), column("column_id", Integer), column("position", Integer), column("rank", String),
+        name="new_positions",
+    ).data([(row["id"], row["column_id"], row["position"], row["rank"]) for row in moved])
+    await db.execute(
+        update(Task)
+        .where(Task.id == new_positions.c.id)
+        .values(column_id=new_positions.c.column_id, position=new_positions.c.position, rank=new_positions.c.rank)
+        .execution_options(synchronize_session=False)
+    )
+    moved = [{"id": row["id"], "column_id": row["column_id"], "rank": row["rank"]} for row in moved]
+
+    # Her board yalnızca kendi görevlerini görür; başka board'a taşınan görev kaynak board'a
+    # column_id/rank boş olarak (board'dan çıktı) bildirilir
+    board_moves: Dict[int, List[dict]] = {}
+    for row in moved:
+        target_board = column_boards[row["column_id"]]
+        board_moves.setdefault(target_board, []).append(row)
+        source_board = column_boards.get(source_columns[row["id"]])
+        if source_board is not None and source_board != target_board:
+            board_moves.setdefault(source_board, []).append({"id": row["id"], "column_id": None, "rank": None})
+
+    # Board değiştiren görevlerin iki yöndeki board'lar arası bağımlılıkları kaldırılır
+    crossed = [
+        row["id"] for row in moved
+        if column_boards.get(source_columns[row["id"]]) != column_boards[row["column_id"]]
+    ]
+    cleared = await clear_cross_board_dependencies(db, crossed) if crossed else {}
+
+    versions = await bump_board_version_for_columns(db, *affected_columns)
+    for board_id in cleared.keys() - versions.keys():
+        versions[board_id] = await bump_board_version(db, board_id)
+    return moved, board_moves, cleared, versions
@@ -0,0 +1,52 @@
+# services/task_search.py
+from typing import List
+from fastapi import HTTPException
+from sqlalchemy import REAL, cast, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.pagination import Page
+from models.column import Column
+from models.task import SEARCH_CONFIG, Task
+
+# Başlık bütünüyle, açıklama eşleşmenin çevresindeki pencereyle vurgulanır
+TITLE_HIGHLIGHT_OPTIONS = "StartSel=<mark>, StopSel=</mark>, HighlightAll=true"
+DESCRIPTION_HIGHLIGHT_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15"
+
+# Sayfanın cursor'ına skor da yazılır; sıralama (score DESC, id DESC)
+def search_cursor_extra(row) -> dict:
+    return {"score": row.score}
+
+# Erişilebilen board'lardaki görevlerde tam metin arama sorgusu.
+# Eşleşme ve skor GIN indeksli search_vector üzerinden, ts_headline ise yalnızca
+# sayfaya giren satırlar için (dış sorguda) hesaplanır.
+def search_query(q: str, board_ids: List[int], page: Page):
+    tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    score = func.ts_rank(Task.search_vector, tsquery)
+    matches = (
+        select(
+            Task.id, Task.title, Task.description, Task.column_id, Task.status,
+            Column.board_id, score.label("score"),
+        )
+        .join(Column, Column.id == Task.column_id)
+        .where(Task.search_vector.op("@@")(tsquery), Column.board_id.in_(board_ids))
+    )
+    if page.after is not None:
+        try:
+            after_score = float(page.after["score"])
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        matches = matches.where(tuple_(score, Task.id) < tuple_(cast(after_score, REAL), page.after["id"]))
+    matches = matches.order_by(score.desc(), Task.id.desc()).limit(page.limit + 1).subquery()
+
+    return select(
+        matches.c.id, matches.c.title, matches.c.column_id, matches.c.board_id,
+        matches.c.status, matches.c.score,
+        func.ts_headline(SEARCH_CONFIG, matches.c.title, tsquery, TITLE_HIGHLIGHT_OPTIONS).label("title_highlight"),
+        func.ts_headline(
+            SEARCH_CONFIG, func.coalesce(matches.c.description, ""), tsquery, DESCRIPTION_HIGHLIGHT_OPTIONS
+        ).label("description_highlight"),
+    ).order_by(matches.c.score.desc(), matches.c.id.desc())
+
+async def search_tasks(db: AsyncSession, q: str, board_ids: List[int], page: Page) -> list:
+    if not board_ids:
+        return []
+    return (await db.execute(search_query(q, board_ids, page))).all()
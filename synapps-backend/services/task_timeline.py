@@ -0,0 +1,55 @@
+# services/task_timeline.py
+from datetime import datetime, timezone
+from fastapi import HTTPException
+from sqlalchemy import DateTime, cast, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.pagination import Page
+from models.column import Column
+from models.task import Task
+
+# Sayfanın cursor'ına görevin başlangıcı da yazılır; sıralama (başlangıç, id)
+def timeline_cursor_extra(row) -> dict:
+    return {"start": row.starts_at.isoformat()}
+
+# Kolonlar saat dilimsiz (timestamp); saat dilimli parametre UTC'ye çevrilir
+def _naive(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+# Board'da [window_start, window_end] penceresiyle çakışan tarihli görevlerin sorgusu. Çakışma
+# tasks.schedule üzerindeki GiST indeksiyle (ix_tasks_schedule) bulunur; yalnızca
+# zaman çizelgesinin çizdiği alanlar okunur.
+def timeline_query(board_id: int, window_start: datetime, window_end: datetime, page: Page):
+    starts_at = func.lower(Task.schedule)
+    window_start, window_end = _naive(window_start), _naive(window_end)
+    range_start = window_start
+    cursor = None
+    if page.after is not None:
+        try:
+            after_start = _naive(datetime.fromisoformat(page.after["start"]))
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        cursor = tuple_(starts_at, Task.id) > tuple_(cast(after_start, DateTime), page.after["id"])
+        # Cursor'dan sonraki görevler after_start'tan önce başlamaz; aralık taraması oradan
+        # başlar, böylece sonraki sayfalar pencerenin başındaki görevleri yeniden okumaz
+        range_start = min(max(window_start, after_start), window_end)
+    query = (
+        select(
+            Task.id, Task.title, Task.column_id, Task.status, Task.priority, Task.assigned_user_id,
+            Task.start_date, Task.end_date, Task.dependency_id, starts_at.label("starts_at"),
+        )
+        .join(Column, Column.id == Task.column_id)
+        .where(
+            Column.board_id == board_id,
+            Task.schedule.op("&&")(func.tsrange(range_start, window_end, "[]")),
+        )
+    )
+    if cursor is not None:
+        query = query.where(cursor)
+    return query.order_by(starts_at, Task.id).limit(page.limit + 1)
+
+async def load_timeline(
+    db: AsyncSession, board_id: int, window_start: datetime, window_end: datetime, page: Page
+) -> list:
+    return (await db.execute(timeline_query(board_id, window_start, window_end, page))).all()
@@ -0,0 +1,160 @@
+# services/user_deletion.py
+import uuid
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import delete, func, null, select, union, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from config import settings
+from core.board_access import board_access_cache
+from core.principal_cache import principal_cache
+from models.board_member import BoardMember
+from models.column import Column
+from models.notification import Notification
+from models.project_board import ProjectBoard
+from models.task import Task
+from models.user import User
+from models.user_deletion import UserDeletion
+from services.board_events import publish_board_event
+from services.board_version import bump_board_version_for_columns
+from services.outbox import enqueue, outbox_handler
+
+USER_DELETE = "user_delete"
+
+# Kullanıcı silme, ORM nesnesi yüklemeden toplu DELETE ile yapılır; board'ların kolonları,
+# görevleri ve üyelikleri ile kullanıcının bildirimleri, oturumları ve atandığı görevler
+# veritabanındaki ON DELETE CASCADE ile silinir.
+
+def _owned_task_ids():
+    return (
+        select(Task.id)
+        .join(Column, Column.id == Task.column_id)
+        .join(ProjectBoard, ProjectBoard.id == Column.board_id)
+    )
+
+# Silinecek satır sayısı USER_DELETE_SYNC_MAX_ROWS'u aşıyor mu? Her tablo en fazla
+# limit+1 satır sayılır; büyük hesaplarda da sorgu maliyeti sabittir.
+async def is_large_account(db: AsyncSession, user_id: int) -> bool:
+    limit = settings.USER_DELETE_SYNC_MAX_ROWS
+    bounded = [
+        _owned_task_ids().where(ProjectBoard.user_id == user_id).limit(limit + 1),
+        select(Task.id).where(Task.assigned_user_id == user_id).limit(limit + 1),
+        select(Notification.id).where(Notification.user_id == user_id).limit(limit + 1),
+    ]
+    counts = [select(func.count()).select_from(query.subquery()).scalar_subquery() for query in bounded]
+    total = (await db.execute(select(counts[0] + counts[1] + counts[2]))).scalar_one()
+    return total > limit
+
+# Kullanıcının üyesi olduğu veya görev atanmış olduğu, sahibi olmadığı board'lar: silme bu
+# board'ların üyelerini ve görevlerini de değiştirir. Version'lar DELETE'lerden önce (üyelikler
+# ve görevler henüz dururken) tek ifadeyle artırılır; {board_id: yeni version} döner.
+async def bump_affected_boards(db: AsyncSession, user_id: int) -> Dict[int, int]:
+    affected = union(
+        select(BoardMember.board_id).where(BoardMember.user_id == user_id),
+        select(Column.board_id).join(Task, Task.column_id == Column.id).where(Task.assigned_user_id == user_id),
+    ).subquery()
+    result = await db.execute(
+        update(ProjectBoard)
+        .where(ProjectBoard.id.in_(select(affected.c.board_id)), ProjectBoard.user_id != user_id)
+        .values(version=ProjectBoard.version + 1)
+        .returning(ProjectBoard.id, ProjectBoard.version)
+        .execution_options(synchronize_session=False)
+    )
+    return dict(result.all())
+
+# Kullanıcıyı ve sahip olduğu board'ları iki ifadeyle siler; silinen board id'lerini ve
+# etkilenen diğer board'ların yeni version'larını döner
+async def delete_user_rows(db: AsyncSession, user_id: int) -> Tuple[List[int], Dict[int, int]]:
+    versions = await bump_affected_boards(db, user_id)
+    board_ids = list((await db.execute(
+        delete(ProjectBoard).where(ProjectBoard.user_id == user_id).returning(ProjectBoard.id)
+        .execution_options(synchronize_session=False)
+    )).scalars())
+    await db.execute(delete(User).where(User.id == user_id).execution_options(synchronize_session=False))
+    return board_ids, versions
+
+# Commit'ten sonra: önbellekler temizlenir, etkilenen board'lara "user.deleted" yayınlanır
+# (istemciler kullanıcının üyeliğini ve ona atanmış görevleri düşürür)
+def forget_deleted_user(user_id: int, email: Optional[str], board_ids: List[int], versions: Dict[int, int]) -> None:
+    principal_cache.invalidate(user_id=user_id, email=email)
+    board_access_cache.invalidate(user_id)
+    for board_id in board_ids:
+        board_access_cache.invalidate_board(board_id)
+    for board_id, version in versions.items():
+        publish_board_event(board_id, version, "user.deleted", {"user_id": user_id})
+
+# Büyük hesap: takip kaydı ve outbox işi aynı transaction'da yazılır; aynı kullanıcı için
+# devam eden bir silme varsa o döner. Commit çağırana aittir.
+async def schedule_user_deletion(db: AsyncSession, user_id: int) -> UserDeletion:
+    result = await db.execute(select(UserDeletion).where(
+        UserDeletion.user_id == user_id, UserDeletion.status.in_(("pending", "running"))
+    ))
+    deletion = result.scalars().first()
+    if deletion is not None:
+        return deletion
+    deletion = UserDeletion(id=uuid.uuid4().hex, user_id=user_id, status="pending")
+    db.add(deletion)
+    enqueue(db, USER_DELETE, {"deletion_id": deletion.id, "user_id": user_id})
+    return deletion
+
+# Tek parça: önce görevler ve bildirimler USER_DELETE_BATCH_SIZE'lık DELETE'lerle silinir;
+# her parça outbox partisiyle commit edilir ve iş kendini yeniden kuyruğa koyar. Böylece
+# transaction'lar kısa kalır, ilerleme kalıcıdır ve tekrar denemede kalan yerden devam edilir.
+# Görev silinen board'ların version'ı aynı transaction'da artırılır ve commit'ten sonra
+# "tasks.deleted" yayınlanır. Silinecek görev/bildirim kalmayınca board'lar ve kullanıcı silinir.
+@outbox_handler(USER_DELETE)
+async def run_user_deletion(db: AsyncSession, payload: dict):
+    user_id = payload["user_id"]
+    batch_size = settings.USER_DELETE_BATCH_SIZE
+    deletion = await db.get(UserDeletion, payload["deletion_id"])
+    if deletion is None or deletion.status == "done":
+        return None
+
+    batches = [
+        (UserDeletion.tasks_deleted, Task, _owned_task_ids().where(ProjectBoard.user_id == user_id), Task.column_id),
+        (UserDeletion.tasks_deleted, Task, select(Task.id).where(Task.assigned_user_id == user_id), Task.column_id),
+        (UserDeletion.notifications_deleted, Notification, select(Notification.id).where(Notification.user_id == user_id), null()),
+    ]
+    for counter, model, ids, column_id in batches:
+        rows = (await db.execute(
+            delete(model).where(model.id.in_(ids.limit(batch_size))).returning(model.id, column_id)
+            .execution_options(synchronize_session=False)
+        )).all()
+        if rows:
+            await db.execute(
+                update(UserDeletion).where(UserDeletion.id == deletion.id)
+                .values({counter: counter + len(rows), "status": "running", "updated_at": func.now()})
+            )
+            enqueue(db, USER_DELETE, payload)
+            if model is not Task:
+                return None
+            return await _bump_deleted_task_boards(db, rows)
+
+    email = (await db.execute(select(User.email).where(User.id == user_id))).scalar_one_or_none()
+    board_ids, versions = await delete_user_rows(db, user_id)
+    await db.execute(
+        update(UserDeletion).where(UserDeletion.id == deletion.id)
+        .values(
+            boards_deleted=UserDeletion.boards_deleted + len(board_ids), status="done",
+            updated_at=func.now(), finished_at=func.now(),
+        )
+    )
+
+    async def forget(db: AsyncSession) -> None:
+        forget_deleted_user(user_id, email, board_ids, versions)
+    return forget
+
+# Silinen (id, column_id) satırlarının board'larının version'ını artırır; commit'ten sonra
+# her board'a kendi görev id'leriyle "tasks.deleted" yayınlayan callback'i döner
+async def _bump_deleted_task_boards(db: AsyncSession, rows):
+    column_ids = {column_id for _, column_id in rows}
+    column_boards = dict((await db.execute(
+        select(Column.id, Column.board_id).where(Column.id.in_(column_ids))
+    )).all())
+    versions = await bump_board_version_for_columns(db, *column_ids)
+    deleted: Dict[int, List[int]] = {}
+    for task_id, column_id in rows:
+        deleted.setdefault(column_boards[column_id], []).append(task_id)
+
+    async def publish(db: AsyncSession) -> None:
+        for board_id, version in versions.items():
+            publish_board_event(board_id, version, "tasks.deleted", {"ids": deleted[board_id]})
+    return publish
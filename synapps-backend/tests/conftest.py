@@ -0,0 +1,16 @@
+# tests/conftest.py
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DEBUG", "false")
+
+# Trigger'lar, GIN/GiST indeksleri ve planlar PostgreSQL ister; TEST_DATABASE_URL son
+# migration'a yükseltilmiş, atılabilir bir veritabanını göstermeli. Yoksa test atlanır.
+@pytest.fixture
+def database_url() -> str:
+    url = os.getenv("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    return url
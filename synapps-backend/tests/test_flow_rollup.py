@@ -0,0 +1,64 @@
+# tests/test_flow_rollup.py
+import asyncio
+import uuid
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from services.flow_metrics import rollup_flow_batch
+
+async def _rollup(engine) -> int:
+    processed = 0
+    while True:
+        async with AsyncSession(engine) as db:
+            count = await rollup_flow_batch(db)
+            await db.commit()
+        if not count:
+            return processed
+        processed += count
+
+async def _insert_task(connection, column_id: int, title: str) -> None:
+    await connection.execute(
+        text("INSERT INTO tasks (title, column_id, status, position, priority, rank) "
+             "VALUES (:title, :column_id, 'todo', 0, 'medium', 'V')"),
+        {"title": title, "column_id": column_id},
+    )
+
+# Uzun bir transaction'ın geçişi, ondan sonra başlayıp önce commit eden bir transaction'ınkinden
+# küçük id alır. Özet işi arada çalışsa da uzun transaction commit edince geçişi sayılmalı.
+def test_rollup_counts_transitions_committed_after_a_later_id(database_url):
+    async def scenario():
+        engine = create_async_engine(database_url)
+        async with engine.begin() as connection:
+            user_id = (await connection.execute(
+                text("INSERT INTO users (name, email, hashed_password) VALUES ('flow', :email, 'x') RETURNING id"),
+                {"email": f"{uuid.uuid4().hex}@example.com"},
+            )).scalar_one()
+            board_id = (await connection.execute(
+                text("INSERT INTO project_boards (name, user_id) VALUES ('flow', :user_id) RETURNING id"),
+                {"user_id": user_id},
+            )).scalar_one()
+            column_id = (await connection.execute(
+                text("INSERT INTO columns (title, board_id, position, rank) VALUES ('todo', :board_id, 0, 'V') RETURNING id"),
+                {"board_id": board_id},
+            )).scalar_one()
+        await _rollup(engine)
+
+        long_running = await engine.connect()
+        await long_running.begin()
+        await _insert_task(long_running, column_id, "long")
+        async with engine.begin() as connection:
+            await _insert_task(connection, column_id, "short")
+        await _rollup(engine)
+        await long_running.commit()
+        await long_running.close()
+        await _rollup(engine)
+
+        async with engine.connect() as connection:
+            entered = (await connection.execute(
+                text("SELECT coalesce(sum(entered), 0) FROM board_flow_daily "
+                     "WHERE board_id = :board_id AND status = 'todo'"),
+                {"board_id": board_id},
+            )).scalar_one()
+        await engine.dispose()
+        return entered
+
+    assert asyncio.run(scenario()) == 2
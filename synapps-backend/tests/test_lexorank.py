@@ -0,0 +1,83 @@
+# tests/test_lexorank.py
+import random
+from core.lexorank import DIGITS, even_ranks, rank_between
+
+# Özellik testleri sabit tohumlu rastgele girdilerle çalışır; hata tekrarlanabilir kalır
+SEED = 20250101
+
+def _valid(key: str) -> bool:
+    return bool(key) and all(c in DIGITS for c in key) and not key.endswith("0")
+
+def _random_key(rng: random.Random) -> str:
+    length = rng.randint(1, 6)
+    return "".join(rng.choice(DIGITS) for _ in range(length - 1)) + rng.choice(DIGITS[1:])
+
+def test_rank_between_falls_strictly_between_neighbours():
+    rng = random.Random(SEED)
+    for _ in range(20000):
+        a, b = sorted((_random_key(rng), _random_key(rng)))
+        if a == b:
+            continue
+        key = rank_between(a, b)
+        assert _valid(key) and a < key < b, (a, b, key)
+
+def test_rank_between_open_ends():
+    rng = random.Random(SEED)
+    assert _valid(rank_between(None, None))
+    for _ in range(20000):
+        key = _random_key(rng)
+        before, after = rank_between(None, key), rank_between(key, None)
+        assert _valid(before) and before < key, (key, before)
+        assert _valid(after) and after > key, (key, after)
+
+# Eşit komşular (eski veri veya eşzamanlı yazma): yeni anahtar komşunun hemen arkasına düşer
+def test_rank_between_equal_neighbours_sorts_after_them():
+    rng = random.Random(SEED)
+    for _ in range(5000):
+        key = _random_key(rng)
+        new = rank_between(key, key)
+        assert _valid(new) and new > key, (key, new)
+
+# Rastgele konumlara ekleme: liste her adımda sıralı ve tekil kalır
+def test_random_inserts_keep_keys_sorted_and_unique():
+    rng = random.Random(SEED)
+    keys = []
+    for _ in range(5000):
+        index = rng.randint(0, len(keys))
+        before = keys[index - 1] if index > 0 else None
+        after = keys[index] if index < len(keys) else None
+        keys.insert(index, rank_between(before, after))
+    assert all(_valid(key) for key in keys)
+    assert keys == sorted(set(keys))
+
+# En kötü durumlar: hep başa, hep sona, hep aynı aralığa ekleme
+def test_repeated_inserts_at_the_same_spot():
+    front, back, middle = ["V"], ["V"], ["1", "z"]
+    for _ in range(2000):
+        front.insert(0, rank_between(None, front[0]))
+        back.append(rank_between(back[-1], None))
+        middle.insert(1, rank_between(middle[0], middle[1]))
+    for keys in (front, back, middle):
+        assert all(_valid(key) for key in keys)
+        assert keys == sorted(set(keys))
+    # Sona/başa eklemede uzunluk logaritmik büyür (2.000 eklemede 1 -> 2 -> 4)
+    assert max(len(key) for key in back) <= 4
+    assert max(len(key) for key in front) <= 4
+
+def test_appending_a_large_import_keeps_keys_short():
+    rank, longest = "z", 1
+    for _ in range(100000):
+        following = rank_between(rank, None)
+        assert _valid(following) and following > rank, (rank, following)
+        rank, longest = following, max(longest, len(following))
+    assert longest <= 8
+
+def test_even_ranks_are_short_sorted_and_leave_room_at_both_ends():
+    for count in (1, 2, 3, 15, 16, 61, 62, 1000, 5000):
+        ranks = even_ranks(count)
+        assert len(ranks) == count
+        assert all(_valid(key) for key in ranks)
+        assert ranks == sorted(set(ranks))
+        assert len(max(ranks, key=len)) <= 4
+        assert rank_between(None, ranks[0]) < ranks[0]
+        assert rank_between(ranks[-1], None) > ranks[-1]
@@ -0,0 +1,144 @@
+# tests/test_query_plans.py
+import asyncio
+import json
+from datetime import datetime
+from sqlalchemy import select, text, union_all
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from core.pagination import Page, paginate
+from models.board_member import BoardMember
+from models.column import Column
+from models.notification import Notification
+from models.project_board import ProjectBoard
+from models.task import Task, TaskStatus
+from routers.notification import NOTIFICATION_RESPONSE_COLUMNS
+from services.board_snapshot import COLUMN_RESPONSE_COLUMNS, TASK_COLUMNS, TASK_RESPONSE_COLUMNS
+from services.task_search import search_query
+from services.task_timeline import timeline_query
+
+# Sıralı tarama yasak olan tablolar; küçük sabit tablolar (users, project_boards) planlayıcıya bırakılır
+INDEXED_TABLES = {"tasks", "columns", "notifications", "board_members"}
+# Tüm board'larda arama bütün kolonları okur; orada yalnızca tasks taraması yasak
+ALLOWED_SEQ_SCANS = {"task search": {"columns"}}
+PAGE = Page(100, None)
+
+# Her tablo planlayıcının indeksi seçeceği kadar büyük olmalı: 2.000 kullanıcı, 6.000 board,
+# 18.000 kolon, 72.000 görev, 100.000 bildirim, 12.000 üyelik. Hepsi geri alınan transaction'da kalır.
+SEED = [
+    "CREATE TEMP TABLE plan_users (n integer, id integer) ON COMMIT DROP",
+    "WITH inserted AS (INSERT INTO users (name, email, hashed_password) "
+    "SELECT 'plan', 'plan-' || g || '-' || md5(random()::text) || '@example.com', 'x' "
+    "FROM generate_series(1, 2000) g RETURNING id) "
+    "INSERT INTO plan_users SELECT row_number() OVER (ORDER BY id), id FROM inserted",
+    "INSERT INTO project_boards (name, user_id) SELECT 'plan', u.id FROM plan_users u, generate_series(1, 3)",
+    "INSERT INTO board_members (board_id, user_id, role) "
+    "SELECT b.id, b.user_id, 'OWNER' FROM project_boards b JOIN plan_users u ON u.id = b.user_id",
+    "INSERT INTO board_members (board_id, user_id, role) "
+    "SELECT b.id, other.id, 'MEMBER' FROM project_boards b JOIN plan_users u ON u.id = b.user_id "
+    "JOIN plan_users other ON other.n = u.n % 2000 + 1",
+    "INSERT INTO columns (title, board_id, position, rank) "
+    "SELECT 'plan', b.id, g - 1, chr(64 + g) FROM project_boards b JOIN plan_users u ON u.id = b.user_id, "
+    "generate_series(1, 3) g",
+    "INSERT INTO tasks (title, description, column_id, status, position, priority, rank, assigned_user_id, "
+    "start_date, end_date) "
+    "SELECT 'plan task ' || c.id || '-' || g, CASE WHEN c.id % 500 = 0 THEN 'seeded needle' ELSE 'seeded' END, c.id, "
+    "(ARRAY['todo', 'in_progress', 'review', 'done'])[g]::task_status, g - 1, 'medium', chr(64 + g), "
+    "CASE WHEN g = 1 THEN b.user_id END, "
+    "timestamp '2025-01-01' + (c.id % 365) * interval '1 day', timestamp '2025-01-01' + (c.id % 365 + g) * interval '1 day' "
+    "FROM columns c JOIN project_boards b ON b.id = c.board_id JOIN plan_users u ON u.id = b.user_id, "
+    "generate_series(1, 4) g",
+    "INSERT INTO notifications (user_id, notification_type, message, is_read) "
+    "SELECT u.id, 'default', 'plan', g % 3 = 0 FROM plan_users u, generate_series(1, 50) g",
+    "ANALYZE users", "ANALYZE project_boards", "ANALYZE board_members", "ANALYZE columns",
+    "ANALYZE tasks", "ANALYZE notifications",
+]
+
+# Router'ların ve servislerin sıcak sorgularıyla aynı şekilde kurulur. Arama, çok sayıda board'a
+# erişen bir kullanıcı gibi tüm board'larda yapılır; böylece kolon indeksi değil GIN indeksi gerekir.
+def _hot_queries(user_id: int, board_id: int, column_id: int, board_ids: list) -> dict:
+    board_tasks = select(*TASK_RESPONSE_COLUMNS).join(Column, Column.id == Task.column_id)
+    return {
+        "tasks by column": paginate(select(*TASK_RESPONSE_COLUMNS).where(Task.column_id == column_id), Task.id, PAGE),
+        "tasks by boards": paginate(board_tasks.where(Column.board_id.in_([board_id])), Task.id, PAGE),
+        "tasks by assignee": paginate(
+            select(*TASK_RESPONSE_COLUMNS).where(Task.assigned_user_id == user_id), Task.id, PAGE
+        ),
+        "tasks by status": paginate(
+            board_tasks.where(Task.status == TaskStatus.todo, Column.board_id == board_id), Task.id, PAGE
+        ),
+        "notifications": paginate(
+            select(*NOTIFICATION_RESPONSE_COLUMNS).where(Notification.user_id == user_id),
+            Notification.id, PAGE, descending=True,
+        ),
+        "unread notifications": paginate(
+            select(*NOTIFICATION_RESPONSE_COLUMNS).where(
+                Notification.user_id == user_id, Notification.is_read == False
+            ),
+            Notification.id, PAGE, descending=True,
+        ),
+        "board roles": union_all(
+            select(ProjectBoard.id).where(ProjectBoard.user_id == user_id),
+            select(BoardMember.board_id).where(BoardMember.user_id == user_id),
+        ),
+        "board members": paginate(select(BoardMember).where(BoardMember.board_id == board_id), BoardMember.id, PAGE),
+        "board columns": select(*COLUMN_RESPONSE_COLUMNS).where(Column.board_id == board_id).order_by(Column.rank, Column.id),
+        "board snapshot tasks": select(*TASK_COLUMNS)
+            .join(Column, Column.id == Task.column_id)
+            .where(Column.board_id == board_id)
+            .order_by(Task.column_id, Task.rank, Task.id),
+        "task search": search_query("needle", board_ids, PAGE),
+        "board timeline": timeline_query(board_id, datetime(2025, 3, 1), datetime(2025, 3, 31), PAGE),
+    }
+
+# Sorgu, parametreleri uygulamadaki gibi sürücüye bağlanarak EXPLAIN edilir
+class Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+def _seq_scans(node: dict) -> list:
+    found = []
+    if node["Node Type"] == "Seq Scan" and node.get("Relation Name") in INDEXED_TABLES:
+        found.append(node["Relation Name"])
+    for child in node.get("Plans", []):
+        found.extend(_seq_scans(child))
+    return found
+
+async def _explain(connection, query) -> dict:
+    plan = (await connection.execute(Explain(query))).scalar_one()
+    return (json.loads(plan) if isinstance(plan, str) else plan)[0]["Plan"]
+
+# Her sıcak sorgunun planında indeksli tablolar üzerinde sıralı tarama olmamalı
+def test_hot_queries_use_indexes(database_url):
+    async def scenario():
+        engine = create_async_engine(database_url)
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            for statement in SEED:
+                await connection.execute(text(statement))
+            user_id, board_id, column_id = (await connection.execute(text(
+                "SELECT u.id, b.id, c.id FROM plan_users u JOIN project_boards b ON b.user_id = u.id "
+                "JOIN columns c ON c.board_id = b.id WHERE u.n = 1000 ORDER BY b.id, c.id LIMIT 1"
+            ))).one()
+            board_ids = (await connection.execute(text(
+                "SELECT b.id FROM project_boards b JOIN plan_users u ON u.id = b.user_id"
+            ))).scalars().all()
+            offenders = {}
+            for name, query in _hot_queries(user_id, board_id, column_id, board_ids).items():
+                scans = [
+                    table for table in _seq_scans(await _explain(connection, query))
+                    if table not in ALLOWED_SEQ_SCANS.get(name, ())
+                ]
+                if scans:
+                    offenders[name] = scans
+            await transaction.rollback()
+        await engine.dispose()
+        return offenders
+
+    assert asyncio.run(scenario()) == {}
@@ -0,0 +1,40 @@
+# tests/test_read_your_writes.py
+import asyncio
+from sqlalchemy import Column, Integer, MetaData, Table, insert, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+import database
+
+metadata = MetaData()
+items = Table("items", metadata, Column("id", Integer, primary_key=True), Column("value", Integer))
+
+# Replika tanımlıymış gibi davranıp, commit sonrası istemcinin primary'e sabitlenip sabitlenmediğine bakar
+def _run(statement, monkeypatch) -> bool:
+    monkeypatch.setattr(database, "read_engine", object())
+    monkeypatch.setattr(database, "_primary_pins", {})
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(metadata.create_all)
+            await connection.execute(insert(items).values(id=1, value=0))
+        async with AsyncSession(engine) as session:
+            session.info["client_key"] = "client"
+            await session.execute(statement)
+            await session.commit()
+        await engine.dispose()
+
+    asyncio.run(scenario())
+    return database.is_pinned_to_primary("client")
+
+def test_core_update_pins_writer(monkeypatch):
+    assert _run(update(items).where(items.c.id == 1).values(value=2), monkeypatch)
+
+# SQLite veri değiştiren CTE çalıştıramadığı için yalnızca sınıflandırma kontrol edilir
+def test_select_with_dml_cte_counts_as_write():
+    inserted = insert(items).values(id=2, value=1).returning(items.c.id).cte("inserted")
+    assert database._writes_data(select(inserted.c.id))
+    assert database._writes_data(select(literal(1)).add_cte(inserted))
+    assert not database._writes_data(select(items.c.id))
+
+def test_plain_select_does_not_pin(monkeypatch):
+    assert not _run(select(items.c.id), monkeypatch)